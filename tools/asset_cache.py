@@ -0,0 +1,277 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Local cache of downloaded assets for smoke testing models.
+
+Downloaded assets are stored under the SHA-256 digest of their content in
+CACHE_DIR/blobs. CACHE_DIR/index.json maps each URL to the digest of its last
+download together with the ETag and Last-Modified headers of the response so
+that a cached asset is revalidated with a single conditional request. Once the
+cache grows beyond its size limit, the least recently used assets are evicted.
+
+The index also stores a verdict per digest, which is the result of smoke
+testing the content with a given version of the smoke test. Smoke testing an
+unchanged asset again with the same version therefore neither downloads nor
+parses it. Verdicts of other versions are ignored and verdicts of evicted
+assets are deleted.
+
+The cache can be shared by threads. The index is written atomically after each
+download, after every _SAVE_BATCH_SIZE other changes and by save(), which
+callers invoke at the end of a run. Processes sharing a cache directory
+therefore do not corrupt it but may drop each other's most recent entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+import urllib.error
+import urllib.request
+
+from absl import logging
+import attr
+
+DEFAULT_MAX_SIZE_BYTES = 10 * 1024**3
+_INDEX_FILE_NAME = "index.json"
+_BLOBS_DIR = "blobs"
+_CHUNK_SIZE_BYTES = 1024**2
+_HTTP_NOT_MODIFIED = 304
+# Number of verdicts and revalidations after which the index is written even if
+# save() was not called yet.
+_SAVE_BATCH_SIZE = 50
+
+_ENTRIES = "entries"
+_VERDICTS = "verdicts"
+_CLOCK = "clock"
+_DIGEST = "digest"
+_ETAG = "etag"
+_LAST_MODIFIED = "last_modified"
+_SIZE = "size"
+_LAST_USED = "last_used"
+_VERSION = "version"
+_ERROR = "error"
+
+
+@attr.s(auto_attribs=True)
+class CachedAsset:
+  """A downloaded asset stored in the cache.
+
+  Attributes:
+    url: URL from which the asset was downloaded.
+    path: Local path to the content of the asset.
+    digest: SHA-256 hex digest of the content.
+    revalidated: True if the server confirmed that the cached content is
+      unchanged so that it was not downloaded again.
+  """
+  url: str
+  path: str
+  digest: str
+  revalidated: bool
+
+
+class AssetCache:
+  """Size-bounded LRU cache of downloaded assets and smoke test results."""
+
+  def __init__(self,
+               cache_dir: str,
+               max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+               verdict_version: str = "") -> None:
+    """Loads the index of the cache and creates the cache dir if needed.
+
+    Args:
+      cache_dir: Local directory storing the downloaded assets.
+      max_size_bytes: Total size of all assets after which the least recently
+        used assets are deleted. The most recently downloaded asset is always
+        kept even if it exceeds the limit on its own.
+      verdict_version: Version of the smoke test, e.g. a hash of its code.
+        Verdicts recorded with another version are ignored and replaced.
+    """
+    self._cache_dir = cache_dir
+    self._max_size_bytes = max_size_bytes
+    self._verdict_version = verdict_version
+    self._index_path = os.path.join(cache_dir, _INDEX_FILE_NAME)
+    os.makedirs(os.path.join(cache_dir, _BLOBS_DIR), exist_ok=True)
+    self._entries: Dict[str, Dict[str, Any]] = dict()
+    self._verdicts: Dict[str, Dict[str, str]] = dict()
+    self._clock = 0
+    self._unsaved_changes = 0
+    self._lock = threading.Lock()
+    self._load_index()
+
+  def _load_index(self) -> None:
+    if not os.path.exists(self._index_path):
+      return
+    try:
+      with open(self._index_path) as f:
+        index = json.load(f)
+    except (OSError, ValueError) as e:
+      logging.warning("Ignoring unreadable asset cache index %s: %s",
+                      self._index_path, e)
+      return
+    self._entries = dict(index.get(_ENTRIES, {}))
+    # Verdicts without a version were recorded before verdicts were
+    # versioned.
+    self._verdicts = {
+        digest: verdict
+        for digest, verdict in index.get(_VERDICTS, {}).items()
+        if isinstance(verdict, dict)
+    }
+    self._clock = index.get(_CLOCK, 0)
+
+  def _save_index(self) -> None:
+    temp_path = f"{self._index_path}.tmp"
+    with open(temp_path, "w") as f:
+      json.dump(
+          {
+              _ENTRIES: self._entries,
+              _VERDICTS: self._verdicts,
+              _CLOCK: self._clock
+          }, f)
+    os.replace(temp_path, self._index_path)
+    self._unsaved_changes = 0
+
+  def _record_change(self) -> None:
+    """Writes the index once enough changes have not been written yet."""
+    self._unsaved_changes += 1
+    if self._unsaved_changes >= _SAVE_BATCH_SIZE:
+      self._save_index()
+
+  def save(self) -> None:
+    """Writes the changes to the index that were not written yet."""
+    with self._lock:
+      if self._unsaved_changes:
+        self._save_index()
+
+  def _get_blob_path(self, digest: str) -> str:
+    return os.path.join(self._cache_dir, _BLOBS_DIR, digest)
+
+  def _touch(self, url: str) -> None:
+    self._clock += 1
+    self._entries[url][_LAST_USED] = self._clock
+
+  def fetch(self, url: str) -> CachedAsset:
+    """Returns the asset at `url` and downloads it only if it changed.
+
+    Args:
+      url: URL of the asset.
+
+    Returns:
+      The cached asset, whose content can be read from `path`.
+
+    Raises:
+      urllib.error.URLError: if the asset cannot be downloaded.
+    """
+    with self._lock:
+      entry = self._entries.get(url)
+      if entry and not os.path.exists(self._get_blob_path(entry[_DIGEST])):
+        entry = None
+    request = urllib.request.Request(url)
+    if entry and entry.get(_ETAG):
+      request.add_header("If-None-Match", entry[_ETAG])
+    if entry and entry.get(_LAST_MODIFIED):
+      request.add_header("If-Modified-Since", entry[_LAST_MODIFIED])
+    try:
+      with urllib.request.urlopen(request) as response:
+        digest, size = self._store_blob(response)
+        headers = response.headers
+    except urllib.error.HTTPError as e:
+      if not entry or e.code != _HTTP_NOT_MODIFIED:
+        raise
+      logging.info("Using cached asset for %s since it is unchanged.", url)
+      with self._lock:
+        if url in self._entries:
+          self._touch(url)
+          self._record_change()
+      return CachedAsset(url, self._get_blob_path(entry[_DIGEST]),
+                         entry[_DIGEST], revalidated=True)
+
+    with self._lock:
+      self._entries[url] = {
+          _DIGEST: digest,
+          _ETAG: headers.get("ETag"),
+          _LAST_MODIFIED: headers.get("Last-Modified"),
+          _SIZE: size,
+      }
+      self._touch(url)
+      self._evict()
+      self._save_index()
+    return CachedAsset(url, self._get_blob_path(digest), digest,
+                       revalidated=False)
+
+  def _store_blob(self, response) -> Tuple[str, int]:
+    """Streams a response into the blob store and returns (digest, size)."""
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(
+        dir=self._cache_dir, suffix=".download", delete=False) as f:
+      try:
+        for chunk in iter(lambda: response.read(_CHUNK_SIZE_BYTES), b""):
+          digest.update(chunk)
+          f.write(chunk)
+          size += len(chunk)
+      except BaseException:
+        f.close()
+        os.remove(f.name)
+        raise
+    os.replace(f.name, self._get_blob_path(digest.hexdigest()))
+    return digest.hexdigest(), size
+
+  def _evict(self) -> None:
+    """Deletes the least recently used assets until the size limit is met."""
+    size_by_digest = {
+        entry[_DIGEST]: entry[_SIZE] for entry in self._entries.values()
+    }
+    total_size = sum(size_by_digest.values())
+    urls_by_age = sorted(
+        self._entries, key=lambda url: self._entries[url][_LAST_USED])
+    for url in urls_by_age[:-1]:
+      if total_size <= self._max_size_bytes:
+        break
+      digest = self._entries.pop(url)[_DIGEST]
+      if any(entry[_DIGEST] == digest for entry in self._entries.values()):
+        continue
+      logging.info("Evicting cached asset %s.", url)
+      total_size -= size_by_digest[digest]
+      os.remove(self._get_blob_path(digest))
+      self._verdicts.pop(digest, None)
+
+  def get_verdict(self, digest: str) -> Optional[str]:
+    """Returns the smoke test verdict for content with the given digest.
+
+    Args:
+      digest: SHA-256 hex digest of an asset.
+
+    Returns:
+      None if the content was not smoke tested yet with the version of this
+      cache, an empty string if it passed or the error message if it failed.
+    """
+    with self._lock:
+      verdict = self._verdicts.get(digest)
+    if verdict is None or verdict[_VERSION] != self._verdict_version:
+      return None
+    return verdict[_ERROR]
+
+  def set_verdict(self, digest: str, error_message: str = "") -> None:
+    """Records the smoke test verdict, an error message if the test failed.
+
+    The verdict is written to the index in a batch or by save().
+    """
+    with self._lock:
+      self._verdicts[digest] = {
+          _VERSION: self._verdict_version,
+          _ERROR: error_message
+      }
+      self._record_change()
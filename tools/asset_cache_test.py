@@ -0,0 +1,178 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.asset_cache."""
+
+import hashlib
+import http.server
+import os
+import threading
+from typing import Dict, List
+import urllib.error
+
+import tensorflow as tf
+import asset_cache
+
+
+class _AssetRequestHandler(http.server.BaseHTTPRequestHandler):
+  """Serves the assets of an _AssetServer and answers conditional requests."""
+
+  def do_GET(self):  # pylint: disable=invalid-name
+    content = self.server.assets.get(self.path)
+    if content is None:
+      self.send_error(404)
+      return
+    etag = '"%s"' % hashlib.md5(content).hexdigest()
+    if self.headers.get("If-None-Match") == etag:
+      self.server.requests.append((self.path, 304))
+      self.send_response(304)
+      self.end_headers()
+      return
+    self.server.requests.append((self.path, 200))
+    self.send_response(200)
+    self.send_header("ETag", etag)
+    self.send_header("Content-Length", str(len(content)))
+    self.end_headers()
+    self.wfile.write(content)
+
+  def log_message(self, *args):
+    del args  # Unused.
+
+
+class _AssetServer(http.server.HTTPServer):
+
+  def __init__(self):
+    super().__init__(("localhost", 0), _AssetRequestHandler)
+    self.assets: Dict[str, bytes] = dict()
+    self.requests: List[tuple] = list()
+
+  def get_url(self, path: str) -> str:
+    return f"http://localhost:{self.server_port}{path}"
+
+
+class AssetCacheTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.cache_dir = self.create_tempdir().full_path
+    self.server = _AssetServer()
+    thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    thread.start()
+    self.addCleanup(self.server.server_close)
+    self.addCleanup(self.server.shutdown)
+
+  def test_fetch_downloads_asset(self):
+    self.server.assets["/model.tar.gz"] = b"model"
+    cache = asset_cache.AssetCache(self.cache_dir)
+
+    asset = cache.fetch(self.server.get_url("/model.tar.gz"))
+
+    self.assertFalse(asset.revalidated)
+    self.assertEqual(asset.digest, hashlib.sha256(b"model").hexdigest())
+    with open(asset.path, "rb") as f:
+      self.assertEqual(f.read(), b"model")
+
+  def test_unchanged_asset_is_revalidated_without_download(self):
+    self.server.assets["/model.tar.gz"] = b"model"
+    url = self.server.get_url("/model.tar.gz")
+    first_asset = asset_cache.AssetCache(self.cache_dir).fetch(url)
+
+    asset = asset_cache.AssetCache(self.cache_dir).fetch(url)
+
+    self.assertTrue(asset.revalidated)
+    self.assertEqual(asset.digest, first_asset.digest)
+    self.assertEqual(self.server.requests, [("/model.tar.gz", 200),
+                                            ("/model.tar.gz", 304)])
+
+  def test_changed_asset_is_downloaded_again(self):
+    self.server.assets["/model.tar.gz"] = b"model"
+    url = self.server.get_url("/model.tar.gz")
+    cache = asset_cache.AssetCache(self.cache_dir)
+    first_asset = cache.fetch(url)
+    self.server.assets["/model.tar.gz"] = b"new model"
+
+    asset = cache.fetch(url)
+
+    self.assertFalse(asset.revalidated)
+    self.assertNotEqual(asset.digest, first_asset.digest)
+
+  def test_missing_asset_raises_error(self):
+    cache = asset_cache.AssetCache(self.cache_dir)
+
+    with self.assertRaises(urllib.error.HTTPError):
+      cache.fetch(self.server.get_url("/missing.tar.gz"))
+
+  def test_least_recently_used_asset_is_evicted(self):
+    for name in ("a", "b", "c"):
+      self.server.assets[f"/{name}.tar.gz"] = name.encode() * 10
+    cache = asset_cache.AssetCache(self.cache_dir, max_size_bytes=20)
+    asset_a = cache.fetch(self.server.get_url("/a.tar.gz"))
+    asset_b = cache.fetch(self.server.get_url("/b.tar.gz"))
+    cache.fetch(self.server.get_url("/a.tar.gz"))
+
+    asset_c = cache.fetch(self.server.get_url("/c.tar.gz"))
+
+    self.assertTrue(os.path.exists(asset_a.path))
+    self.assertFalse(os.path.exists(asset_b.path))
+    self.assertTrue(os.path.exists(asset_c.path))
+
+  def test_verdicts_are_persisted(self):
+    cache = asset_cache.AssetCache(self.cache_dir)
+    cache.set_verdict("digest1")
+    cache.set_verdict("digest2", "Could not read tarfile.")
+    self.assertIsNone(
+        asset_cache.AssetCache(self.cache_dir).get_verdict("digest1"))
+
+    cache.save()
+    loaded_cache = asset_cache.AssetCache(self.cache_dir)
+
+    self.assertEqual(loaded_cache.get_verdict("digest1"), "")
+    self.assertEqual(
+        loaded_cache.get_verdict("digest2"), "Could not read tarfile.")
+    self.assertIsNone(loaded_cache.get_verdict("digest3"))
+
+  def test_verdicts_are_saved_in_batches(self):
+    cache = asset_cache.AssetCache(self.cache_dir)
+    for i in range(asset_cache._SAVE_BATCH_SIZE):
+      cache.set_verdict(f"digest{i}")
+
+    loaded_cache = asset_cache.AssetCache(self.cache_dir)
+
+    self.assertEqual(loaded_cache.get_verdict("digest0"), "")
+
+  def test_verdicts_of_other_versions_are_ignored(self):
+    cache = asset_cache.AssetCache(self.cache_dir, verdict_version="1")
+    cache.set_verdict("digest1", "Could not read tarfile.")
+    cache.save()
+
+    loaded_cache = asset_cache.AssetCache(self.cache_dir, verdict_version="2")
+
+    self.assertIsNone(loaded_cache.get_verdict("digest1"))
+    loaded_cache.set_verdict("digest1")
+    self.assertEqual(loaded_cache.get_verdict("digest1"), "")
+
+  def test_verdicts_of_evicted_assets_are_deleted(self):
+    for name in ("a", "b"):
+      self.server.assets[f"/{name}.tar.gz"] = name.encode() * 10
+    cache = asset_cache.AssetCache(self.cache_dir, max_size_bytes=10)
+    asset_a = cache.fetch(self.server.get_url("/a.tar.gz"))
+    cache.set_verdict(asset_a.digest)
+
+    cache.fetch(self.server.get_url("/b.tar.gz"))
+
+    self.assertIsNone(cache.get_verdict(asset_a.digest))
+
+
+if __name__ == "__main__":
+  tf.test.main()
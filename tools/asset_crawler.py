@@ -0,0 +1,258 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Crawler that smoke tests the asset-path of every cataloged model.
+
+The outcome of each smoke test is appended to a JSON Lines journal as soon as
+it is known. Assets that were checked less than `recheck_after_seconds` ago are
+skipped, so an interrupted crawl resumes where it stopped, and the remaining
+assets are checked in the order of their last check, oldest first.
+"""
+
+from concurrent import futures
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from absl import logging
+import asset_cache as asset_cache_lib
+import attr
+import catalog as catalog_lib
+import rate_limiter as rate_limiter_lib
+import validator
+
+DEFAULT_RECHECK_AFTER_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_REQUESTS_PER_SECOND_PER_HOST = 1.0
+DEFAULT_REQUEST_BURST_PER_HOST = 4
+
+
+@attr.s(auto_attribs=True)
+class JournalRecord:
+  """Outcome of smoke testing one asset.
+
+  Attributes:
+    asset_path: URL of the asset.
+    file_path: Path of a documentation file with this asset-path relative to
+      the `assets/docs` directory.
+    checked_at: Time of the check in seconds since the epoch.
+    error: The error message if the smoke test failed, None otherwise.
+  """
+  asset_path: str
+  file_path: str
+  checked_at: float
+  error: Optional[str] = None
+
+
+class CrawlJournal:
+  """Append-only JSON Lines file with the latest check of each asset."""
+
+  def __init__(self, path: str) -> None:
+    """Loads the records of previous crawls and opens the journal.
+
+    Records of the same asset replace earlier ones. The journal is rewritten
+    with only the latest records before new records are appended.
+
+    Args:
+      path: Local path to the journal, which is created if it does not exist.
+    """
+    self._path = path
+    self._lock = threading.Lock()
+    self._record_by_asset_path: Dict[str, JournalRecord] = dict()
+    if os.path.exists(path):
+      with open(path) as f:
+        for line in f:
+          try:
+            record = JournalRecord(**json.loads(line))
+          except (ValueError, TypeError):
+            # A crawl that was killed while writing leaves a partial line.
+            logging.warning("Ignoring malformed journal line %r.", line)
+            continue
+          self._record_by_asset_path[record.asset_path] = record
+    self._compact()
+    self._file = open(path, "a")
+
+  def _compact(self) -> None:
+    temp_path = f"{self._path}.tmp"
+    with open(temp_path, "w") as f:
+      for record in self._record_by_asset_path.values():
+        f.write(json.dumps(attr.asdict(record)) + "\n")
+    os.replace(temp_path, self._path)
+
+  def close(self) -> None:
+    self._file.close()
+
+  def __enter__(self) -> "CrawlJournal":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def __len__(self) -> int:
+    return len(self._record_by_asset_path)
+
+  def get(self, asset_path: str) -> Optional[JournalRecord]:
+    """Returns the latest record of an asset if it was checked before."""
+    return self._record_by_asset_path.get(asset_path)
+
+  def append(self, record: JournalRecord) -> None:
+    """Records a check and flushes it to disk so that it survives a crash."""
+    with self._lock:
+      self._record_by_asset_path[record.asset_path] = record
+      self._file.write(json.dumps(attr.asdict(record)) + "\n")
+      self._file.flush()
+
+
+@attr.s(auto_attribs=True)
+class CrawlResult:
+  """Number of assets per outcome of AssetCrawler.crawl.
+
+  Attributes:
+    checked: Number of assets that were smoke tested, including failed ones.
+    skipped: Number of assets that were checked recently.
+    unsupported: Number of assets of model types without smoke test.
+    postponed: Number of due assets beyond the maximum per crawl.
+    file_to_error: Mapping from the documentation file of each asset that
+      failed in this crawl to the error message.
+  """
+  checked: int = 0
+  skipped: int = 0
+  unsupported: int = 0
+  postponed: int = 0
+  file_to_error: Dict[str, str] = attr.ib(factory=dict)
+
+
+@attr.s(auto_attribs=True)
+class _Asset:
+  asset_path: str
+  file_path: str
+  policy: validator.ParsingPolicy
+
+
+def _get_assets(catalog: catalog_lib.DocumentationCatalog) -> List[_Asset]:
+  """Returns each asset-path of the catalog once with its first document."""
+  asset_by_path: Dict[str, _Asset] = dict()
+  for entry in catalog.find():
+    for asset_path in sorted(entry.metadata.get(validator.ASSET_PATH_KEY, ())):
+      if asset_path in asset_by_path:
+        continue
+      try:
+        # Model documents start with the handle "# TYPE_NAME ID".
+        policy = validator.ParsingPolicy.from_string(
+            f"# {entry.type_name} {entry.id}", {})
+      except validator.MarkdownDocumentationError:
+        logging.warning("Not crawling %s of %s since it is no model.",
+                        asset_path, entry.file_path)
+        continue
+      asset_by_path[asset_path] = _Asset(asset_path, entry.file_path, policy)
+  return list(asset_by_path.values())
+
+
+class AssetCrawler:
+  """Smoke tests assets concurrently and politely and journals the outcomes."""
+
+  def __init__(
+      self,
+      journal: CrawlJournal,
+      jobs: int = 8,
+      recheck_after_seconds: float = DEFAULT_RECHECK_AFTER_SECONDS,
+      max_assets: Optional[int] = None,
+      rate_limiter: Optional[rate_limiter_lib.HostRateLimiter] = None,
+      asset_cache: Optional[asset_cache_lib.AssetCache] = None,
+      clock: Callable[[], float] = time.time) -> None:
+    """Initializes the crawler.
+
+    Args:
+      journal: Journal of previous checks to which new checks are appended.
+      jobs: Number of threads that smoke test assets in parallel.
+      recheck_after_seconds: Assets checked more recently are skipped.
+      max_assets: Optional; Maximum number of assets to check per crawl. The
+        assets with the oldest checks are checked first.
+      rate_limiter: Optional; Limiter of the requests per host, which defaults
+        to DEFAULT_REQUESTS_PER_SECOND_PER_HOST.
+      asset_cache: Optional; Cache of downloaded assets so that unchanged
+        assets are not checked again.
+      clock: Returns the current time in seconds since the epoch.
+    """
+    self._journal = journal
+    self._jobs = jobs
+    self._recheck_after_seconds = recheck_after_seconds
+    self._max_assets = max_assets
+    self._rate_limiter = rate_limiter or rate_limiter_lib.HostRateLimiter(
+        rate=DEFAULT_REQUESTS_PER_SECOND_PER_HOST,
+        capacity=DEFAULT_REQUEST_BURST_PER_HOST)
+    self._asset_cache = asset_cache
+    self._clock = clock
+
+  def _check(self, asset: _Asset) -> JournalRecord:
+    """Smoke tests an asset and appends the outcome to the journal."""
+    logging.info("Smoke testing %s of %s.", asset.asset_path, asset.file_path)
+    error = None
+    try:
+      asset.policy.smoke_test_asset(asset.asset_path, self._rate_limiter,
+                                    self._asset_cache)
+    except validator.MarkdownDocumentationError as e:
+      error = str(e)
+    # One unreachable or corrupt asset must not stop the crawl.
+    except Exception as e:  # pylint: disable=broad-except
+      error = f"{type(e).__name__}: {e}"
+    record = JournalRecord(asset.asset_path, asset.file_path, self._clock(),
+                           error)
+    self._journal.append(record)
+    return record
+
+  def crawl(self, catalog: catalog_lib.DocumentationCatalog) -> CrawlResult:
+    """Smoke tests all assets of the catalog that are due.
+
+    Args:
+      catalog: Catalog of the documentation files whose asset-path tags are
+        smoke tested.
+
+    Returns:
+      The number of assets per outcome and the errors found in this crawl.
+    """
+    result = CrawlResult()
+    due_assets = []
+    recheck_before = self._clock() - self._recheck_after_seconds
+    for asset in _get_assets(catalog):
+      if not asset.policy.supports_smoke_test:
+        result.unsupported += 1
+        continue
+      record = self._journal.get(asset.asset_path)
+      if record is not None and record.checked_at > recheck_before:
+        result.skipped += 1
+        continue
+      due_assets.append((record.checked_at if record else 0.0, asset))
+    # Assets that were never checked have the oldest check time 0.
+    due_assets.sort(key=lambda due_asset: (due_asset[0],
+                                           due_asset[1].asset_path))
+    if self._max_assets is not None and len(due_assets) > self._max_assets:
+      result.postponed = len(due_assets) - self._max_assets
+      due_assets = due_assets[:self._max_assets]
+    logging.info("Smoke testing %d assets, skipping %d checked recently.",
+                 len(due_assets), result.skipped)
+    with futures.ThreadPoolExecutor(max_workers=self._jobs) as executor:
+      for record in executor.map(self._check,
+                                 [asset for _, asset in due_assets]):
+        result.checked += 1
+        if record.error is not None:
+          result.file_to_error[record.file_path] = record.error
+    if self._asset_cache is not None:
+      self._asset_cache.save()
+    logging.info(
+        "Checked %d assets, %d failed, %d skipped, %d unsupported, %d "
+        "postponed.", result.checked, len(result.file_to_error), result.skipped,
+        result.unsupported, result.postponed)
+    return result
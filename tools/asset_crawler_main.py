@@ -0,0 +1,115 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Smoke tests the asset-path of every model, e.g. in a nightly workflow.
+
+To crawl all assets, run from the project root path:
+$ python tools/asset_crawler_main.py --catalog_file=/tmp/catalog.db \
+    --journal_file=/tmp/journal.jsonl
+
+The catalog is updated before crawling. Running the command again, e.g. after
+an interruption, skips the assets that were checked within
+--recheck_after_hours and checks the others, oldest check first. The command
+fails if any asset checked in this run is invalid.
+"""
+import argparse
+import os
+import sys
+
+from absl import app
+from absl import logging
+import asset_cache
+import asset_crawler
+import catalog
+import rate_limiter
+import validator
+
+FLAGS = None
+
+
+def main(_):
+  root_dir = FLAGS.root_dir or os.getcwd()
+  crawler_asset_cache = None
+  if FLAGS.asset_cache_dir:
+    crawler_asset_cache = asset_cache.AssetCache(
+        FLAGS.asset_cache_dir,
+        verdict_version=validator.get_smoke_test_version())
+  with catalog.DocumentationCatalog(
+      FLAGS.catalog_file) as documentation_catalog, asset_crawler.CrawlJournal(
+          FLAGS.journal_file) as journal:
+    documentation_catalog.update(root_dir)
+    crawler = asset_crawler.AssetCrawler(
+        journal,
+        jobs=FLAGS.jobs,
+        recheck_after_seconds=FLAGS.recheck_after_hours * 60 * 60,
+        max_assets=FLAGS.max_assets,
+        rate_limiter=rate_limiter.HostRateLimiter(
+            rate=FLAGS.requests_per_second_per_host,
+            capacity=asset_crawler.DEFAULT_REQUEST_BURST_PER_HOST),
+        asset_cache=crawler_asset_cache)
+    result = crawler.crawl(documentation_catalog)
+  if result.file_to_error:
+    raise validator.MarkdownDocumentationError(
+        f"Found the following errors: {result.file_to_error}")
+  logging.info("All %d checked assets are valid.", result.checked)
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      "--catalog_file",
+      type=str,
+      required=True,
+      help="Local path to the SQLite database storing the catalog.")
+  parser.add_argument(
+      "--journal_file",
+      type=str,
+      required=True,
+      help="Local path to the JSON Lines journal of all checked assets.")
+  parser.add_argument(
+      "--root_dir",
+      type=str,
+      default=None,
+      help=("Root directory that contains documentation files under "
+            "./assets/docs. Defaults to current directory."))
+  parser.add_argument(
+      "--jobs",
+      type=int,
+      default=8,
+      help="Number of threads that smoke test assets in parallel.")
+  parser.add_argument(
+      "--recheck_after_hours",
+      type=float,
+      default=asset_crawler.DEFAULT_RECHECK_AFTER_SECONDS / 60 / 60,
+      help="Assets checked more recently than this are skipped.")
+  parser.add_argument(
+      "--max_assets",
+      type=int,
+      default=None,
+      help=("Maximum number of assets to check in this run. Defaults to all "
+            "assets that are due."))
+  parser.add_argument(
+      "--requests_per_second_per_host",
+      type=float,
+      default=asset_crawler.DEFAULT_REQUESTS_PER_SECOND_PER_HOST,
+      help="Sustained rate of downloads from each host.")
+  parser.add_argument(
+      "--asset_cache_dir",
+      type=str,
+      default=None,
+      help=("Local directory in which downloaded assets are cached. Unchanged "
+            "assets are revalidated with a conditional request instead of "
+            "being downloaded and checked again."))
+  FLAGS, unparsed = parser.parse_known_args()
+  app.run(main=main, argv=[sys.argv[0]] + unparsed)
@@ -0,0 +1,209 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.asset_crawler."""
+
+import http.server
+import io
+import json
+import os
+import tarfile
+import textwrap
+import threading
+from typing import Dict, List
+from unittest import mock
+
+import tensorflow as tf
+import asset_crawler
+import catalog
+import rate_limiter
+import validator
+
+_NOW = 1_000_000.0
+
+
+class _AssetRequestHandler(http.server.BaseHTTPRequestHandler):
+  """Serves the assets of an _AssetServer."""
+
+  def do_GET(self):  # pylint: disable=invalid-name
+    self.server.requests.append(self.path)
+    content = self.server.assets.get(self.path)
+    if content is None:
+      self.send_error(404)
+      return
+    self.send_response(200)
+    self.send_header("Content-Length", str(len(content)))
+    self.end_headers()
+    self.wfile.write(content)
+
+  def log_message(self, *args):
+    del args  # Unused.
+
+
+class _AssetServer(http.server.HTTPServer):
+
+  def __init__(self):
+    super().__init__(("localhost", 0), _AssetRequestHandler)
+    self.assets: Dict[str, bytes] = dict()
+    self.requests: List[str] = list()
+
+  def get_url(self, path: str) -> str:
+    return f"http://localhost:{self.server_port}{path}"
+
+
+def _get_saved_model_archive() -> bytes:
+  content = b"saved_model_schema_version: 1\n"
+  archive = io.BytesIO()
+  with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+    tar_info = tarfile.TarInfo("saved_model.pbtxt")
+    tar_info.size = len(content)
+    tar.addfile(tar_info, io.BytesIO(content))
+  return archive.getvalue()
+
+
+class AssetCrawlerTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.server = _AssetServer()
+    thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    thread.start()
+    self.addCleanup(self.server.server_close)
+    self.addCleanup(self.server.shutdown)
+    self.server.assets["/valid.tar.gz"] = _get_saved_model_archive()
+    self.server.assets["/invalid.tar.gz"] = b"no archive"
+
+    self.root_dir = self.create_tempdir().full_path
+    self.journal_file = os.path.join(self.root_dir, "journal.jsonl")
+    self.add_model("google/models/valid/1.md", "Module google/valid/1",
+                   "/valid.tar.gz")
+    self.add_model("google/models/copy/1.md", "Module google/copy/1",
+                   "/valid.tar.gz")
+    self.add_model("google/models/invalid/1.md", "Module google/invalid/1",
+                   "/invalid.tar.gz")
+    self.add_model("google/models/missing/1.md", "Module google/missing/1",
+                   "/missing.tar.gz")
+    self.add_model("google/models/valid/lite/1.md", "Lite google/valid/1",
+                   "/valid.tflite")
+    self.catalog = catalog.DocumentationCatalog(":memory:")
+    self.addCleanup(self.catalog.close)
+    self.catalog.update(self.root_dir)
+
+  def add_model(self, file_path, handle, asset_path):
+    full_path = os.path.join(self.root_dir, "assets", "docs", file_path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w") as f:
+      f.write(
+          textwrap.dedent(f"""\
+              # {handle}
+              Model.
+
+              <!-- asset-path: {self.server.get_url(asset_path)} -->
+              """))
+
+  def write_journal(self, records):
+    with open(self.journal_file, "w") as f:
+      for asset_path, checked_at in records:
+        f.write(
+            json.dumps({
+                "asset_path": self.server.get_url(asset_path),
+                "file_path": "google/google.md",
+                "checked_at": checked_at,
+                "error": None
+            }) + "\n")
+
+  def crawl(self, **kwargs):
+    with asset_crawler.CrawlJournal(self.journal_file) as journal:
+      crawler = asset_crawler.AssetCrawler(
+          journal,
+          rate_limiter=rate_limiter.HostRateLimiter(rate=1000, capacity=1000),
+          clock=lambda: _NOW,
+          **kwargs)
+      return crawler.crawl(self.catalog)
+
+  def test_crawl_checks_each_asset_once(self):
+    result = self.crawl()
+
+    self.assertEqual(result.checked, 3)
+    self.assertEqual(result.unsupported, 1)
+    self.assertCountEqual(
+        result.file_to_error,
+        ["google/models/invalid/1.md", "google/models/missing/1.md"])
+    self.assertIn("Could not read tarfile",
+                  result.file_to_error["google/models/invalid/1.md"])
+    self.assertIn("HTTPError",
+                  result.file_to_error["google/models/missing/1.md"])
+    self.assertCountEqual(
+        self.server.requests,
+        ["/valid.tar.gz", "/invalid.tar.gz", "/missing.tar.gz"])
+    with asset_crawler.CrawlJournal(self.journal_file) as journal:
+      self.assertLen(journal, 3)
+      self.assertIsNone(
+          journal.get(self.server.get_url("/valid.tar.gz")).error)
+
+  def test_crawl_only_uses_its_rate_limiter_in_workflow(self):
+    crawler_rate_limiter = rate_limiter.HostRateLimiter(
+        rate=1000, capacity=1000)
+    with mock.patch.object(
+        validator, "_should_sleep", return_value=True), mock.patch.object(
+            validator._HOST_RATE_LIMITER, "acquire",
+            autospec=True) as mock_validator_acquire, mock.patch.object(
+                crawler_rate_limiter, "acquire",
+                autospec=True) as mock_crawler_acquire:
+      with asset_crawler.CrawlJournal(self.journal_file) as journal:
+        asset_crawler.AssetCrawler(
+            journal, rate_limiter=crawler_rate_limiter,
+            clock=lambda: _NOW).crawl(self.catalog)
+
+    mock_validator_acquire.assert_not_called()
+    self.assertEqual(mock_crawler_acquire.call_count, 3)
+
+  def test_crawl_resumes_from_journal(self):
+    self.crawl(max_assets=1)
+    self.server.requests.clear()
+
+    result = self.crawl()
+
+    self.assertEqual(result.checked, 2)
+    self.assertEqual(result.skipped, 1)
+    self.assertLen(self.server.requests, 2)
+
+  def test_crawl_checks_oldest_assets_first(self):
+    self.write_journal([("/valid.tar.gz", _NOW - 100),
+                        ("/invalid.tar.gz", _NOW - 200)])
+
+    result = self.crawl(jobs=1, recheck_after_seconds=50, max_assets=2)
+
+    self.assertEqual(result.checked, 2)
+    self.assertEqual(result.postponed, 1)
+    self.assertEqual(self.server.requests,
+                     ["/missing.tar.gz", "/invalid.tar.gz"])
+
+  def test_journal_keeps_latest_records_of_interrupted_crawls(self):
+    self.write_journal([("/valid.tar.gz", _NOW - 100),
+                        ("/valid.tar.gz", _NOW - 50)])
+    with open(self.journal_file, "a") as f:
+      f.write('{"asset_path": "http://localhost/inv')
+
+    with asset_crawler.CrawlJournal(self.journal_file) as journal:
+      self.assertLen(journal, 1)
+      self.assertEqual(
+          journal.get(self.server.get_url("/valid.tar.gz")).checked_at,
+          _NOW - 50)
+    with open(self.journal_file) as f:
+      self.assertLen(f.readlines(), 1)
+
+
+if __name__ == "__main__":
+  tf.test.main()
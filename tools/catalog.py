@@ -0,0 +1,259 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""SQLite catalog of the parsed handles and metadata of documentation files.
+
+The catalog stores one row per documentation file with the output of
+DocumentationParser.parse and one row per tag value. It is updated
+incrementally: files whose modification time did not change are skipped and
+files whose content hash did not change are not parsed again.
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from absl import logging
+import attr
+import filesystem_utils
+import validator
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+  file_path TEXT PRIMARY KEY,
+  type_name TEXT NOT NULL,
+  id TEXT NOT NULL,
+  publisher TEXT NOT NULL,
+  name TEXT,
+  version TEXT,
+  description TEXT NOT NULL,
+  mtime_ns INTEGER,
+  content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_by_type ON documents (type_name);
+CREATE INDEX IF NOT EXISTS documents_by_publisher ON documents (publisher);
+CREATE INDEX IF NOT EXISTS documents_by_id ON documents (id);
+CREATE TABLE IF NOT EXISTS tags (
+  file_path TEXT NOT NULL REFERENCES documents (file_path) ON DELETE CASCADE,
+  key TEXT NOT NULL,
+  value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tags_by_key_and_value ON tags (key, value);
+CREATE INDEX IF NOT EXISTS tags_by_file_path ON tags (file_path);
+"""
+
+_DOCUMENT_COLUMNS = ("file_path, type_name, id, publisher, name, version, "
+                     "description")
+
+
+@attr.s(auto_attribs=True)
+class CatalogEntry:
+  """The parsed handle and metadata of a documentation file.
+
+  Attributes:
+    file_path: Path relative to the `assets/docs` directory.
+    type_name: Readable name of the parsing policy e.g. "Module".
+    id: Id of the document e.g. "google/bert/1".
+    publisher: Publisher of the document.
+    name: Model or collection name, None for publishers.
+    version: Version, None for publishers and collections.
+    description: The parsed description below the handle.
+    metadata: Mapping of metadata keys to their values.
+  """
+  file_path: str
+  type_name: str
+  id: str
+  publisher: str
+  name: Optional[str]
+  version: Optional[str]
+  description: str
+  metadata: Dict[str, Set[str]] = attr.ib(factory=dict)
+
+
+@attr.s(auto_attribs=True)
+class UpdateStatistics:
+  """Number of files per outcome of DocumentationCatalog.update."""
+  parsed: int = 0
+  unchanged: int = 0
+  removed: int = 0
+  failed: int = 0
+
+
+def _get_mtime_ns(file_path: str) -> Optional[int]:
+  """Returns the modification time of local files and None otherwise."""
+  try:
+    return os.stat(file_path).st_mtime_ns
+  except (OSError, ValueError):
+    return None
+
+
+def _get_content_hash(file_path: str) -> str:
+  with filesystem_utils.open_file(file_path, "rb") as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+
+class DocumentationCatalog:
+  """Catalog of documentation files stored in a SQLite database."""
+
+  def __init__(self, db_path: str) -> None:
+    """Opens the database and creates its tables if needed.
+
+    Args:
+      db_path: Local path to the SQLite database or ":memory:".
+    """
+    self._connection = sqlite3.connect(db_path)
+    self._connection.execute("PRAGMA foreign_keys = ON")
+    self._connection.executescript(_SCHEMA)
+
+  def close(self) -> None:
+    self._connection.close()
+
+  def __enter__(self) -> "DocumentationCatalog":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def __len__(self) -> int:
+    return self._connection.execute(
+        "SELECT COUNT(*) FROM documents").fetchone()[0]
+
+  def update(self,
+             root_dir: str,
+             relative_docs_path: str = validator.DOCS_PATH) -> UpdateStatistics:
+    """Brings the catalog in line with the documentation files on disk.
+
+    Files that cannot be parsed are logged and removed from the catalog.
+
+    Args:
+      root_dir: Absolute path to the top-level dir that contains Markdown files.
+      relative_docs_path: Relative path under `root_dir` containing the Markdown
+        files. Defaults to "assets/docs".
+
+    Returns:
+      The number of parsed, unchanged, removed and failed files.
+    """
+    documentation_dir = os.path.join(root_dir, relative_docs_path)
+    statistics = UpdateStatistics()
+    stored_versions: Dict[str, Tuple[Optional[int], str]] = {
+        file_path: (mtime_ns, content_hash)
+        for file_path, mtime_ns, content_hash in self._connection.execute(
+            "SELECT file_path, mtime_ns, content_hash FROM documents")
+    }
+    documentation_parser = validator.DocumentationParser(
+        root_dir, documentation_dir, {})
+    with self._connection:
+      for absolute_path in filesystem_utils.recursive_list_dir(
+          documentation_dir):
+        if not absolute_path.endswith(".md"):
+          continue
+        file_path = os.path.relpath(absolute_path, documentation_dir)
+        stored_mtime_ns, stored_hash = stored_versions.pop(
+            file_path, (None, None))
+        mtime_ns = _get_mtime_ns(absolute_path)
+        if mtime_ns is not None and mtime_ns == stored_mtime_ns:
+          statistics.unchanged += 1
+          continue
+        content_hash = _get_content_hash(absolute_path)
+        if content_hash == stored_hash:
+          self._connection.execute(
+              "UPDATE documents SET mtime_ns = ? WHERE file_path = ?",
+              (mtime_ns, file_path))
+          statistics.unchanged += 1
+          continue
+        try:
+          documentation_parser.parse(absolute_path)
+        # Files without a description line raise an IndexError.
+        except (validator.MarkdownDocumentationError, IndexError,
+                UnicodeDecodeError) as e:
+          logging.warning("Not cataloging %s since it cannot be parsed: %s",
+                          file_path, e)
+          self._remove(file_path)
+          statistics.failed += 1
+          continue
+        self._insert(file_path, documentation_parser, mtime_ns, content_hash)
+        statistics.parsed += 1
+      for file_path in stored_versions:
+        self._remove(file_path)
+        statistics.removed += 1
+    logging.info("Updated catalog: %s", statistics)
+    return statistics
+
+  def _remove(self, file_path: str) -> None:
+    self._connection.execute("DELETE FROM documents WHERE file_path = ?",
+                             (file_path,))
+
+  def _insert(self, file_path: str,
+              documentation_parser: validator.DocumentationParser,
+              mtime_ns: Optional[int], content_hash: str) -> None:
+    """Replaces the rows of a file with the output of its parser."""
+    self._remove(file_path)
+    policy = documentation_parser.policy
+    self._connection.execute(
+        f"INSERT INTO documents ({_DOCUMENT_COLUMNS}, mtime_ns, content_hash) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (file_path, policy.type_name, policy.id, policy.publisher,
+         policy.model_name, policy.model_version,
+         documentation_parser.parsed_description, mtime_ns, content_hash))
+    self._connection.executemany(
+        "INSERT INTO tags (file_path, key, value) VALUES (?, ?, ?)",
+        [(file_path, key, value)
+         for key, values in documentation_parser.parsed_metadata.items()
+         for value in sorted(values)])
+
+  def _get_entries(self, where_clause: str,
+                   parameters: Tuple[str, ...]) -> Iterator[CatalogEntry]:
+    """Yields the entries of all documents matching a WHERE clause."""
+    rows = self._connection.execute(
+        f"SELECT {_DOCUMENT_COLUMNS} FROM documents {where_clause} "
+        "ORDER BY file_path", parameters).fetchall()
+    for row in rows:
+      entry = CatalogEntry(*row)
+      for key, value in self._connection.execute(
+          "SELECT key, value FROM tags WHERE file_path = ?", (row[0],)):
+        entry.metadata.setdefault(key, set()).add(value)
+      yield entry
+
+  def get(self, file_path: str) -> Optional[CatalogEntry]:
+    """Returns the entry of a file relative to `assets/docs` if it exists."""
+    return next(self._get_entries("WHERE file_path = ?", (file_path,)), None)
+
+  def find(self,
+           type_name: Optional[str] = None,
+           publisher: Optional[str] = None,
+           tag: Optional[Tuple[str, str]] = None) -> List[CatalogEntry]:
+    """Returns the entries matching all given criteria sorted by file path.
+
+    Args:
+      type_name: Optional; Readable name of the parsing policy e.g. "Module".
+      publisher: Optional; Publisher of the documents.
+      tag: Optional; (key, value) pair of a metadata tag, e.g.
+        ("language", "en").
+    """
+    conditions = []
+    parameters = []
+    if type_name is not None:
+      conditions.append("type_name = ?")
+      parameters.append(type_name)
+    if publisher is not None:
+      conditions.append("publisher = ?")
+      parameters.append(publisher)
+    if tag is not None:
+      conditions.append("file_path IN "
+                        "(SELECT file_path FROM tags WHERE key = ? AND "
+                        "value = ?)")
+      parameters.extend(tag)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return list(self._get_entries(where_clause, tuple(parameters)))
@@ -0,0 +1,56 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Builds or updates the SQLite catalog of all documentation files.
+
+To build the catalog, run from the project root path:
+$ python tools/catalog_main.py --catalog_file=/tmp/catalog.db
+
+Running the command again only parses files that changed since the last run.
+Use the --root_dir flag to catalog a project outside of the current directory.
+"""
+import argparse
+import os
+import sys
+
+from absl import app
+from absl import logging
+import catalog
+
+FLAGS = None
+
+
+def main(_):
+  root_dir = FLAGS.root_dir or os.getcwd()
+  with catalog.DocumentationCatalog(FLAGS.catalog_file) as documentation_catalog:
+    documentation_catalog.update(root_dir)
+    logging.info("The catalog %s contains %d documents.", FLAGS.catalog_file,
+                 len(documentation_catalog))
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      "--catalog_file",
+      type=str,
+      required=True,
+      help="Local path to the SQLite database storing the catalog.")
+  parser.add_argument(
+      "--root_dir",
+      type=str,
+      default=None,
+      help=("Root directory that contains documentation files under "
+            "./assets/docs. Defaults to current directory."))
+  FLAGS, unparsed = parser.parse_known_args()
+  app.run(main=main, argv=[sys.argv[0]] + unparsed)
@@ -0,0 +1,154 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.catalog."""
+
+import os
+import textwrap
+
+import tensorflow as tf
+import catalog
+
+_PUBLISHER_DOC = textwrap.dedent("""\
+    # Publisher google
+    Google
+
+    [![Icon URL]](https://www.gstatic.com/aihub/google_logo_120.png)
+    """)
+
+_MODEL_DOC = textwrap.dedent("""\
+    # Module google/bert/1
+    BERT encoder.
+
+    <!-- asset-path: https://domain.test/bert.tar.gz -->
+    <!-- task: text-embedding -->
+    <!-- language: en -->
+    <!-- language: de -->
+
+    ## Overview
+    """)
+
+_COLLECTION_DOC = textwrap.dedent("""\
+    # Collection google/experts/1
+    Expert models.
+
+    <!-- task: text-embedding -->
+
+    ## Overview
+    https://tfhub.dev/google/bert/1
+    """)
+
+
+class DocumentationCatalogTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.root_dir = self.create_tempdir().full_path
+    self.docs_dir = os.path.join(self.root_dir, "assets", "docs")
+    self.set_content("google/google.md", _PUBLISHER_DOC)
+    self.set_content("google/models/bert/1.md", _MODEL_DOC)
+    self.set_content("google/collections/experts/1.md", _COLLECTION_DOC)
+    self.catalog = catalog.DocumentationCatalog(
+        os.path.join(self.root_dir, "catalog.db"))
+    self.addCleanup(self.catalog.close)
+
+  def set_content(self, file_path, content):
+    full_path = os.path.join(self.docs_dir, file_path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w") as f:
+      f.write(content)
+    # Guarantees a new modification time on filesystems with coarse mtimes.
+    stat = os.stat(full_path)
+    os.utime(full_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+  def test_update_parses_all_files(self):
+    statistics = self.catalog.update(self.root_dir)
+
+    self.assertEqual(statistics, catalog.UpdateStatistics(parsed=3))
+    self.assertLen(self.catalog, 3)
+    self.assertEqual(
+        self.catalog.get("google/models/bert/1.md"),
+        catalog.CatalogEntry(
+            file_path="google/models/bert/1.md",
+            type_name="Module",
+            id="google/bert/1",
+            publisher="google",
+            name="bert",
+            version="1",
+            description="BERT encoder.",
+            metadata={
+                "asset-path": {"https://domain.test/bert.tar.gz"},
+                "task": {"text-embedding"},
+                "language": {"en", "de"}
+            }))
+
+  def test_second_update_does_not_parse_unchanged_files(self):
+    self.catalog.update(self.root_dir)
+
+    statistics = self.catalog.update(self.root_dir)
+
+    self.assertEqual(statistics, catalog.UpdateStatistics(unchanged=3))
+
+  def test_update_parses_changed_files(self):
+    self.catalog.update(self.root_dir)
+    self.set_content("google/models/bert/1.md",
+                     _MODEL_DOC.replace("BERT encoder.", "New description."))
+
+    statistics = self.catalog.update(self.root_dir)
+
+    self.assertEqual(statistics, catalog.UpdateStatistics(
+        parsed=1, unchanged=2))
+    self.assertEqual(
+        self.catalog.get("google/models/bert/1.md").description,
+        "New description.")
+
+  def test_update_does_not_parse_touched_files(self):
+    self.catalog.update(self.root_dir)
+    self.set_content("google/models/bert/1.md", _MODEL_DOC)
+
+    statistics = self.catalog.update(self.root_dir)
+
+    self.assertEqual(statistics, catalog.UpdateStatistics(unchanged=3))
+
+  def test_update_removes_deleted_and_unparsable_files(self):
+    self.catalog.update(self.root_dir)
+    os.remove(os.path.join(self.docs_dir, "google/collections/experts/1.md"))
+    self.set_content("google/models/bert/1.md", "# Newmodel google/bert/1\n")
+
+    statistics = self.catalog.update(self.root_dir)
+
+    self.assertEqual(statistics, catalog.UpdateStatistics(
+        unchanged=1, removed=1, failed=1))
+    self.assertIsNone(self.catalog.get("google/models/bert/1.md"))
+    self.assertLen(self.catalog, 1)
+
+  def test_find(self):
+    self.catalog.update(self.root_dir)
+
+    self.assertEqual([entry.file_path for entry in self.catalog.find()], [
+        "google/collections/experts/1.md", "google/google.md",
+        "google/models/bert/1.md"
+    ])
+    self.assertEqual(
+        [entry.id for entry in self.catalog.find(type_name="Publisher")],
+        ["google"])
+    self.assertEqual([
+        entry.id for entry in self.catalog.find(
+            publisher="google", tag=("task", "text-embedding"))
+    ], ["google/experts", "google/bert/1"])
+    self.assertEmpty(self.catalog.find(tag=("language", "fr")))
+
+
+if __name__ == "__main__":
+  tf.test.main()
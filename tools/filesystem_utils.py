@@ -12,39 +12,249 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-"""Filesystem utilities for validating Markdown and YAML files."""
+"""Filesystem utilities for validating Markdown and YAML files.
 
+All file accesses go through a FileSystem backend that is chosen from the
+scheme of the accessed path:
+- Local paths without a scheme use LocalFileSystem, which is based on the
+  Python standard library.
+- Paths with a registered scheme use the registered backend e.g. an
+  InMemoryFileSystem registered for "mem://" in tests.
+- All other paths like "gs://bucket/docs" use GFileFileSystem. TensorFlow is
+  only imported at that point since importing it dominates the startup time of
+  the validators.
+"""
+
+import abc
+import fnmatch
+import glob as glob_lib
+import io
 import os
 import tarfile
-import tensorflow as tf
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
+
+_SCHEME_SEPARATOR = "://"
+
+WalkResult = Tuple[str, List[str], List[str]]
+
+
+class FileSystem(metaclass=abc.ABCMeta):
+  """Interface for the file operations that are needed by the validators."""
+
+  @abc.abstractmethod
+  def open(self, path: str, mode: str = "r") -> IO:
+    """Opens a file. Text files are read without translating newlines."""
+
+  @abc.abstractmethod
+  def walk(self, root_dir: str) -> Iterator[WalkResult]:
+    """Yields (dirname, subdirs, filenames) tuples like os.walk."""
+
+  @abc.abstractmethod
+  def exists(self, path: str) -> bool:
+    """Returns True if a file or directory exists at `path`."""
+
+  @abc.abstractmethod
+  def glob(self, pattern: str) -> List[str]:
+    """Returns the paths matching a pattern with wildcards like '*'."""
+
+
+class LocalFileSystem(FileSystem):
+  """FileSystem for local paths based on os.walk, os.path and glob."""
+
+  def open(self, path: str, mode: str = "r") -> IO:
+    if "b" in mode:
+      return open(path, mode)
+    return open(path, mode, encoding="utf-8", newline="")
+
+  def walk(self, root_dir: str) -> Iterator[WalkResult]:
+    return os.walk(root_dir)
+
+  def exists(self, path: str) -> bool:
+    return os.path.exists(path)
+
+  def glob(self, pattern: str) -> List[str]:
+    return glob_lib.glob(pattern)
+
+
+class GFileFileSystem(FileSystem):
+  """FileSystem for remote paths like "gs://" based on tf.io.gfile."""
+
+  @property
+  def _gfile(self):
+    """Returns the tf.io.gfile module and imports TensorFlow on first use."""
+    import tensorflow as tf  # pylint: disable=g-import-not-at-top
+    return tf.io.gfile
+
+  def open(self, path: str, mode: str = "r") -> IO:
+    return self._gfile.GFile(path, mode)
+
+  def walk(self, root_dir: str) -> Iterator[WalkResult]:
+    return self._gfile.walk(root_dir)
+
+  def exists(self, path: str) -> bool:
+    return self._gfile.exists(path)
+
+  def glob(self, pattern: str) -> List[str]:
+    return self._gfile.glob(pattern)
+
+
+class _InMemoryWriter(io.BytesIO):
+  """Buffer that stores its content in an InMemoryFileSystem when closed."""
+
+  def __init__(self, files: Dict[str, bytes], path: str) -> None:
+    super().__init__()
+    self._files = files
+    self._path = path
+
+  def close(self) -> None:
+    if not self.closed:
+      self._files[self._path] = self.getvalue()
+    super().close()
+
+
+class InMemoryFileSystem(FileSystem):
+  """FileSystem keeping all files in a dict, mainly intended for tests."""
+
+  def __init__(self, files: Optional[Dict[str, str]] = None) -> None:
+    self._files: Dict[str, bytes] = dict()
+    for path, content in (files or {}).items():
+      self.write(path, content)
+
+  def write(self, path: str, content: str) -> None:
+    """Stores a text file at `path`, overwriting existing content."""
+    self._files[path] = content.encode("utf-8")
+
+  def open(self, path: str, mode: str = "r") -> IO:
+    if "w" in mode:
+      writer = _InMemoryWriter(self._files, path)
+      if "b" in mode:
+        return writer
+      return io.TextIOWrapper(writer, encoding="utf-8", newline="")
+    if path not in self._files:
+      raise FileNotFoundError(f"No such file: {path}")
+    if "b" in mode:
+      return io.BytesIO(self._files[path])
+    return io.StringIO(self._files[path].decode("utf-8"), newline="")
+
+  def _get_dirs(self) -> Set[str]:
+    dirs = set()
+    for path in self._files:
+      dirname = os.path.dirname(path)
+      while dirname not in dirs and dirname != os.path.dirname(dirname):
+        dirs.add(dirname)
+        dirname = os.path.dirname(dirname)
+    return dirs
+
+  def walk(self, root_dir: str) -> Iterator[WalkResult]:
+    root_dir = root_dir.rstrip("/")
+    dirs = self._get_dirs()
+    if root_dir not in dirs:
+      return
+    subdirs_by_dir = {dirname: [] for dirname in dirs}
+    files_by_dir = {dirname: [] for dirname in dirs}
+    for dirname in dirs:
+      parent = os.path.dirname(dirname)
+      if parent in subdirs_by_dir:
+        subdirs_by_dir[parent].append(os.path.basename(dirname))
+    for path in self._files:
+      files_by_dir[os.path.dirname(path)].append(os.path.basename(path))
+    pending = [root_dir]
+    while pending:
+      dirname = pending.pop()
+      subdirs = sorted(subdirs_by_dir[dirname])
+      yield dirname, subdirs, sorted(files_by_dir[dirname])
+      pending.extend(os.path.join(dirname, d) for d in reversed(subdirs))
+
+  def exists(self, path: str) -> bool:
+    path = path.rstrip("/")
+    return path in self._files or path in self._get_dirs()
+
+  def glob(self, pattern: str) -> List[str]:
+    # Unlike with fnmatch, wildcards must not match directory separators.
+    pattern_parts = pattern.split("/")
+    return sorted(
+        path for path in self._files
+        if _match_path_parts(path.split("/"), pattern_parts))
+
+
+def _match_path_parts(path_parts: List[str], pattern_parts: List[str]) -> bool:
+  return len(path_parts) == len(pattern_parts) and all(
+      fnmatch.fnmatchcase(path_part, pattern_part)
+      for path_part, pattern_part in zip(path_parts, pattern_parts))
+
+
+_LOCAL_FILESYSTEM = LocalFileSystem()
+_GFILE_FILESYSTEM = GFileFileSystem()
+_FILESYSTEM_BY_SCHEME: Dict[str, FileSystem] = dict()
+
+
+def register_filesystem(scheme: str, filesystem: FileSystem) -> None:
+  """Uses `filesystem` for all paths starting with "`scheme`://"."""
+  _FILESYSTEM_BY_SCHEME[scheme] = filesystem
+
+
+def unregister_filesystem(scheme: str) -> None:
+  """Reverts register_filesystem so that the default backend is used again."""
+  _FILESYSTEM_BY_SCHEME.pop(scheme, None)
+
+
+def get_filesystem(path: str) -> FileSystem:
+  """Returns the FileSystem backend for the scheme of `path`."""
+  scheme, separator, _ = os.fspath(path).partition(_SCHEME_SEPARATOR)
+  if not separator:
+    return _LOCAL_FILESYSTEM
+  return _FILESYSTEM_BY_SCHEME.get(scheme, _GFILE_FILESYSTEM)
 
 
 def recursive_list_dir(root_dir):
   """Yields all files of a root directory tree."""
-  for dirname, _, filenames in tf.io.gfile.walk(root_dir):
+  for dirname, _, filenames in get_filesystem(root_dir).walk(root_dir):
     for filename in filenames:
       yield os.path.join(dirname, filename)
 
 
+def open_file(file_path: str, mode: str = "r") -> IO:
+  """Opens a file. Text files are read without translating newlines."""
+  return get_filesystem(file_path).open(file_path, mode)
+
+
 def get_content(file_path):
   """Returns a file's content."""
-  with tf.io.gfile.GFile(file_path, "r") as f:
+  with get_filesystem(file_path).open(file_path, "r") as f:
     return f.read()
 
 
+def exists(path: str) -> bool:
+  """Returns True if a file or directory exists at `path`."""
+  return get_filesystem(path).exists(path)
+
+
+def glob(pattern: str) -> List[str]:
+  """Returns the paths matching a pattern with wildcards like '*'."""
+  return get_filesystem(pattern).glob(pattern)
+
+
+def _get_file_size(f: IO) -> int:
+  """Returns the size of an opened file and rewinds it to its start."""
+  f.seek(0, os.SEEK_END)
+  size = f.tell()
+  f.seek(0)
+  return size
+
+
 def create_archive(archive_path: str, file_path: str) -> None:
   """Creates a tar.gz archive from a file."""
-  with tf.io.gfile.GFile(archive_path, "wb") as f:
+  with get_filesystem(archive_path).open(archive_path, "wb") as f:
     with tarfile.open(mode="w:gz", fileobj=f) as tar:
-      with tf.io.gfile.GFile(file_path, "rb") as archived_file:
+      with get_filesystem(file_path).open(file_path, "rb") as archived_file:
         tar_info = tarfile.TarInfo(name=os.path.basename(file_path))
-        tar_info.size = archived_file.size()
+        tar_info.size = _get_file_size(archived_file)
         tar.addfile(tar_info, fileobj=archived_file)
 
 
 def compress_local_directory_to_archive(local_directory: str,
                                         archive_path: str) -> None:
   """Compresses a local directory to a tar.gz archive."""
-  with tf.io.gfile.GFile(archive_path, "wb") as f:
+  with get_filesystem(archive_path).open(archive_path, "wb") as f:
     with tarfile.open(mode="w:gz", fileobj=f) as tar:
       tar.add(local_directory, arcname="/")
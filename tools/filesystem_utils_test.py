@@ -16,6 +16,8 @@
 
 import os
 import pathlib
+import subprocess
+import sys
 import tarfile
 import tensorflow as tf
 import filesystem_utils
@@ -55,6 +57,102 @@ class FilesystemUtilsTest(tf.test.TestCase):
     temp_file = self.create_tempfile(content=content)
     self.assertEqual(content, filesystem_utils.get_content(temp_file))
 
+  def test_get_content_keeps_carriage_returns(self):
+    content = "# Module\r\nDescription"
+    temp_file = self.create_tempfile(content=content)
+    self.assertEqual(content, filesystem_utils.get_content(temp_file))
+
+  def test_exists(self):
+    temp_file = self.create_tempfile()
+    self.assertTrue(filesystem_utils.exists(temp_file.full_path))
+    self.assertFalse(
+        filesystem_utils.exists(temp_file.full_path + ".does_not_exist"))
+
+  def test_glob_with_wildcard_version(self):
+    root_dir = self.create_tempdir()
+    for version in ["1", "2"]:
+      root_dir.create_file(file_path=os.path.join("model", f"{version}.md"))
+    root_dir.create_file(file_path=os.path.join("model", "lite", "1.md"))
+
+    paths = filesystem_utils.glob(os.path.join(root_dir, "model", "*.md"))
+
+    self.assertCountEqual(paths, [
+        os.path.join(root_dir, "model", "1.md"),
+        os.path.join(root_dir, "model", "2.md")
+    ])
+
+  def test_import_does_not_load_tensorflow(self):
+    tools_dir = os.path.dirname(os.path.abspath(filesystem_utils.__file__))
+    output = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys, filesystem_utils; print('tensorflow' in sys.modules)"
+        ],
+        check=True,
+        cwd=tools_dir,
+        capture_output=True,
+        text=True).stdout
+    self.assertEqual(output.strip(), "False")
+
+  def test_get_filesystem_by_scheme(self):
+    in_memory_filesystem = filesystem_utils.InMemoryFileSystem()
+    filesystem_utils.register_filesystem("mem", in_memory_filesystem)
+    self.addCleanup(filesystem_utils.unregister_filesystem, "mem")
+
+    self.assertIsInstance(
+        filesystem_utils.get_filesystem("/root/docs"),
+        filesystem_utils.LocalFileSystem)
+    self.assertIsInstance(
+        filesystem_utils.get_filesystem("gs://bucket/docs"),
+        filesystem_utils.GFileFileSystem)
+    self.assertIs(
+        filesystem_utils.get_filesystem("mem://root/docs"),
+        in_memory_filesystem)
+
+  def test_in_memory_filesystem_with_registered_scheme(self):
+    filesystem_utils.register_filesystem(
+        "mem",
+        filesystem_utils.InMemoryFileSystem({
+            "mem://root/a/1.md": "# Module",
+            "mem://root/a/2.md": "",
+            "mem://root/a/b/1.md": "",
+        }))
+    self.addCleanup(filesystem_utils.unregister_filesystem, "mem")
+
+    self.assertEqual(filesystem_utils.get_content("mem://root/a/1.md"),
+                     "# Module")
+    self.assertCountEqual(
+        filesystem_utils.recursive_list_dir("mem://root"),
+        ["mem://root/a/1.md", "mem://root/a/2.md", "mem://root/a/b/1.md"])
+    self.assertEqual(
+        filesystem_utils.glob("mem://root/a/*.md"),
+        ["mem://root/a/1.md", "mem://root/a/2.md"])
+    self.assertTrue(filesystem_utils.exists("mem://root/a/b"))
+    self.assertFalse(filesystem_utils.exists("mem://root/c"))
+
+  def test_in_memory_filesystem_write_and_read(self):
+    filesystem = filesystem_utils.InMemoryFileSystem()
+    with filesystem.open("/root/file.txt", "w") as f:
+      f.write("line1\r\nline2")
+
+    with filesystem.open("/root/file.txt") as f:
+      self.assertEqual(f.read(), "line1\r\nline2")
+    with self.assertRaises(FileNotFoundError):
+      filesystem.open("/root/other_file.txt")
+
+  def test_in_memory_filesystem_walks_top_down(self):
+    filesystem = filesystem_utils.InMemoryFileSystem({
+        "/root/b/1.md": "",
+        "/root/a/1.md": "",
+        "/root/root.md": ""
+    })
+
+    self.assertEqual(
+        list(filesystem.walk("/root")), [("/root", ["a", "b"], ["root.md"]),
+                                         ("/root/a", [], ["1.md"]),
+                                         ("/root/b", [], ["1.md"])])
+    self.assertEmpty(list(filesystem.walk("/other_root")))
+
   def test_create_archive_with_valid_file_succeeds(self):
     file_name = "my_file"
     file_content = "content"
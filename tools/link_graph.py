@@ -0,0 +1,110 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Graph of the links from documentation files to other documentation files.
+
+Collections link to model pages. Each link is stored as the pattern of the
+documentation files that can satisfy it, e.g. "google/models/bert/*.md" for a
+link without version. The reverse edges are indexed by the directory of the
+pattern so that finding the files linking to a changed file only touches the
+edges into its directory.
+"""
+
+import collections
+import fnmatch
+import json
+import os
+from typing import AbstractSet, Dict, Iterable, Set, Tuple
+
+
+class LinkGraph:
+  """Links from source files to patterns of target files and their reverse."""
+
+  def __init__(self) -> None:
+    self._patterns_by_source: Dict[str, Set[str]] = dict()
+    # Maps the directory of a pattern to (filename pattern, source) pairs.
+    self._links_by_target_dir: Dict[str, Set[Tuple[
+        str, str]]] = collections.defaultdict(set)
+
+  def __len__(self) -> int:
+    """Returns the number of links."""
+    return sum(len(patterns) for patterns in self._patterns_by_source.values())
+
+  @property
+  def sources(self) -> AbstractSet[str]:
+    return self._patterns_by_source.keys()
+
+  def get_patterns(self, source: str) -> AbstractSet[str]:
+    """Returns the patterns of the targets of a source file."""
+    return self._patterns_by_source.get(source, frozenset())
+
+  def set_links(self, source: str, patterns: Iterable[str]) -> None:
+    """Replaces all links of a source file.
+
+    Args:
+      source: Path of the linking file, e.g. relative to `assets/docs`.
+      patterns: Paths of the linked files relative to the same directory as
+        `source`, which can contain wildcards in their last component.
+    """
+    self.remove_source(source)
+    patterns = set(patterns)
+    self._patterns_by_source[source] = patterns
+    for pattern in patterns:
+      target_dir, filename_pattern = os.path.split(pattern)
+      self._links_by_target_dir[target_dir].add((filename_pattern, source))
+
+  def remove_source(self, source: str) -> None:
+    """Removes all links of a source file e.g. after it was deleted."""
+    for pattern in self._patterns_by_source.pop(source, ()):
+      target_dir, filename_pattern = os.path.split(pattern)
+      links = self._links_by_target_dir[target_dir]
+      links.discard((filename_pattern, source))
+      if not links:
+        del self._links_by_target_dir[target_dir]
+
+  def get_linking_sources(self, targets: Iterable[str]) -> Set[str]:
+    """Returns all source files linking to any of the target files.
+
+    Args:
+      targets: Paths of changed or deleted files.
+    """
+    sources = set()
+    for target in targets:
+      target_dir, filename = os.path.split(target)
+      for filename_pattern, source in self._links_by_target_dir.get(
+          target_dir, ()):
+        if fnmatch.fnmatchcase(filename, filename_pattern):
+          sources.add(source)
+    return sources
+
+  def save(self, path: str) -> None:
+    """Atomically writes the graph to a local JSON file."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+      json.dump(
+          {
+              source: sorted(patterns)
+              for source, patterns in sorted(self._patterns_by_source.items())
+          }, f)
+    os.replace(temp_path, path)
+
+  @classmethod
+  def load(cls, path: str) -> "LinkGraph":
+    """Reads a graph written by save()."""
+    with open(path) as f:
+      patterns_by_source = json.load(f)
+    graph = cls()
+    for source, patterns in patterns_by_source.items():
+      graph.set_links(source, patterns)
+    return graph
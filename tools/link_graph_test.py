@@ -0,0 +1,80 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.link_graph."""
+
+import os
+
+from absl.testing import parameterized
+import tensorflow as tf
+import link_graph
+
+
+class LinkGraphTest(parameterized.TestCase, tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.graph = link_graph.LinkGraph()
+    self.graph.set_links("google/collections/bert/1.md", [
+        "google/models/bert/*.md", "google/models/albert/2.md",
+        "google/bert/*.md"
+    ])
+    self.graph.set_links("google/collections/lite/1.md",
+                         ["google/models/albert/2.md"])
+
+  @parameterized.parameters(
+      (["google/models/bert/3.md"], {"google/collections/bert/1.md"}),
+      (["google/models/albert/2.md"],
+       {"google/collections/bert/1.md", "google/collections/lite/1.md"}),
+      (["google/models/albert/1.md", "google/models/bert/tfjs/1.md"], set()),
+      (["google/models/bert/1.md", "google/models/albert/2.md"],
+       {"google/collections/bert/1.md", "google/collections/lite/1.md"}))
+  def test_get_linking_sources(self, targets, expected_sources):
+    self.assertEqual(self.graph.get_linking_sources(targets), expected_sources)
+
+  def test_set_links_replaces_previous_links(self):
+    self.graph.set_links("google/collections/lite/1.md",
+                         ["google/models/bert/1.md"])
+
+    self.assertEmpty(
+        self.graph.get_linking_sources(["google/models/albert/2.md"]) -
+        {"google/collections/bert/1.md"})
+    self.assertEqual(
+        self.graph.get_linking_sources(["google/models/bert/1.md"]),
+        {"google/collections/bert/1.md", "google/collections/lite/1.md"})
+    self.assertLen(self.graph, 4)
+
+  def test_remove_source(self):
+    self.graph.remove_source("google/collections/bert/1.md")
+    self.graph.remove_source("google/collections/unknown/1.md")
+
+    self.assertEqual(self.graph.sources, {"google/collections/lite/1.md"})
+    self.assertEmpty(
+        self.graph.get_linking_sources(["google/models/bert/1.md"]))
+
+  def test_save_and_load(self):
+    path = os.path.join(self.create_tempdir().full_path, "links.json")
+
+    self.graph.save(path)
+    loaded_graph = link_graph.LinkGraph.load(path)
+
+    self.assertEqual(loaded_graph.sources, self.graph.sources)
+    for source in self.graph.sources:
+      self.assertEqual(
+          loaded_graph.get_patterns(source), self.graph.get_patterns(source))
+    self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -0,0 +1,119 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""In-memory index of the documentation files below a root directory."""
+
+import collections
+import fnmatch
+import os
+from typing import Dict, Iterable, Iterator, List, Set
+
+import filesystem_utils
+
+_WILDCARD_CHARACTERS = frozenset("*?[")
+
+
+def _has_wildcard(pattern: str) -> bool:
+  return not _WILDCARD_CHARACTERS.isdisjoint(pattern)
+
+
+class DocumentationPathIndex:
+  """Set of all file paths below a root directory built from one walk.
+
+  The index answers the existence checks that the parsing policies would
+  otherwise send to the filesystem for every validated document. Checking a
+  path takes O(1) and resolving a pattern with a wildcard in its file name like
+  "PUBLISHER/models/NAME/*.md" takes O(files in the directory), which is the
+  number of versions of a model.
+  """
+
+  def __init__(self, root_dir: str, file_paths: Iterable[str] = ()) -> None:
+    """Initializes the index.
+
+    Args:
+      root_dir: Path to the indexed directory e.g. the `assets/docs` dir.
+      file_paths: Paths of all files below `root_dir`, starting with
+        `root_dir`.
+    """
+    self._root_dir = root_dir
+    self._root_prefix = os.path.join(root_dir, "")
+    self._filenames_by_dir: Dict[str, Set[str]] = collections.defaultdict(set)
+    self._size = 0
+    for file_path in file_paths:
+      self.add(file_path)
+
+  @classmethod
+  def from_dir(cls, root_dir: str) -> "DocumentationPathIndex":
+    """Builds an index by walking all files below `root_dir`."""
+    return cls(root_dir, filesystem_utils.recursive_list_dir(root_dir))
+
+  def add(self, file_path: str) -> None:
+    """Adds a file path starting with the root directory to the index."""
+    dirname, filename = os.path.split(file_path)
+    filenames = self._filenames_by_dir[dirname]
+    if filename not in filenames:
+      filenames.add(filename)
+      self._size += 1
+
+  def __len__(self) -> int:
+    return self._size
+
+  def __iter__(self) -> Iterator[str]:
+    for dirname, filenames in self._filenames_by_dir.items():
+      for filename in sorted(filenames):
+        yield os.path.join(dirname, filename)
+
+  def iter_relative_paths(self) -> Iterator[str]:
+    """Yields the paths of all files relative to the root directory.
+
+    The relative path is computed once per directory instead of per file.
+    """
+    for dirname, filenames in self._filenames_by_dir.items():
+      relative_dirname = os.path.relpath(dirname, self._root_dir)
+      if relative_dirname == os.curdir:
+        relative_dirname = ""
+      for filename in sorted(filenames):
+        yield os.path.join(relative_dirname, filename)
+
+  def _is_indexed(self, path: str) -> bool:
+    return path.startswith(self._root_prefix)
+
+  def exists(self, path: str) -> bool:
+    """Returns True if a file exists at `path`."""
+    if not self._is_indexed(path):
+      return filesystem_utils.exists(path)
+    dirname, filename = os.path.split(path)
+    return filename in self._filenames_by_dir.get(dirname, ())
+
+  def glob(self, pattern: str) -> List[str]:
+    """Returns the sorted paths matching a pattern like filesystem_utils.glob.
+
+    Args:
+      pattern: A path that can contain wildcards in its last component.
+        Patterns outside of the indexed root or with wildcards in their
+        directory part are resolved by the filesystem.
+
+    Returns:
+      All indexed paths matching the pattern.
+    """
+    dirname, filename_pattern = os.path.split(pattern)
+    if not self._is_indexed(pattern) or _has_wildcard(dirname):
+      return sorted(filesystem_utils.glob(pattern))
+    if not _has_wildcard(filename_pattern):
+      return [pattern] if self.exists(pattern) else []
+    filenames = self._filenames_by_dir.get(dirname, ())
+    return [
+        os.path.join(dirname, filename)
+        for filename in sorted(fnmatch.filter(filenames, filename_pattern))
+    ]
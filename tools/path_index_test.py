@@ -0,0 +1,94 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.path_index."""
+
+import os
+from unittest import mock
+
+import tensorflow as tf
+import filesystem_utils
+import path_index
+
+
+class DocumentationPathIndexTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.root_dir = self.create_tempdir().full_path
+    self.file_paths = [
+        os.path.join(self.root_dir, *p)
+        for p in [("google", "google.md"), ("google", "models", "bert", "1.md"),
+                  ("google", "models", "bert", "2.md"),
+                  ("google", "models", "bert", "lite", "1.md")]
+    ]
+    for file_path in self.file_paths:
+      self.create_tempfile(file_path)
+
+  def test_from_dir_contains_all_files(self):
+    index = path_index.DocumentationPathIndex.from_dir(self.root_dir)
+
+    self.assertLen(index, 4)
+    self.assertCountEqual(list(index), self.file_paths)
+
+  def test_iter_relative_paths(self):
+    index = path_index.DocumentationPathIndex(
+        self.root_dir, self.file_paths + [os.path.join(self.root_dir, "a.md")])
+
+    self.assertCountEqual(
+        list(index.iter_relative_paths()),
+        [os.path.relpath(p, self.root_dir) for p in index])
+    self.assertIn("a.md", list(index.iter_relative_paths()))
+
+  def test_add_ignores_duplicates(self):
+    index = path_index.DocumentationPathIndex(self.root_dir)
+    index.add(self.file_paths[0])
+    index.add(self.file_paths[0])
+
+    self.assertLen(index, 1)
+
+  def test_exists(self):
+    index = path_index.DocumentationPathIndex(self.root_dir, self.file_paths)
+
+    self.assertTrue(index.exists(self.file_paths[1]))
+    self.assertFalse(
+        index.exists(os.path.join(self.root_dir, "google", "bert", "1.md")))
+
+  def test_glob_without_wildcard(self):
+    index = path_index.DocumentationPathIndex(self.root_dir, self.file_paths)
+
+    self.assertEqual(index.glob(self.file_paths[0]), [self.file_paths[0]])
+    self.assertEmpty(index.glob(os.path.join(self.root_dir, "other.md")))
+
+  def test_glob_with_wildcard_version_does_not_access_filesystem(self):
+    index = path_index.DocumentationPathIndex(self.root_dir, self.file_paths)
+
+    with mock.patch.object(filesystem_utils, "glob") as mock_glob:
+      paths = index.glob(
+          os.path.join(self.root_dir, "google", "models", "bert", "*.md"))
+      mock_glob.assert_not_called()
+    self.assertEqual(paths, self.file_paths[1:3])
+
+  def test_glob_outside_of_root_dir_uses_filesystem(self):
+    index = path_index.DocumentationPathIndex(
+        os.path.join(self.root_dir, "google", "models"), self.file_paths[1:])
+
+    self.assertEqual(
+        index.glob(os.path.join(self.root_dir, "*", "google.md")),
+        [self.file_paths[0]])
+    self.assertTrue(index.exists(self.file_paths[0]))
+
+
+if __name__ == "__main__":
+  tf.test.main()
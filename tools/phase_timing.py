@@ -0,0 +1,161 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Timing of the phases of validating documentation files.
+
+A PhaseTimer measures the phases of one file with a monotonic clock. The
+durations of all files are aggregated per phase and document type by
+PhaseTimings, which renders them as a table or JSON at the end of a run.
+Timing is switched off by using DISABLED_PHASE_TIMER, whose phases cost no more
+than entering an empty context manager. While tracing is on, each phase of a
+PhaseTimer is recorded as a span of the timeline as well.
+"""
+
+import collections
+import contextlib
+import json
+import time
+from typing import Callable, ContextManager, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import attr
+import tracing
+
+# Type name of files whose first line could not be parsed.
+UNKNOWN_TYPE_NAME = "unknown"
+
+
+class PhaseTimer:
+  """Measures the time spent in each phase of validating one file."""
+
+  def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+    self._clock = clock
+    self.seconds_by_phase: Dict[str, float] = dict()
+
+  @contextlib.contextmanager
+  def _time_phase(self, phase: str) -> Iterator[None]:
+    start_time = self._clock()
+    try:
+      with tracing.span(phase, "phase"):
+        yield
+    finally:
+      self.seconds_by_phase[phase] = (
+          self.seconds_by_phase.get(phase, 0.0) + self._clock() - start_time)
+
+  def phase(self, phase: str) -> ContextManager[None]:
+    """Returns a context manager that adds its duration to the given phase."""
+    return self._time_phase(phase)
+
+  def reset(self) -> None:
+    """Starts timing another file without changing the previous durations."""
+    self.seconds_by_phase = dict()
+
+
+class _DisabledPhaseTimer(PhaseTimer):
+  """PhaseTimer that does not measure anything."""
+
+  _NULL_CONTEXT = contextlib.nullcontext()
+
+  def phase(self, phase: str) -> ContextManager[None]:
+    return self._NULL_CONTEXT
+
+  def reset(self) -> None:
+    pass
+
+
+DISABLED_PHASE_TIMER = _DisabledPhaseTimer()
+
+
+@attr.s(auto_attribs=True)
+class PhaseStatistics:
+  """Aggregated durations of one phase of one document type.
+
+  Attributes:
+    phase: Name of the phase, e.g. "metadata".
+    type_name: ParsingPolicy.type_name of the documents.
+    count: Number of files that went through the phase.
+    total_seconds: Sum of the durations.
+    max_seconds: Longest duration of a single file.
+  """
+  phase: str
+  type_name: str
+  count: int = 0
+  total_seconds: float = 0.0
+  max_seconds: float = 0.0
+
+
+class PhaseTimings:
+  """Aggregates the phase durations of many files per phase and type."""
+
+  def __init__(self) -> None:
+    self._statistics: Dict[Tuple[str, str], PhaseStatistics] = dict()
+
+  def add(self, type_name: Optional[str],
+          seconds_by_phase: Mapping[str, float]) -> None:
+    """Adds the phase durations of one file.
+
+    Args:
+      type_name: Type of the document or None if it is unknown.
+      seconds_by_phase: PhaseTimer.seconds_by_phase of the file.
+    """
+    type_name = type_name or UNKNOWN_TYPE_NAME
+    for phase, seconds in seconds_by_phase.items():
+      statistics = self._statistics.get((phase, type_name))
+      if statistics is None:
+        statistics = PhaseStatistics(phase, type_name)
+        self._statistics[(phase, type_name)] = statistics
+      statistics.count += 1
+      statistics.total_seconds += seconds
+      statistics.max_seconds = max(statistics.max_seconds, seconds)
+
+  @property
+  def statistics(self) -> List[PhaseStatistics]:
+    """Returns the statistics sorted by descending total duration."""
+    return sorted(
+        self._statistics.values(),
+        key=lambda s: (-s.total_seconds, s.phase, s.type_name))
+
+  def get_seconds_by_phase(self) -> Dict[str, float]:
+    """Returns the total duration of each phase over all types."""
+    seconds_by_phase = collections.defaultdict(float)
+    for statistics in self._statistics.values():
+      seconds_by_phase[statistics.phase] += statistics.total_seconds
+    return dict(seconds_by_phase)
+
+  def format_table(self) -> str:
+    """Returns a table of the statistics, slowest phase first."""
+    total_seconds = sum(s.total_seconds for s in self._statistics.values())
+    rows = [("Phase", "Type", "Files", "Total s", "Mean ms", "Max ms", "Share")]
+    for s in self.statistics:
+      rows.append(
+          (s.phase, s.type_name, str(s.count), f"{s.total_seconds:.3f}",
+           f"{1000 * s.total_seconds / s.count:.3f}",
+           f"{1000 * s.max_seconds:.3f}",
+           f"{100 * s.total_seconds / (total_seconds or 1):.1f}%"))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+      # Names are left-aligned and numbers right-aligned.
+      cells = [cell.ljust(width) for cell, width in zip(row[:2], widths)]
+      cells += [cell.rjust(width) for cell, width in zip(row[2:], widths[2:])]
+      lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+  def save(self, path: str) -> None:
+    """Writes the statistics to a local JSON file."""
+    content = {
+        "seconds_by_phase": self.get_seconds_by_phase(),
+        "statistics": [attr.asdict(s) for s in self.statistics]
+    }
+    with open(path, "w") as f:
+      json.dump(content, f, indent=2, sort_keys=True)
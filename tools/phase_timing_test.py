@@ -0,0 +1,108 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.phase_timing."""
+
+import itertools
+import json
+import os
+
+import tensorflow as tf
+import phase_timing
+
+
+class PhaseTimingTest(tf.test.TestCase):
+
+  def test_timer_adds_up_durations_per_phase(self):
+    # Each phase takes one clock tick.
+    timer = phase_timing.PhaseTimer(clock=itertools.count().__next__)
+
+    with timer.phase("tags"):
+      pass
+    with timer.phase("asset"):
+      pass
+    with self.assertRaises(ValueError):
+      with timer.phase("tags"):
+        raise ValueError()
+
+    self.assertEqual(timer.seconds_by_phase, {"tags": 2, "asset": 1})
+
+  def test_reset_keeps_previous_durations(self):
+    timer = phase_timing.PhaseTimer(clock=itertools.count().__next__)
+    with timer.phase("tags"):
+      pass
+    seconds_by_phase = timer.seconds_by_phase
+
+    timer.reset()
+    with timer.phase("asset"):
+      pass
+
+    self.assertEqual(seconds_by_phase, {"tags": 1})
+    self.assertEqual(timer.seconds_by_phase, {"asset": 1})
+
+  def test_disabled_timer_does_not_measure(self):
+    with phase_timing.DISABLED_PHASE_TIMER.phase("tags"):
+      pass
+
+    self.assertEmpty(phase_timing.DISABLED_PHASE_TIMER.seconds_by_phase)
+
+  def test_timings_are_aggregated_per_phase_and_type(self):
+    timings = phase_timing.PhaseTimings()
+
+    timings.add("Module", {"tags": 1.0, "asset": 3.0})
+    timings.add("Module", {"tags": 2.0})
+    timings.add("Lite", {"tags": 0.5})
+    timings.add(None, {"handle": 0.25})
+
+    self.assertEqual(timings.statistics, [
+        phase_timing.PhaseStatistics("asset", "Module", 1, 3.0, 3.0),
+        phase_timing.PhaseStatistics("tags", "Module", 2, 3.0, 2.0),
+        phase_timing.PhaseStatistics("tags", "Lite", 1, 0.5, 0.5),
+        phase_timing.PhaseStatistics("handle", "unknown", 1, 0.25, 0.25),
+    ])
+    self.assertEqual(timings.get_seconds_by_phase(), {
+        "tags": 3.5,
+        "asset": 3.0,
+        "handle": 0.25
+    })
+    table_lines = timings.format_table().splitlines()
+    self.assertLen(table_lines, 5)
+    self.assertRegex(table_lines[1],
+                     r"^asset +Module +1 +3.000 +3000.000 +3000.000 +44.4%$")
+
+  def test_save(self):
+    timings = phase_timing.PhaseTimings()
+    timings.add("Module", {"tags": 1.0})
+    path = os.path.join(self.create_tempdir().full_path, "timings.json")
+
+    timings.save(path)
+
+    with open(path) as f:
+      self.assertEqual(
+          json.load(f), {
+              "seconds_by_phase": {
+                  "tags": 1.0
+              },
+              "statistics": [{
+                  "phase": "tags",
+                  "type_name": "Module",
+                  "count": 1,
+                  "total_seconds": 1.0,
+                  "max_seconds": 1.0
+              }]
+          })
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -0,0 +1,205 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""cProfile and tracemalloc hooks for the validator commands.
+
+RunProfiler wraps a whole run and writes, to an output directory:
+  NAME.pstats: cProfile statistics, e.g. for `python -m pstats` or snakeviz.
+  NAME.tracemalloc: tracemalloc snapshot, e.g. for Snapshot.load().
+  NAME.allocations.txt: the lines that allocated the most memory.
+
+RunProfiler only covers the process it runs in, not its worker processes.
+
+SlowestFilesProfiler profiles each file on its own, also in worker processes,
+and only keeps the statistics of the slowest files under
+OUTPUT_DIR/slowest_files. It cannot be combined with a RunProfiler that
+profiles, since only one profiler can be active at a time.
+"""
+
+import cProfile
+import heapq
+import os
+import threading
+import time
+import tracemalloc
+from typing import AbstractSet, Callable, List, Optional, Tuple, TypeVar
+
+from absl import logging
+
+DEFAULT_NUM_TOP_ALLOCATIONS = 25
+# Number of frames stored per allocation, which allows grouping the top
+# allocations by their callers in the saved snapshot.
+_TRACEMALLOC_FRAMES = 10
+SLOWEST_FILES_DIR = "slowest_files"
+
+_T = TypeVar("_T")
+
+
+class RunProfiler:
+  """Context manager that profiles the time and memory of a run."""
+
+  def __init__(self,
+               output_dir: str,
+               name: str,
+               profile: bool = False,
+               trace_memory: bool = False,
+               num_top_allocations: int = DEFAULT_NUM_TOP_ALLOCATIONS) -> None:
+    """Initializes the profiler.
+
+    Args:
+      output_dir: Local directory to which the results are written. It is
+        created if it does not exist.
+      name: Prefix of the written files, e.g. "validator".
+      profile: Whether to profile the run with cProfile.
+      trace_memory: Whether to trace memory allocations with tracemalloc.
+      num_top_allocations: Number of lines that allocated the most memory to
+        write.
+    """
+    self._output_dir = output_dir
+    self._name = name
+    self._profiler = cProfile.Profile() if profile else None
+    self._trace_memory = trace_memory
+    self._num_top_allocations = num_top_allocations
+
+  def _get_path(self, suffix: str) -> str:
+    return os.path.join(self._output_dir, f"{self._name}{suffix}")
+
+  def __enter__(self) -> "RunProfiler":
+    if self._profiler is not None or self._trace_memory:
+      os.makedirs(self._output_dir, exist_ok=True)
+    if self._trace_memory:
+      tracemalloc.start(_TRACEMALLOC_FRAMES)
+    if self._profiler is not None:
+      self._profiler.enable()
+    return self
+
+  def __exit__(self, *args) -> None:
+    # The results are written even if the run failed, e.g. with validation
+    # errors.
+    if self._profiler is not None:
+      self._profiler.disable()
+      self._profiler.dump_stats(self._get_path(".pstats"))
+      logging.info("Wrote the profile to %s.", self._get_path(".pstats"))
+    if self._trace_memory:
+      snapshot = tracemalloc.take_snapshot()
+      _, peak_size = tracemalloc.get_traced_memory()
+      tracemalloc.stop()
+      snapshot.dump(self._get_path(".tracemalloc"))
+      with open(self._get_path(".allocations.txt"), "w") as f:
+        f.write(f"Peak traced memory: {peak_size / 1024**2:.1f} MiB\n")
+        f.write(f"Top {self._num_top_allocations} lines by allocated memory "
+                "at the end of the run:\n")
+        for statistic in snapshot.statistics(
+            "lineno")[:self._num_top_allocations]:
+          f.write(f"{statistic}\n")
+      logging.info("Wrote the memory allocations to %s.",
+                   self._get_path(".allocations.txt"))
+
+
+def get_file_profile_path(output_dir: str, file_path: str) -> str:
+  """Returns the path of the statistics of a file relative to `assets/docs`."""
+  return os.path.join(output_dir, SLOWEST_FILES_DIR,
+                      file_path.replace(os.sep, "__") + ".pstats")
+
+
+class SlowestFilesProfiler:
+  """Profiles files one by one and keeps the statistics of the slowest.
+
+  Files are written as soon as they are among the slowest files seen by this
+  profiler and deleted when they are displaced, so that profilers in several
+  processes can share an output directory. The caller removes the files that
+  are not among the slowest of all processes with prune_files(), which it has
+  to rank by the durations returned by profile() to agree with the profilers.
+  """
+
+  def __init__(self, output_dir: str, num_files: int) -> None:
+    self._output_dir = output_dir
+    self._num_files = num_files
+    self._lock = threading.Lock()
+    # Min-heap of the (duration, file_path) of the slowest files so far.
+    self._slowest_files: List[Tuple[float, str]] = []
+    os.makedirs(os.path.join(output_dir, SLOWEST_FILES_DIR), exist_ok=True)
+
+  def profile(self, file_path: str,
+              function: Callable[[], _T]) -> Tuple[_T, Optional[float]]:
+    """Profiles `function` for `file_path`.
+
+    Args:
+      file_path: Path of the profiled file relative to `assets/docs`.
+      function: Function that validates the file.
+
+    Returns:
+      The result of `function` and the duration by which the file was ranked
+      among the slowest files, or None if it could not be profiled. If
+      `function` raises an error, the file is ranked all the same.
+    """
+    profiler = cProfile.Profile()
+    try:
+      profiler.enable()
+    except ValueError:
+      # Since Python 3.12 only one profiler can be active at a time, which
+      # rules out profiling files in several threads.
+      return function(), None
+    start_time = time.perf_counter()
+    try:
+      result = function()
+    finally:
+      profiler.disable()
+      # The duration is taken before the statistics are written so that it
+      # only covers `function`.
+      duration = time.perf_counter() - start_time
+      self._add(file_path, duration, profiler)
+    return result, duration
+
+  def _add(self, file_path: str, duration: float,
+           profiler: cProfile.Profile) -> None:
+    with self._lock:
+      if len(self._slowest_files) < self._num_files:
+        heapq.heappush(self._slowest_files, (duration, file_path))
+      elif duration > self._slowest_files[0][0]:
+        _, displaced_file_path = heapq.heappushpop(self._slowest_files,
+                                                   (duration, file_path))
+        os.remove(get_file_profile_path(self._output_dir, displaced_file_path))
+      else:
+        return
+      profiler.dump_stats(get_file_profile_path(self._output_dir, file_path))
+
+
+def prune_files(output_dir: str, slowest_files: AbstractSet[str]) -> None:
+  """Removes the statistics of all but the slowest files of a run.
+
+  Args:
+    output_dir: Output directory of the SlowestFilesProfilers of the run.
+    slowest_files: Paths of the slowest files of all processes relative to the
+      `assets/docs` directory.
+  """
+  path_by_file = {
+      file_path: get_file_profile_path(output_dir, file_path)
+      for file_path in slowest_files
+  }
+  kept_paths = set(path_by_file.values())
+  profile_dir = os.path.join(output_dir, SLOWEST_FILES_DIR)
+  for file_name in os.listdir(profile_dir):
+    path = os.path.join(profile_dir, file_name)
+    if path not in kept_paths:
+      os.remove(path)
+  profiled_files = sorted(
+      file_path for file_path, path in path_by_file.items()
+      if os.path.exists(path))
+  missing_files = sorted(set(slowest_files) - set(profiled_files))
+  if missing_files:
+    logging.warning("Found no profiles of the slowest files %s.",
+                    missing_files)
+  logging.info("Wrote the profiles of the %d slowest files to %s: %s",
+               len(profiled_files), profile_dir, profiled_files)
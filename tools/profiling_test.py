@@ -0,0 +1,102 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.profiling."""
+
+import os
+import pstats
+import time
+import tracemalloc
+from unittest import mock
+
+import tensorflow as tf
+import profiling
+
+
+def _allocate_lists():
+  return [list(range(100)) for _ in range(100)]
+
+
+class ProfilingTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.output_dir = os.path.join(self.create_tempdir().full_path, "profiles")
+
+  def test_run_profiler_writes_profile_and_allocations(self):
+    with profiling.RunProfiler(
+        self.output_dir, "run", profile=True, trace_memory=True):
+      lists = _allocate_lists()
+
+    self.assertLen(lists, 100)
+    self.assertFalse(tracemalloc.is_tracing())
+    self.assertCountEqual(
+        os.listdir(self.output_dir),
+        ["run.pstats", "run.tracemalloc", "run.allocations.txt"])
+    function_names = [
+        function_name for _, _, function_name in pstats.Stats(
+            os.path.join(self.output_dir, "run.pstats")).stats
+    ]
+    self.assertIn("_allocate_lists", function_names)
+    with open(os.path.join(self.output_dir, "run.allocations.txt")) as f:
+      self.assertIn("profiling_test.py", f.read())
+
+  def test_run_profiler_writes_nothing_if_disabled(self):
+    with profiling.RunProfiler(self.output_dir, "run"):
+      _allocate_lists()
+
+    self.assertFalse(os.path.exists(self.output_dir))
+
+  def test_slowest_files_are_kept(self):
+    profiler = profiling.SlowestFilesProfiler(self.output_dir, 2)
+    durations = {"a/a.md": 0.03, "b/b.md": 0.0, "c/c.md": 0.06, "d/d.md": 0.0}
+
+    for file_path, duration in durations.items():
+      result, profiled_duration = profiler.profile(
+          file_path, lambda d=duration: time.sleep(d) or file_path)
+      self.assertEqual(result, file_path)
+      self.assertGreaterEqual(profiled_duration, duration)
+
+    self.assertCountEqual(
+        os.listdir(os.path.join(self.output_dir, profiling.SLOWEST_FILES_DIR)),
+        ["a__a.md.pstats", "c__c.md.pstats"])
+
+  def test_prune_files(self):
+    profiler = profiling.SlowestFilesProfiler(self.output_dir, 2)
+    for file_path in ["a.md", "b.md"]:
+      profiler.profile(file_path, lambda: None)
+
+    profiling.prune_files(self.output_dir, {"b.md", "c.md"})
+
+    self.assertEqual(
+        os.listdir(os.path.join(self.output_dir, profiling.SLOWEST_FILES_DIR)),
+        ["b.md.pstats"])
+
+  def test_prune_files_warns_about_missing_profiles(self):
+    profiler = profiling.SlowestFilesProfiler(self.output_dir, 1)
+    profiler.profile("a.md", lambda: None)
+
+    with mock.patch.object(profiling.logging, "warning") as mock_warning:
+      with mock.patch.object(profiling.logging, "info") as mock_info:
+        profiling.prune_files(self.output_dir, {"a.md", "b.md"})
+
+    mock_warning.assert_called_once_with(
+        "Found no profiles of the slowest files %s.", ["b.md"])
+    mock_info.assert_called_once_with(
+        "Wrote the profiles of the %d slowest files to %s: %s", 1,
+        os.path.join(self.output_dir, profiling.SLOWEST_FILES_DIR), ["a.md"])
+
+
+if __name__ == "__main__":
+  tf.test.main()
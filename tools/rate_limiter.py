@@ -0,0 +1,99 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Thread-safe token bucket rate limiting of requests per host."""
+
+import threading
+import time
+from typing import Callable, Dict
+import urllib.parse
+
+
+class TokenBucket:
+  """Token bucket that lets callers wait until they may send a request.
+
+  The bucket holds up to `capacity` tokens and is refilled with `rate` tokens
+  per second. Each request takes one token. If no token is left, the caller
+  reserves the next token and sleeps until it is refilled, so concurrent
+  callers are served in the order in which they arrived.
+  """
+
+  def __init__(self,
+               rate: float,
+               capacity: float,
+               clock: Callable[[], float] = time.monotonic,
+               sleep: Callable[[float], None] = time.sleep) -> None:
+    """Initializes a full bucket.
+
+    Args:
+      rate: Number of tokens that are added per second.
+      capacity: Maximum number of tokens, which is the size of a burst of
+        requests that are sent without waiting.
+      clock: Returns the current time in seconds. Overridden in tests.
+      sleep: Sleeps for the given number of seconds. Overridden in tests.
+    """
+    if rate <= 0 or capacity < 1:
+      raise ValueError("The rate must be positive and the capacity at least 1 "
+                       f"but were {rate} and {capacity}.")
+    self._rate = rate
+    self._capacity = capacity
+    self._clock = clock
+    self._sleep = sleep
+    self._lock = threading.Lock()
+    self._tokens = capacity
+    self._updated = clock()
+
+  def acquire(self) -> float:
+    """Takes a token, waits until it is available and returns the wait time."""
+    with self._lock:
+      now = self._clock()
+      self._tokens = min(self._capacity,
+                         self._tokens + (now - self._updated) * self._rate)
+      self._updated = now
+      self._tokens -= 1
+      wait_seconds = max(0.0, -self._tokens / self._rate)
+    if wait_seconds > 0:
+      self._sleep(wait_seconds)
+    return wait_seconds
+
+
+class HostRateLimiter:
+  """Limits the rate of requests to each host with a separate TokenBucket."""
+
+  def __init__(self,
+               rate: float,
+               capacity: float,
+               clock: Callable[[], float] = time.monotonic,
+               sleep: Callable[[float], None] = time.sleep) -> None:
+    """Initializes the limiter with the arguments of each TokenBucket."""
+    self._bucket_args = (rate, capacity, clock, sleep)
+    self._lock = threading.Lock()
+    self._bucket_by_host: Dict[str, TokenBucket] = dict()
+
+  def acquire(self, url: str) -> float:
+    """Waits until a request to the host of `url` may be sent.
+
+    Args:
+      url: URL that is going to be requested. URLs without a host like local
+        paths share one bucket.
+
+    Returns:
+      The number of seconds that the caller waited.
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    with self._lock:
+      if host not in self._bucket_by_host:
+        self._bucket_by_host[host] = TokenBucket(*self._bucket_args)
+      bucket = self._bucket_by_host[host]
+    return bucket.acquire()
@@ -0,0 +1,80 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.rate_limiter."""
+
+import tensorflow as tf
+import rate_limiter
+
+
+class _FakeClock:
+  """Clock that only advances when sleeping."""
+
+  def __init__(self) -> None:
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+  def sleep(self, seconds: float) -> None:
+    self.now += seconds
+
+
+class TokenBucketTest(tf.test.TestCase):
+
+  def test_burst_does_not_wait(self):
+    clock = _FakeClock()
+    bucket = rate_limiter.TokenBucket(
+        rate=0.2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+
+  def test_waits_for_refill_after_burst(self):
+    clock = _FakeClock()
+    bucket = rate_limiter.TokenBucket(
+        rate=0.2, capacity=1, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(3)]
+
+    self.assertAllClose(waits, [0.0, 5.0, 5.0])
+    self.assertAllClose(clock.now, 10.0)
+
+  def test_tokens_are_refilled_while_idle(self):
+    clock = _FakeClock()
+    bucket = rate_limiter.TokenBucket(
+        rate=0.2, capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    clock.now += 3.0
+
+    self.assertAllClose(bucket.acquire(), 2.0)
+
+  def test_invalid_rate_raises_error(self):
+    with self.assertRaisesRegex(ValueError, "rate must be positive"):
+      rate_limiter.TokenBucket(rate=0, capacity=1)
+
+
+class HostRateLimiterTest(tf.test.TestCase):
+
+  def test_hosts_are_limited_separately(self):
+    clock = _FakeClock()
+    limiter = rate_limiter.HostRateLimiter(
+        rate=0.2, capacity=1, clock=clock, sleep=clock.sleep)
+
+    self.assertEqual(limiter.acquire("https://a.com/model_1.tar.gz"), 0.0)
+    self.assertEqual(limiter.acquire("https://b.com/model_1.tar.gz"), 0.0)
+    self.assertAllClose(limiter.acquire("https://a.com/model_2.tar.gz"), 5.0)
+
+
+if __name__ == "__main__":
+  tf.test.main()
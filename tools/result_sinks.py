@@ -0,0 +1,226 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Sinks to which the result of each validated file is streamed.
+
+Each result is written as soon as its file is validated, so that long runs
+report errors early and no sink holds more than one result in memory. The
+sinks write JSON Lines, SARIF for code scanning tools and GitHub Actions
+workflow commands, which annotate the invalid files of a pull request.
+"""
+
+import abc
+import json
+import os
+from typing import IO, Any, Dict, List, Optional
+
+import attr
+
+STATUS_VALID = "valid"
+STATUS_INVALID = "invalid"
+STATUS_CACHED = "cached"
+
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_RULE_ID = "invalid-documentation"
+_TOOL_NAME = "tfhub.dev validator"
+_TOOL_URI = "https://github.com/tensorflow/tfhub.dev"
+
+
+@attr.s(auto_attribs=True)
+class FileResult:
+  """Outcome of validating a single documentation file.
+
+  Attributes:
+    file_path: Path of the file relative to the `assets/docs` directory.
+    error: The error message if the validation failed, None otherwise.
+    publisher: Publisher of the document if its first line could be parsed.
+    type_name: ParsingPolicy.type_name if the first line could be parsed.
+    duration_seconds: Time spent validating the file.
+    profiled_seconds: Time spent validating the file by which it was ranked
+      among the slowest files if it was profiled, None otherwise.
+    cached: Whether the file was skipped since it is unchanged since its last
+      successful validation.
+    phase_seconds: Time spent in each phase of the validation if the phases
+      were timed.
+    trace_events: Trace events recorded by a worker process while tracing is
+      on, which are added to the trace of the parent process.
+  """
+  file_path: str
+  error: Optional[str] = None
+  publisher: Optional[str] = None
+  type_name: Optional[str] = None
+  duration_seconds: float = 0.0
+  profiled_seconds: Optional[float] = None
+  cached: bool = False
+  phase_seconds: Optional[Dict[str, float]] = None
+  trace_events: Optional[List[Dict[str, Any]]] = None
+
+  @property
+  def status(self) -> str:
+    if self.cached:
+      return STATUS_CACHED
+    return STATUS_VALID if self.error is None else STATUS_INVALID
+
+
+class ResultSink(abc.ABC):
+  """Receives the result of each file of a validation run.
+
+  Sinks write to a stream owned by the caller and flush after each result so
+  that the output can be followed while the run is in progress.
+  """
+
+  def __init__(self, stream: IO[str]) -> None:
+    self._stream = stream
+
+  @abc.abstractmethod
+  def write(self, result: FileResult) -> None:
+    """Writes the result of one file."""
+
+  def close(self) -> None:
+    """Completes the output after the last result without closing the stream."""
+    self._stream.flush()
+
+  def __enter__(self) -> "ResultSink":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+
+class JsonLinesSink(ResultSink):
+  """Writes one JSON object with the status of each file per line."""
+
+  def write(self, result: FileResult) -> None:
+    self._stream.write(
+        json.dumps({
+            "file_path": result.file_path,
+            "status": result.status,
+            "error": result.error,
+            "publisher": result.publisher,
+            "type_name": result.type_name,
+            "duration_seconds": round(result.duration_seconds, 6),
+            "phase_seconds": result.phase_seconds
+        }) + "\n")
+    self._stream.flush()
+
+
+class SarifSink(ResultSink):
+  """Writes the invalid files as the results of a SARIF 2.1.0 log.
+
+  The log is a single JSON document, which is streamed by writing its header
+  before the first result and its closing brackets on close().
+  """
+
+  def __init__(self, stream: IO[str], docs_path: str) -> None:
+    """Initializes the sink.
+
+    Args:
+      stream: Stream to which the log is written.
+      docs_path: Path of the `assets/docs` directory relative to the
+        repository root, against which code scanning tools resolve locations.
+    """
+    super().__init__(stream)
+    self._docs_path = docs_path
+    self._num_results = 0
+    self._closed = False
+    header = json.dumps({
+        "$schema": _SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": _TOOL_NAME,
+                    "informationUri": _TOOL_URI,
+                    "rules": [{
+                        "id": _SARIF_RULE_ID,
+                        "shortDescription": {
+                            "text": "Invalid Markdown documentation."
+                        }
+                    }]
+                }
+            },
+            "results": []
+        }]
+    })
+    # Everything up to the results is written now, the rest on close().
+    self._stream.write(header[:-len("]}]}")])
+
+  def write(self, result: FileResult) -> None:
+    if result.error is None:
+      return
+    if self._num_results:
+      self._stream.write(",")
+    self._stream.write("\n" + json.dumps({
+        "ruleId": _SARIF_RULE_ID,
+        "level": "error",
+        "message": {
+            "text": result.error
+        },
+        "locations": [{
+            "physicalLocation": {
+                "artifactLocation": {
+                    "uri": os.path.join(self._docs_path, result.file_path),
+                    "uriBaseId": "%SRCROOT%"
+                },
+                "region": {
+                    "startLine": 1
+                }
+            }
+        }]
+    }))
+    self._num_results += 1
+    self._stream.flush()
+
+  def close(self) -> None:
+    if not self._closed:
+      self._closed = True
+      self._stream.write("]}]}\n")
+    super().close()
+
+
+def _escape_workflow_command_data(value: str) -> str:
+  return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _escape_workflow_command_property(value: str) -> str:
+  return _escape_workflow_command_data(value).replace(":", "%3A").replace(
+      ",", "%2C")
+
+
+class GitHubAnnotationSink(ResultSink):
+  """Writes an error workflow command for each invalid file.
+
+  When written to the output of a GitHub Actions step, each command shows the
+  error as an annotation of the file in the pull request.
+  """
+
+  def __init__(self, stream: IO[str], docs_path: str) -> None:
+    """Initializes the sink.
+
+    Args:
+      stream: Stream to which the workflow commands are written.
+      docs_path: Path of the `assets/docs` directory relative to the
+        repository root.
+    """
+    super().__init__(stream)
+    self._docs_path = docs_path
+
+  def write(self, result: FileResult) -> None:
+    if result.error is None:
+      return
+    file_path = _escape_workflow_command_property(
+        os.path.join(self._docs_path, result.file_path))
+    self._stream.write(f"::error file={file_path},title=Invalid documentation"
+                       f"::{_escape_workflow_command_data(result.error)}\n")
+    self._stream.flush()
@@ -0,0 +1,98 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.result_sinks."""
+
+import io
+import json
+
+from absl.testing import parameterized
+import tensorflow as tf
+import result_sinks
+
+_VALID_RESULT = result_sinks.FileResult(
+    "google/models/bert/1.md",
+    publisher="google",
+    type_name="Module",
+    duration_seconds=0.25)
+_INVALID_RESULT = result_sinks.FileResult(
+    "google/models/albert/1.md",
+    error="Missing 'asset-path' tag.\nSecond line: 100%, done.",
+    publisher="google",
+    type_name="Module")
+_CACHED_RESULT = result_sinks.FileResult(
+    "google/google.md", cached=True)
+
+
+class ResultSinksTest(parameterized.TestCase, tf.test.TestCase):
+
+  def test_json_lines_sink_writes_every_result(self):
+    stream = io.StringIO()
+
+    with result_sinks.JsonLinesSink(stream) as sink:
+      sink.write(_VALID_RESULT)
+      sink.write(_INVALID_RESULT)
+      sink.write(_CACHED_RESULT)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    self.assertEqual([record["status"] for record in records],
+                     ["valid", "invalid", "cached"])
+    self.assertEqual(
+        records[0], {
+            "file_path": "google/models/bert/1.md",
+            "status": "valid",
+            "error": None,
+            "publisher": "google",
+            "type_name": "Module",
+            "duration_seconds": 0.25,
+            "phase_seconds": None
+        })
+    self.assertEqual(records[1]["error"], _INVALID_RESULT.error)
+
+  @parameterized.parameters(([],), ([_VALID_RESULT],),
+                            ([_INVALID_RESULT, _VALID_RESULT, _INVALID_RESULT],))
+  def test_sarif_sink_writes_log_of_invalid_files(self, results):
+    stream = io.StringIO()
+
+    with result_sinks.SarifSink(stream, "assets/docs") as sink:
+      for result in results:
+        sink.write(result)
+
+    log = json.loads(stream.getvalue())
+    self.assertEqual(log["version"], "2.1.0")
+    sarif_results = log["runs"][0]["results"]
+    self.assertLen(sarif_results,
+                   sum(result.error is not None for result in results))
+    for sarif_result in sarif_results:
+      self.assertEqual(sarif_result["message"]["text"], _INVALID_RESULT.error)
+      self.assertEqual(
+          sarif_result["locations"][0]["physicalLocation"]["artifactLocation"]
+          ["uri"], "assets/docs/google/models/albert/1.md")
+
+  def test_github_annotation_sink_escapes_error(self):
+    stream = io.StringIO()
+
+    with result_sinks.GitHubAnnotationSink(stream, "assets/docs") as sink:
+      sink.write(_VALID_RESULT)
+      sink.write(_INVALID_RESULT)
+
+    self.assertEqual(
+        stream.getvalue(),
+        "::error file=assets/docs/google/models/albert/1.md,title=Invalid "
+        "documentation::Missing 'asset-path' tag.%0ASecond line: 100%25, "
+        "done.\n")
+
+
+if __name__ == "__main__":
+  tf.test.main()
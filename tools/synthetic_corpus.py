@@ -0,0 +1,242 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Generator of synthetic documentation trees for benchmarking the validator.
+
+The generated `assets/docs` directory mirrors the mix of the real one: about
+64% SavedModels with up to three versions each, TF Lite and TF.js variants of
+a fifth of them, placeholders, collections with many links and a page per
+publisher. Tag values are drawn from the YAML files under `tags`, which are
+copied next to the documents, so every generated file is valid.
+"""
+
+import collections
+import os
+import random
+import shutil
+from typing import Dict, List, Mapping, Sequence
+
+import validator
+import yaml
+import yaml_parser as yaml_parser_lib
+
+DEFAULT_MODELS_PER_PUBLISHER = 50
+DEFAULT_LINKS_PER_COLLECTION = 100
+
+# Fractions of the steps of the generator that write a placeholder or a
+# collection. All other steps write a model with all its versions and variants,
+# about 2.8 documents, so that placeholders make up about 6.5% and collections
+# about 2% of the documents like in the real corpus.
+_PLACEHOLDER_FRACTION = 0.16
+_COLLECTION_FRACTION = 0.045
+# Probability that a SavedModel version has a TF Lite or TF.js variant.
+_VARIANT_PROBABILITY = 0.2
+_MAX_VERSIONS = 3
+# Probability that an optional tag is set.
+_OPTIONAL_TAG_PROBABILITY = 0.5
+# Collections link to models from a window of the most recent models so that
+# generating a million documents does not hold all handles in memory.
+_LINKABLE_MODELS = 10000
+_TASK_PREFIXES = ("image-", "text-", "audio-", "video-")
+
+
+def _load_tag_values(root_dir: str) -> Dict[str, List[str]]:
+  """Returns the IDs of all enumerable tags defined under `root_dir/tags`."""
+  values_by_tag_name = dict()
+  for tag_name, relative_tag_file in yaml_parser_lib.TAG_TO_YAML_MAP.items():
+    with open(os.path.join(root_dir, relative_tag_file)) as f:
+      yaml_config = yaml.safe_load(f)
+    if "values" in yaml_config:
+      values_by_tag_name[tag_name] = [
+          value["id"] for value in yaml_config["values"]
+      ]
+  values_by_tag_name[validator.TASK_KEY] = [
+      task for task in values_by_tag_name[validator.TASK_KEY]
+      if task.startswith(_TASK_PREFIXES)
+  ]
+  return values_by_tag_name
+
+
+class _CorpusWriter:
+  """Writes up to a maximum number of documents and counts them by type."""
+
+  def __init__(self, documentation_dir: str, max_documents: int,
+               values_by_tag_name: Mapping[str, Sequence[str]],
+               rng: random.Random) -> None:
+    self._documentation_dir = documentation_dir
+    self._max_documents = max_documents
+    self.num_documents = 0
+    self._values_by_tag_name = values_by_tag_name
+    self._rng = rng
+    self.count_by_type: Dict[str, int] = collections.Counter()
+
+  def _get_tag_lines(self, required_tags: Sequence[str],
+                     optional_tags: Sequence[str]) -> List[str]:
+    tag_lines = []
+    for tag_name in required_tags:
+      tag_lines.append(self._get_tag_line(tag_name))
+    for tag_name in optional_tags:
+      if self._rng.random() < _OPTIONAL_TAG_PROBABILITY:
+        tag_lines.append(self._get_tag_line(tag_name))
+    return tag_lines
+
+  def _get_tag_line(self, tag_name: str) -> str:
+    value = self._rng.choice(self._values_by_tag_name[tag_name])
+    return f"<!-- {tag_name}: {value} -->"
+
+  def write(self, type_name: str, relative_path: str, handle: str,
+            tag_lines: Sequence[str], body: str) -> None:
+    """Writes a document with the given handle, tags and body if not full."""
+    if self.num_documents >= self._max_documents:
+      return
+    path = os.path.join(self._documentation_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+      f.write(f"# {type_name} {handle}\n"
+              f"Synthetic {type_name.lower()} {handle} for benchmarks.\n\n")
+      f.write("".join(f"{tag_line}\n" for tag_line in tag_lines))
+      f.write(f"\n## Overview\n\n{body}\n")
+    self.count_by_type[type_name] += 1
+    self.num_documents += 1
+
+  def write_publisher(self, publisher: str) -> None:
+    self.write(
+        "Publisher", f"{publisher}/{publisher}.md", publisher,
+        ["[![Icon URL]](https://www.gstatic.com/aihub/synthetic.png)"],
+        "A synthetic publisher.")
+
+  def write_saved_model(self, publisher: str, name: str, version: int) -> None:
+    tag_lines = [
+        f"<!-- asset-path: https://storage.googleapis.com/synthetic/"
+        f"{publisher}/{name}/{version}.tar.gz -->",
+        f"<!-- format: {self._rng.choice(validator.SAVED_MODEL_FORMATS)} -->",
+        f"<!-- fine-tunable: {self._rng.choice(['true', 'false'])} -->",
+    ]
+    tag_lines += self._get_tag_lines(
+        [validator.TASK_KEY],
+        [validator.ARCHITECTURE_KEY, validator.DATASET_KEY,
+         validator.LANGUAGE_KEY, validator.LICENSE_KEY])
+    self.write("Module", f"{publisher}/models/{name}/{version}.md",
+               f"{publisher}/{name}/{version}", tag_lines,
+               "A synthetic SavedModel.")
+
+  def write_variant(self, type_name: str, variant_dir: str, suffix: str,
+                    publisher: str, variant_name: str,
+                    parent_handle: str) -> None:
+    tag_lines = [
+        f"<!-- parent-model: {parent_handle} -->",
+        f"<!-- asset-path: https://storage.googleapis.com/synthetic/"
+        f"{publisher}/{variant_name}/{variant_dir}/1{suffix} -->",
+    ]
+    self.write(type_name,
+               f"{publisher}/models/{variant_name}/{variant_dir}/1.md",
+               f"{publisher}/{variant_name}/1", tag_lines,
+               f"A synthetic {type_name} variant of {parent_handle}.")
+
+  def write_placeholder(self, publisher: str, name: str) -> None:
+    tag_lines = self._get_tag_lines(
+        [validator.TASK_KEY],
+        [validator.ARCHITECTURE_KEY, validator.DATASET_KEY,
+         validator.LICENSE_KEY])
+    self.write("Placeholder", f"{publisher}/models/{name}/1.md",
+               f"{publisher}/{name}/1", tag_lines, "A synthetic placeholder.")
+
+  def write_collection(self, publisher: str, name: str,
+                       model_urls: Sequence[str]) -> None:
+    # Like real collections, the links are listed in a table and some of them
+    # are repeated in code samples.
+    table = "\n".join(f"| [{url}]({url}) |" for url in model_urls)
+    samples = "\n".join(f'hub.load("{url}")' for url in model_urls[::10])
+    self.write("Collection", f"{publisher}/collections/{name}/1.md",
+               f"{publisher}/{name}/1",
+               self._get_tag_lines([validator.TASK_KEY], []),
+               f"| Model |\n|-------|\n{table}\n\n```python\n{samples}\n```")
+
+
+def generate_corpus(
+    root_dir: str,
+    num_documents: int,
+    tags_root_dir: str,
+    seed: int = 0,
+    models_per_publisher: int = DEFAULT_MODELS_PER_PUBLISHER,
+    links_per_collection: int = DEFAULT_LINKS_PER_COLLECTION
+) -> Mapping[str, int]:
+  """Writes a synthetic corpus to `root_dir/assets/docs` and `root_dir/tags`.
+
+  Args:
+    root_dir: Directory in which the corpus is created. It must not contain
+      an `assets/docs` directory yet.
+    num_documents: Number of documentation files to write.
+    tags_root_dir: Root directory of the project whose `tags` directory is
+      copied and from which tag values are drawn.
+    seed: Seed of the random choices, which makes the corpus reproducible.
+    models_per_publisher: Average number of models per publisher.
+    links_per_collection: Maximum number of model links of each collection.
+
+  Returns:
+    The number of generated documents per type like "Module".
+
+  Raises:
+    FileExistsError: if `root_dir` already contains a documentation or tags
+      directory.
+  """
+  documentation_dir = os.path.join(root_dir, validator.DOCS_PATH)
+  os.makedirs(documentation_dir)
+  shutil.copytree(
+      os.path.join(tags_root_dir, "tags"), os.path.join(root_dir, "tags"))
+  rng = random.Random(seed)
+  writer = _CorpusWriter(documentation_dir, num_documents,
+                         _load_tag_values(tags_root_dir), rng)
+  num_publishers = max(1, num_documents // (models_per_publisher + 1))
+  publishers = [f"publisher-{i}" for i in range(num_publishers)]
+  for publisher in publishers:
+    writer.write_publisher(publisher)
+  linkable_model_urls = collections.deque(maxlen=_LINKABLE_MODELS)
+  step = 0
+  while writer.num_documents < num_documents:
+    step += 1
+    publisher = rng.choice(publishers)
+    name = f"model-{step}"
+    kind = rng.random()
+    if kind < _COLLECTION_FRACTION and linkable_model_urls:
+      writer.write_collection(
+          publisher, f"collection-{step}",
+          rng.sample(list(linkable_model_urls),
+                     min(links_per_collection, len(linkable_model_urls))))
+    elif kind < _COLLECTION_FRACTION + _PLACEHOLDER_FRACTION:
+      writer.write_placeholder(publisher, name)
+    else:
+      num_versions = rng.randint(1, _MAX_VERSIONS)
+      # Unversioned URLs have to be resolved to any version.
+      linkable_model_urls.append(f"https://tfhub.dev/{publisher}/{name}")
+      for version in range(1, num_versions + 1):
+        writer.write_saved_model(publisher, name, version)
+        linkable_model_urls.append(
+            f"https://tfhub.dev/{publisher}/{name}/{version}")
+        # Variants are named after their parent like in the real corpus, e.g.
+        # "google/imagenet/mobilenet_v2/3/default/1" for TF.js.
+        variant_name = f"{name}/{version}/default"
+        if rng.random() < _VARIANT_PROBABILITY:
+          writer.write_variant("Lite", "lite", validator.TFLITE_SUFFIX,
+                               publisher, variant_name,
+                               f"{publisher}/{name}/{version}")
+          linkable_model_urls.append(
+              f"https://tfhub.dev/{publisher}/lite-model/{variant_name}/1")
+        if rng.random() < _VARIANT_PROBABILITY:
+          writer.write_variant("Tfjs", "tfjs", validator.TARFILE_SUFFIX,
+                               publisher, variant_name,
+                               f"{publisher}/{name}/{version}")
+          linkable_model_urls.append(
+              f"https://tfhub.dev/{publisher}/tfjs-model/{variant_name}/1")
+  return dict(writer.count_by_type)
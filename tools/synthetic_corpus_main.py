@@ -0,0 +1,84 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Generates a synthetic documentation tree for benchmarking the validator.
+
+To generate 100k documents, run from the project root path:
+$ python tools/synthetic_corpus_main.py --output_dir=/tmp/corpus \
+    --num_documents=100000
+
+The tree can then be validated or benchmarked like the project itself:
+$ python tools/validator_benchmark.py validate_dir --root_dir=/tmp/corpus
+"""
+import argparse
+import os
+import sys
+
+from absl import app
+from absl import logging
+import synthetic_corpus
+
+FLAGS = None
+
+
+def main(_):
+  root_dir = FLAGS.root_dir or os.getcwd()
+  count_by_type = synthetic_corpus.generate_corpus(
+      FLAGS.output_dir,
+      FLAGS.num_documents,
+      root_dir,
+      seed=FLAGS.seed,
+      models_per_publisher=FLAGS.models_per_publisher,
+      links_per_collection=FLAGS.links_per_collection)
+  logging.info("Generated %d documents in %s: %s.",
+               sum(count_by_type.values()), FLAGS.output_dir,
+               dict(sorted(count_by_type.items())))
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      "--output_dir",
+      type=str,
+      required=True,
+      help=("Directory in which ./assets/docs and ./tags are created. It must "
+            "not contain ./assets/docs or ./tags yet."))
+  parser.add_argument(
+      "--num_documents",
+      type=int,
+      default=10000,
+      help="Number of documentation files to generate. Defaults to 10000.")
+  parser.add_argument(
+      "--seed",
+      type=int,
+      default=0,
+      help="Seed of the random choices, which makes the tree reproducible.")
+  parser.add_argument(
+      "--models_per_publisher",
+      type=int,
+      default=synthetic_corpus.DEFAULT_MODELS_PER_PUBLISHER,
+      help="Average number of models per publisher.")
+  parser.add_argument(
+      "--links_per_collection",
+      type=int,
+      default=synthetic_corpus.DEFAULT_LINKS_PER_COLLECTION,
+      help="Maximum number of model links of each collection.")
+  parser.add_argument(
+      "--root_dir",
+      type=str,
+      default=None,
+      help=("Root directory of the project whose ./tags are copied and from "
+            "which tag values are drawn. Defaults to current directory."))
+  FLAGS, unparsed = parser.parse_known_args()
+  app.run(main=main, argv=[sys.argv[0]] + unparsed)
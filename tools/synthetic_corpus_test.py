@@ -0,0 +1,72 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.synthetic_corpus."""
+
+import os
+import pathlib
+
+import tensorflow as tf
+import filesystem_utils
+import synthetic_corpus
+import validator
+
+_PROJECT_ROOT_DIR = str(pathlib.Path(__file__).parent.parent)
+
+
+class SyntheticCorpusTest(tf.test.TestCase):
+
+  def generate_corpus(self, num_documents, seed=0):
+    root_dir = self.create_tempdir().full_path
+    count_by_type = synthetic_corpus.generate_corpus(
+        root_dir,
+        num_documents,
+        _PROJECT_ROOT_DIR,
+        seed=seed,
+        models_per_publisher=10,
+        links_per_collection=20)
+    return root_dir, count_by_type
+
+  def read_corpus(self, root_dir):
+    documentation_dir = os.path.join(root_dir, validator.DOCS_PATH)
+    return {
+        os.path.relpath(file_path, documentation_dir):
+        filesystem_utils.get_content(file_path)
+        for file_path in filesystem_utils.recursive_list_dir(documentation_dir)
+    }
+
+  def test_generated_corpus_is_valid(self):
+    root_dir, count_by_type = self.generate_corpus(500)
+
+    self.assertEqual(sum(count_by_type.values()), 500)
+    self.assertLen(self.read_corpus(root_dir), 500)
+    self.assertCountEqual(
+        count_by_type,
+        ["Publisher", "Module", "Lite", "Tfjs", "Placeholder", "Collection"])
+    self.assertGreater(count_by_type["Module"], 250)
+    validator.validate_documentation_dir(
+        validator.ValidationConfig(skip_asset_check=False),
+        root_dir,
+        jobs=1)
+
+  def test_generated_corpus_is_reproducible(self):
+    root_dir, _ = self.generate_corpus(100, seed=1)
+    other_root_dir, _ = self.generate_corpus(100, seed=1)
+
+    self.assertEqual(
+        self.read_corpus(root_dir), self.read_corpus(other_root_dir))
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -0,0 +1,301 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""In-memory inverted index from tag values to documentation files.
+
+Each document gets a consecutive integer id and each (key, value) pair of its
+metadata maps to a bitset of document ids, stored as a Python int. Queries
+combine these bitsets with AND, OR and NOT, which takes microseconds for the
+whole corpus. Besides the metadata keys, each document has the facets "type"
+(e.g. "type:Module") and "publisher" (e.g. "publisher:google").
+
+Queries are written like
+  task:image-classification AND dataset:imagenet-ilsvrc-2012 AND NOT language:de
+where NOT binds strongest, then AND, then OR and parentheses group terms.
+"""
+
+import abc
+import os
+import re
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import catalog as catalog_lib
+import filesystem_utils
+import validator
+
+TYPE_KEY = "type"
+PUBLISHER_KEY = "publisher"
+
+_TOKEN_PATTERN = re.compile(r"\(|\)|[^\s()]+")
+_OPERATORS = frozenset(["AND", "OR", "NOT", "(", ")"])
+
+
+class Query(metaclass=abc.ABCMeta):
+  """A boolean combination of (key, value) terms."""
+
+  @abc.abstractmethod
+  def evaluate(self, index: "TagIndex") -> int:
+    """Returns the bitset of the ids of all matching documents."""
+
+
+class Term(Query):
+  """Matches documents with a tag value, e.g. Term("language", "en")."""
+
+  def __init__(self, key: str, value: str) -> None:
+    self.key = key
+    self.value = value
+
+  def evaluate(self, index: "TagIndex") -> int:
+    return index.get_bitset(self.key, self.value)
+
+
+class And(Query):
+  """Matches documents that match all subqueries."""
+
+  def __init__(self, *queries: Query) -> None:
+    self.queries = queries
+
+  def evaluate(self, index: "TagIndex") -> int:
+    bitset = index.all_bitset
+    for query in self.queries:
+      bitset &= query.evaluate(index)
+      if not bitset:
+        break
+    return bitset
+
+
+class Or(Query):
+  """Matches documents that match any subquery."""
+
+  def __init__(self, *queries: Query) -> None:
+    self.queries = queries
+
+  def evaluate(self, index: "TagIndex") -> int:
+    bitset = 0
+    for query in self.queries:
+      bitset |= query.evaluate(index)
+    return bitset
+
+
+class Not(Query):
+  """Matches documents that do not match the subquery."""
+
+  def __init__(self, query: Query) -> None:
+    self.query = query
+
+  def evaluate(self, index: "TagIndex") -> int:
+    return index.all_bitset & ~self.query.evaluate(index)
+
+
+class _QueryParser:
+  """Recursive descent parser for query strings."""
+
+  def __init__(self, query_string: str) -> None:
+    self._query_string = query_string
+    self._tokens = _TOKEN_PATTERN.findall(query_string)
+    self._position = 0
+
+  def _peek(self) -> str:
+    if self._position < len(self._tokens):
+      return self._tokens[self._position]
+    return ""
+
+  def _next(self) -> str:
+    token = self._peek()
+    self._position += 1
+    return token
+
+  def _raise_error(self, message: str) -> None:
+    raise ValueError(f"Invalid query '{self._query_string}': {message}")
+
+  def parse(self) -> Query:
+    query = self._parse_or()
+    if self._peek():
+      self._raise_error(f"Unexpected '{self._peek()}'.")
+    return query
+
+  def _parse_or(self) -> Query:
+    queries = [self._parse_and()]
+    while self._peek() == "OR":
+      self._next()
+      queries.append(self._parse_and())
+    return queries[0] if len(queries) == 1 else Or(*queries)
+
+  def _parse_and(self) -> Query:
+    queries = [self._parse_not()]
+    while self._peek() == "AND":
+      self._next()
+      queries.append(self._parse_not())
+    return queries[0] if len(queries) == 1 else And(*queries)
+
+  def _parse_not(self) -> Query:
+    if self._peek() == "NOT":
+      self._next()
+      return Not(self._parse_not())
+    return self._parse_term()
+
+  def _parse_term(self) -> Query:
+    token = self._next()
+    if token == "(":
+      query = self._parse_or()
+      if self._next() != ")":
+        self._raise_error("Missing ')'.")
+      return query
+    key, separator, value = token.partition(":")
+    if token in _OPERATORS or not token or not separator or not key:
+      self._raise_error(f"Expected a term like 'language:en' but got "
+                        f"'{token}'.")
+    return Term(key, value)
+
+
+def parse_query(query_string: str) -> Query:
+  """Parses a query string like "task:text-embedding AND NOT language:en".
+
+  Args:
+    query_string: Terms of the form KEY:VALUE combined with AND, OR, NOT and
+      parentheses.
+
+  Returns:
+    The parsed query.
+
+  Raises:
+    ValueError: if the query string is malformed.
+  """
+  return _QueryParser(query_string).parse()
+
+
+class TagIndex:
+  """Inverted index from (key, value) pairs to bitsets of documents."""
+
+  def __init__(self) -> None:
+    self._file_paths: List[str] = []
+    self._bitset_by_tag: Dict[Tuple[str, str], int] = dict()
+
+  @classmethod
+  def from_catalog(cls,
+                   catalog: catalog_lib.DocumentationCatalog) -> "TagIndex":
+    """Builds an index from all documents of a catalog."""
+    index = cls()
+    for entry in catalog.find():
+      index.add(entry.file_path, entry.type_name, entry.publisher,
+                entry.metadata)
+    return index
+
+  @classmethod
+  def from_dir(cls,
+               root_dir: str,
+               relative_docs_path: str = validator.DOCS_PATH) -> "TagIndex":
+    """Builds an index by parsing all documentation files.
+
+    Files that cannot be parsed are skipped.
+
+    Args:
+      root_dir: Absolute path to the top-level dir that contains Markdown files.
+      relative_docs_path: Relative path under `root_dir` containing the Markdown
+        files. Defaults to "assets/docs".
+    """
+    documentation_dir = os.path.join(root_dir, relative_docs_path)
+    documentation_parser = validator.DocumentationParser(
+        root_dir, documentation_dir, {})
+    index = cls()
+    for file_path in sorted(
+        filesystem_utils.recursive_list_dir(documentation_dir)):
+      if not file_path.endswith(".md"):
+        continue
+      try:
+        documentation_parser.parse(file_path)
+      except (validator.MarkdownDocumentationError, IndexError,
+              UnicodeDecodeError):
+        continue
+      policy = documentation_parser.policy
+      index.add(
+          os.path.relpath(file_path, documentation_dir), policy.type_name,
+          policy.publisher, documentation_parser.parsed_metadata)
+    return index
+
+  def __len__(self) -> int:
+    return len(self._file_paths)
+
+  @property
+  def all_bitset(self) -> int:
+    """The bitset containing all documents."""
+    return (1 << len(self._file_paths)) - 1
+
+  def add(self, file_path: str, type_name: str, publisher: str,
+          metadata: Mapping[str, AbstractSet[str]]) -> None:
+    """Adds a document with its facets and metadata to the index.
+
+    Args:
+      file_path: Path of the document, which is returned by queries.
+      type_name: Readable name of the parsing policy e.g. "Module".
+      publisher: Publisher of the document.
+      metadata: Mapping of metadata keys to their values.
+    """
+    bit = 1 << len(self._file_paths)
+    self._file_paths.append(file_path)
+    tags = [(TYPE_KEY, type_name), (PUBLISHER_KEY, publisher)]
+    tags.extend(
+        (key, value) for key, values in metadata.items() for value in values)
+    for tag in tags:
+      self._bitset_by_tag[tag] = self._bitset_by_tag.get(tag, 0) | bit
+
+  def get_bitset(self, key: str, value: str) -> int:
+    """Returns the bitset of all documents having the tag value."""
+    return self._bitset_by_tag.get((key, value), 0)
+
+  def get_values(self, key: str) -> Sequence[str]:
+    """Returns all values of a key sorted by their number of documents."""
+    counts = [(bin(bitset).count("1"), value)
+              for (tag_key, value), bitset in self._bitset_by_tag.items()
+              if tag_key == key]
+    return [value for _, value in sorted(counts, key=lambda c: (-c[0], c[1]))]
+
+  def get_file_paths(self, bitset: int) -> List[str]:
+    """Returns the file paths of all documents in a bitset."""
+    file_paths = []
+    while bitset:
+      lowest_bit = bitset & -bitset
+      file_paths.append(self._file_paths[lowest_bit.bit_length() - 1])
+      bitset ^= lowest_bit
+    return file_paths
+
+  def query(self, query: Query) -> List[str]:
+    """Returns the file paths of all documents matching a query."""
+    return self.get_file_paths(query.evaluate(self))
+
+  def count(self, query: Query) -> int:
+    """Returns the number of documents matching a query."""
+    return bin(query.evaluate(self)).count("1")
+
+  def search(self, query_string: str) -> List[str]:
+    """Parses a query string and returns the file paths of matching documents.
+
+    Raises:
+      ValueError: if the query string is malformed.
+    """
+    return self.query(parse_query(query_string))
+
+
+def get_facet_counts(index: TagIndex, query: Query,
+                     keys: Iterable[str]) -> Dict[str, Dict[str, int]]:
+  """Returns the number of matching documents per value of each facet key."""
+  bitset = query.evaluate(index)
+  counts = dict()
+  for key in keys:
+    counts[key] = dict()
+    for value in index.get_values(key):
+      count = bin(bitset & index.get_bitset(key, value)).count("1")
+      if count:
+        counts[key][value] = count
+  return counts
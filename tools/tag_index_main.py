@@ -0,0 +1,86 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Queries the documentation files by their tags.
+
+To list all SavedModels for image classification on ImageNet that are not
+published by Google, run from the project root path:
+$ python tools/tag_index_main.py "type:Module AND task:image-classification \
+    AND dataset:imagenet-ilsvrc-2012-cls AND NOT publisher:google"
+
+Terms have the form KEY:VALUE, where KEY is a metadata key like "task" or one
+of the facets "type" and "publisher". Terms are combined with AND, OR, NOT and
+parentheses. Matching file paths are printed relative to `assets/docs`.
+
+Pass --catalog_file to build the index from a catalog written by
+catalog_main.py instead of parsing all documentation files.
+"""
+import argparse
+import os
+import sys
+
+from absl import app
+from absl import logging
+import catalog
+import tag_index
+
+FLAGS = None
+
+
+def main(_):
+  root_dir = FLAGS.root_dir or os.getcwd()
+  if FLAGS.catalog_file:
+    with catalog.DocumentationCatalog(FLAGS.catalog_file) as catalog_db:
+      catalog_db.update(root_dir)
+      index = tag_index.TagIndex.from_catalog(catalog_db)
+  else:
+    index = tag_index.TagIndex.from_dir(root_dir)
+  logging.info("Indexed %d documents.", len(index))
+  try:
+    query = tag_index.parse_query(FLAGS.query)
+  except ValueError as e:
+    raise app.UsageError(str(e)) from e
+  for file_path in index.query(query):
+    print(file_path)
+  for key, counts in tag_index.get_facet_counts(index, query,
+                                                FLAGS.facets).items():
+    logging.info("Matching documents per %s: %s", key, counts)
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      "query",
+      type=str,
+      help="Query like 'task:text-embedding AND NOT language:en'.")
+  parser.add_argument(
+      "--root_dir",
+      type=str,
+      default=None,
+      help=("Root directory that contains documentation files under "
+            "./assets/docs. Defaults to current directory."))
+  parser.add_argument(
+      "--catalog_file",
+      type=str,
+      default=None,
+      help=("Local path to a SQLite catalog, which is updated and used instead "
+            "of parsing all documentation files."))
+  parser.add_argument(
+      "--facets",
+      type=str,
+      default=[],
+      nargs="*",
+      help="Keys like 'publisher' for which the matches per value are logged.")
+  FLAGS, unparsed = parser.parse_known_args()
+  app.run(main=main, argv=[sys.argv[0]] + unparsed)
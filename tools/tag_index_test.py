@@ -0,0 +1,123 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.tag_index."""
+
+import os
+import textwrap
+
+from absl.testing import parameterized
+import tensorflow as tf
+import catalog
+import tag_index
+
+
+class TagIndexTest(parameterized.TestCase, tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.index = tag_index.TagIndex()
+    self.index.add("google/models/bert/1.md", "Module", "google", {
+        "task": {"text-embedding"},
+        "language": {"en", "de"}
+    })
+    self.index.add("google/models/mobilenet/1.md", "Module", "google", {
+        "task": {"image-classification"},
+        "dataset": {"imagenet"}
+    })
+    self.index.add("sayakpaul/models/vit/1.md", "Module", "sayakpaul", {
+        "task": {"image-classification"},
+        "dataset": {"imagenet"},
+        "language": {"en"}
+    })
+    self.index.add("google/google.md", "Publisher", "google", {})
+
+  @parameterized.parameters(
+      ("task:image-classification",
+       ["google/models/mobilenet/1.md", "sayakpaul/models/vit/1.md"]),
+      ("task:image-classification AND language:en",
+       ["sayakpaul/models/vit/1.md"]),
+      ("language:de OR publisher:sayakpaul",
+       ["google/models/bert/1.md", "sayakpaul/models/vit/1.md"]),
+      ("type:Module AND NOT language:en", ["google/models/mobilenet/1.md"]),
+      ("NOT type:Module", ["google/google.md"]),
+      ("task:text-embedding OR task:image-classification AND NOT "
+       "publisher:google",
+       ["google/models/bert/1.md", "sayakpaul/models/vit/1.md"]),
+      ("(task:text-embedding OR task:image-classification) AND "
+       "NOT publisher:google", ["sayakpaul/models/vit/1.md"]),
+      ("task:unknown", []))
+  def test_search(self, query_string, expected_file_paths):
+    self.assertEqual(self.index.search(query_string), expected_file_paths)
+
+  @parameterized.parameters("", "task", "task:a AND", "(task:a", "task:a )",
+                            "task:a language:en", "NOT")
+  def test_malformed_query_raises_error(self, query_string):
+    with self.assertRaisesRegex(ValueError, "Invalid query"):
+      tag_index.parse_query(query_string)
+
+  def test_query_api(self):
+    query = tag_index.And(
+        tag_index.Term("dataset", "imagenet"),
+        tag_index.Not(tag_index.Term("publisher", "google")))
+
+    self.assertEqual(self.index.query(query), ["sayakpaul/models/vit/1.md"])
+    self.assertEqual(self.index.count(query), 1)
+
+  def test_get_facet_counts(self):
+    counts = tag_index.get_facet_counts(
+        self.index, tag_index.parse_query("type:Module"),
+        ["publisher", "language"])
+
+    self.assertEqual(counts, {
+        "publisher": {
+            "google": 2,
+            "sayakpaul": 1
+        },
+        "language": {
+            "en": 2,
+            "de": 1
+        }
+    })
+
+  def test_from_dir_and_from_catalog_build_same_index(self):
+    root_dir = self.create_tempdir().full_path
+    docs_dir = os.path.join(root_dir, "assets", "docs")
+    for file_path, content in [
+        ("google/google.md", "# Publisher google\nGoogle\n"),
+        ("google/models/bert/1.md",
+         textwrap.dedent("""\
+             # Module google/bert/1
+             BERT.
+             <!-- task: text-embedding -->
+             """)),
+        ("google/models/broken/1.md", "# Newmodel google/broken/1\n")
+    ]:
+      self.create_tempfile(os.path.join(docs_dir, file_path), content)
+    documentation_catalog = catalog.DocumentationCatalog(":memory:")
+    self.addCleanup(documentation_catalog.close)
+    documentation_catalog.update(root_dir)
+
+    for index in [
+        tag_index.TagIndex.from_dir(root_dir),
+        tag_index.TagIndex.from_catalog(documentation_catalog)
+    ]:
+      self.assertLen(index, 2)
+      self.assertEqual(
+          index.search("task:text-embedding"), ["google/models/bert/1.md"])
+      self.assertEqual(index.search("type:Publisher"), ["google/google.md"])
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -21,6 +21,8 @@ $ python tools/tags_validator.py
 $ python tools/tags_validator.py tags/dataset.yml [other_files]
 
 Use the --root_dir flag to validate tag files outside of the current project.
+Use --profile and --trace_memory to write cProfile statistics and the top
+memory allocations of the run to --profile_dir.
 
 TODO(b/182137324): Merge with test_tag_configs.py once `bazel test` can be used.
 """
@@ -30,12 +32,22 @@ import sys
 
 from absl import app
 from absl import logging
+import profiling
 import tags_validator
 
 FLAGS = None
 
 
 def main(_):
+  with profiling.RunProfiler(
+      FLAGS.profile_dir or os.getcwd(),
+      "tags_validator",
+      profile=FLAGS.profile,
+      trace_memory=FLAGS.trace_memory):
+    _validate_tags()
+
+
+def _validate_tags() -> None:
   root_dir = FLAGS.root_dir or os.getcwd()
   documentation_dir = os.path.join(root_dir, "tags")
   logging.info("Using %s for documentation directory.", documentation_dir)
@@ -70,5 +82,21 @@ if __name__ == "__main__":
       default=None,
       help=("Root directory that contains tag definition files under "
             "./tags. Defaults to current directory."))
+  parser.add_argument(
+      "--profile",
+      action="store_true",
+      help=("Profiles the run with cProfile and writes tags_validator.pstats "
+            "to --profile_dir."))
+  parser.add_argument(
+      "--trace_memory",
+      action="store_true",
+      help=("Traces memory allocations with tracemalloc and writes the top "
+            "allocations and a snapshot to --profile_dir."))
+  parser.add_argument(
+      "--profile_dir",
+      type=str,
+      default=None,
+      help=("Local directory to which profiles are written. Defaults to the "
+            "current directory."))
   FLAGS, unparsed = parser.parse_known_args()
   app.run(main=main, argv=[sys.argv[0]] + unparsed)
@@ -0,0 +1,223 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Timeline of a validation run in the Chrome trace event format.
+
+Spans are recorded by the tracer of the current process, which is switched on
+by start() or RunTracer and is off by default. While it is off, span() returns
+a shared empty context manager and traced functions run undecorated.
+
+Each span records the process and thread ids, so that the overlap of worker
+processes and threads is visible when the file written by RunTracer is opened
+in https://ui.perfetto.dev or chrome://tracing. Worker processes return their
+events with drain_events() and the parent adds them with add_events().
+
+Timestamps come from the monotonic clock, which is shared by all processes of a
+machine, so that the events of different processes line up.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from absl import logging
+
+# A single trace event, see https://docs.google.com/document/d/
+# 1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+Event = Dict[str, Any]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def _get_timestamp_us() -> float:
+  return time.monotonic_ns() / 1000
+
+
+def _get_thread_id() -> int:
+  """Returns the id of the current thread as the OS knows it if available."""
+  # threading.get_native_id requires Python 3.8.
+  return getattr(threading, "get_native_id", threading.get_ident)()
+
+
+class Tracer:
+  """Records the spans of all threads of one process."""
+
+  def __init__(self, process_name: str) -> None:
+    self._pid = os.getpid()
+    self._lock = threading.Lock()
+    self._traced_thread_ids = set()
+    self._events: List[Event] = [{
+        "name": "process_name",
+        "ph": "M",
+        "pid": self._pid,
+        "args": {
+            "name": process_name
+        },
+    }]
+
+  @contextlib.contextmanager
+  def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+    """Records the duration of the context as a complete event.
+
+    Args:
+      name: Name of the span, e.g. the path of the validated file.
+      category: Category of the span, e.g. "file" or "phase".
+      **args: JSON serializable values shown with the span.
+
+    Yields:
+      None. The span is recorded even if the context raises an error.
+    """
+    start_us = _get_timestamp_us()
+    try:
+      yield
+    finally:
+      event = {
+          "name": name,
+          "cat": category,
+          "ph": "X",
+          "ts": start_us,
+          "dur": _get_timestamp_us() - start_us,
+          "pid": self._pid,
+          "tid": _get_thread_id(),
+      }
+      if args:
+        event["args"] = args
+      self._add_event(event)
+
+  def _add_event(self, event: Event) -> None:
+    with self._lock:
+      if event["tid"] not in self._traced_thread_ids:
+        self._traced_thread_ids.add(event["tid"])
+        self._events.append({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": self._pid,
+            "tid": event["tid"],
+            "args": {
+                "name": threading.current_thread().name
+            },
+        })
+      self._events.append(event)
+
+  def add_events(self, events: Sequence[Event]) -> None:
+    """Adds events recorded by another tracer, e.g. of a worker process."""
+    with self._lock:
+      self._events.extend(events)
+
+  def drain_events(self) -> List[Event]:
+    """Returns and forgets the events recorded so far."""
+    with self._lock:
+      events = self._events
+      self._events = []
+    return events
+
+  def save(self, path: str) -> None:
+    """Writes the events as a JSON trace to a local path."""
+    with self._lock:
+      trace = {"traceEvents": self._events, "displayTimeUnit": "ms"}
+      with open(path, "w") as f:
+        json.dump(trace, f)
+    logging.info("Wrote %d trace events to %s.", len(self._events), path)
+
+
+# The tracer of the current process, which is None while tracing is off.
+_tracer: Optional[Tracer] = None
+
+
+def start(process_name: str) -> Tracer:
+  """Starts recording the spans of this process with a new Tracer."""
+  global _tracer
+  _tracer = Tracer(process_name)
+  return _tracer
+
+
+def stop() -> Optional[Tracer]:
+  """Stops recording spans and returns the previous Tracer if there was one."""
+  global _tracer
+  tracer = _tracer
+  _tracer = None
+  return tracer
+
+
+def is_enabled() -> bool:
+  return _tracer is not None
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[None]:
+  """Returns a context manager that records a span if tracing is on."""
+  tracer = _tracer
+  if tracer is None:
+    return _NULL_CONTEXT
+  return tracer.span(name, category, **args)
+
+
+def traced(category: str) -> Callable[[_F], _F]:
+  """Returns a decorator that records a span for each call of a function."""
+
+  def decorator(function: _F) -> _F:
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+      tracer = _tracer
+      if tracer is None:
+        return function(*args, **kwargs)
+      with tracer.span(function.__qualname__, category):
+        return function(*args, **kwargs)
+
+    return wrapper
+
+  return decorator
+
+
+def add_events(events: Sequence[Event]) -> None:
+  """Adds events of a worker process to the tracer of this process."""
+  if _tracer is not None:
+    _tracer.add_events(events)
+
+
+def drain_events() -> List[Event]:
+  """Returns and forgets the events recorded by this process so far."""
+  return _tracer.drain_events() if _tracer is not None else []
+
+
+class RunTracer:
+  """Context manager that traces a run and writes the trace to a file."""
+
+  def __init__(self, trace_file: Optional[str], process_name: str) -> None:
+    """Initializes the RunTracer.
+
+    Args:
+      trace_file: Local path to which the trace is written. If None, nothing
+        is traced.
+      process_name: Name of the process shown in the timeline.
+    """
+    self._trace_file = trace_file
+    self._process_name = process_name
+
+  def __enter__(self) -> "RunTracer":
+    if self._trace_file:
+      start(self._process_name)
+    return self
+
+  def __exit__(self, *args) -> None:
+    if self._trace_file:
+      # The trace is written even if the run failed, e.g. with validation
+      # errors.
+      stop().save(self._trace_file)
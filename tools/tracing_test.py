@@ -0,0 +1,136 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.tracing."""
+
+import json
+import os
+import threading
+from unittest import mock
+
+import tensorflow as tf
+import tracing
+
+
+@tracing.traced("test")
+def _add(a, b):
+  return a + b
+
+
+def _get_spans(events):
+  return [event for event in events if event["ph"] == "X"]
+
+
+class TracingTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.addCleanup(tracing.stop)
+
+  def test_span_records_complete_event(self):
+    tracer = tracing.start("test process")
+
+    with tracing.span("a.md", "file", size=3):
+      pass
+
+    [span] = _get_spans(tracer.drain_events())
+    self.assertEqual(span["name"], "a.md")
+    self.assertEqual(span["cat"], "file")
+    self.assertEqual(span["pid"], os.getpid())
+    self.assertEqual(span["tid"], tracing._get_thread_id())
+    self.assertEqual(span["args"], {"size": 3})
+    self.assertGreaterEqual(span["dur"], 0)
+
+  def test_thread_id_without_native_thread_ids(self):
+    # Python 3.7 has no threading.get_native_id.
+    native_id_patch = mock.patch.object(threading, "get_native_id", None)
+    native_id_patch.start()
+    self.addCleanup(native_id_patch.stop)
+    del threading.get_native_id
+    tracer = tracing.start("test process")
+
+    with tracing.span("a.md", "file"):
+      pass
+
+    [span] = _get_spans(tracer.drain_events())
+    self.assertEqual(span["tid"], threading.get_ident())
+
+  def test_span_is_recorded_on_error(self):
+    tracer = tracing.start("test process")
+
+    with self.assertRaises(ValueError):
+      with tracing.span("a.md", "file"):
+        raise ValueError()
+
+    self.assertLen(_get_spans(tracer.drain_events()), 1)
+
+  def test_threads_are_named(self):
+    tracer = tracing.start("test process")
+    thread = threading.Thread(
+        target=lambda: _add(1, 2), name="worker thread")
+
+    thread.start()
+    thread.join()
+    _add(3, 4)
+
+    events = tracer.drain_events()
+    self.assertCountEqual([(event["name"], event["args"]["name"])
+                           for event in events
+                           if event["ph"] == "M"],
+                          [("process_name", "test process"),
+                           ("thread_name", "worker thread"),
+                           ("thread_name", "MainThread")])
+    self.assertEqual([span["name"] for span in _get_spans(events)],
+                     ["_add", "_add"])
+
+  def test_nothing_is_recorded_while_tracing_is_off(self):
+    self.assertFalse(tracing.is_enabled())
+
+    with tracing.span("a.md", "file"):
+      self.assertEqual(_add(1, 2), 3)
+
+    self.assertEmpty(tracing.drain_events())
+
+  def test_events_of_workers_are_added(self):
+    worker_tracer = tracing.Tracer("worker")
+    with worker_tracer.span("a.md", "file"):
+      pass
+    tracer = tracing.start("test process")
+
+    tracing.add_events(worker_tracer.drain_events())
+
+    self.assertEqual(
+        [span["name"] for span in _get_spans(tracer.drain_events())], ["a.md"])
+    self.assertEmpty(worker_tracer.drain_events())
+
+  def test_run_tracer_writes_trace_on_error(self):
+    trace_file = os.path.join(self.create_tempdir().full_path, "trace.json")
+
+    with self.assertRaises(TypeError):
+      with tracing.RunTracer(trace_file, "test process"):
+        _add(1, "2")
+
+    self.assertFalse(tracing.is_enabled())
+    with open(trace_file) as f:
+      trace = json.load(f)
+    self.assertEqual(
+        [span["name"] for span in _get_spans(trace["traceEvents"])], ["_add"])
+
+  def test_run_tracer_without_file_does_not_trace(self):
+    with tracing.RunTracer(None, "test process"):
+      self.assertFalse(tracing.is_enabled())
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -0,0 +1,104 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""On-disk cache of documentation files that were validated successfully.
+
+The cache stores one key per file, which is derived from the content of the
+file. All keys are only valid together with an environment key, which covers
+everything else that influences the validation of a file like the validator
+source code, the tag definition files and the set of existing documentation
+files. If the environment key changes, all cached results are dropped.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable
+
+from absl import logging
+
+_ENVIRONMENT_KEY = "environment_key"
+_FILE_KEYS = "file_keys"
+
+
+def compute_key(parts: Iterable[str]) -> str:
+  """Returns a SHA-256 hex digest of the given strings."""
+  digest = hashlib.sha256()
+  for part in parts:
+    encoded_part = part.encode("utf-8")
+    # Prefixing the length makes the key unambiguous for any sequence of parts.
+    digest.update(len(encoded_part).to_bytes(8, "big"))
+    digest.update(encoded_part)
+  return digest.hexdigest()
+
+
+class ValidationCache:
+  """Keys of successfully validated files that are stored in a JSON file."""
+
+  def __init__(self, cache_path: str, environment_key: str) -> None:
+    """Loads the cache and drops it if its environment key differs.
+
+    Args:
+      cache_path: Local path to the JSON file storing the cache. The file is
+        created on save() if it does not exist.
+      environment_key: Key of everything that influences the validation of a
+        file apart from its content.
+    """
+    self._cache_path = cache_path
+    self._environment_key = environment_key
+    self._file_keys: Dict[str, str] = dict()
+    self._hits = 0
+    if not os.path.exists(cache_path):
+      return
+    try:
+      with open(cache_path) as f:
+        cache = json.load(f)
+    except (OSError, ValueError) as e:
+      logging.warning("Ignoring unreadable validation cache %s: %s", cache_path,
+                      e)
+      return
+    if cache.get(_ENVIRONMENT_KEY) != environment_key:
+      logging.info("Dropping validation cache since the validator, the tag "
+                   "files or the set of documentation files changed.")
+      return
+    self._file_keys = dict(cache.get(_FILE_KEYS, {}))
+
+  @property
+  def hits(self) -> int:
+    return self._hits
+
+  def contains(self, file_path: str, file_key: str) -> bool:
+    """Returns True if the file was validated successfully with this key."""
+    if self._file_keys.get(file_path) == file_key:
+      self._hits += 1
+      return True
+    return False
+
+  def add(self, file_path: str, file_key: str) -> None:
+    """Records that the file was validated successfully."""
+    self._file_keys[file_path] = file_key
+
+  def remove(self, file_path: str) -> None:
+    """Drops the cached result of a file e.g. after its validation failed."""
+    self._file_keys.pop(file_path, None)
+
+  def save(self) -> None:
+    """Atomically writes the cache to its JSON file."""
+    temp_path = f"{self._cache_path}.tmp"
+    with open(temp_path, "w") as f:
+      json.dump({
+          _ENVIRONMENT_KEY: self._environment_key,
+          _FILE_KEYS: self._file_keys
+      }, f)
+    os.replace(temp_path, self._cache_path)
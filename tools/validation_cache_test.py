@@ -0,0 +1,77 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.validation_cache."""
+
+import os
+
+import tensorflow as tf
+import validation_cache
+
+
+class ValidationCacheTest(tf.test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.cache_path = os.path.join(self.create_tempdir(), "cache.json")
+
+  def test_compute_key_is_unambiguous(self):
+    self.assertEqual(
+        validation_cache.compute_key(["a", "b"]),
+        validation_cache.compute_key(["a", "b"]))
+    self.assertNotEqual(
+        validation_cache.compute_key(["ab", ""]),
+        validation_cache.compute_key(["a", "b"]))
+
+  def test_saved_entries_are_loaded_with_same_environment_key(self):
+    cache = validation_cache.ValidationCache(self.cache_path, "env")
+    cache.add("google/google.md", "key1")
+    cache.save()
+
+    loaded_cache = validation_cache.ValidationCache(self.cache_path, "env")
+
+    self.assertTrue(loaded_cache.contains("google/google.md", "key1"))
+    self.assertFalse(loaded_cache.contains("google/google.md", "key2"))
+    self.assertEqual(loaded_cache.hits, 1)
+
+  def test_entries_are_dropped_with_different_environment_key(self):
+    cache = validation_cache.ValidationCache(self.cache_path, "env")
+    cache.add("google/google.md", "key1")
+    cache.save()
+
+    loaded_cache = validation_cache.ValidationCache(self.cache_path, "new_env")
+
+    self.assertFalse(loaded_cache.contains("google/google.md", "key1"))
+
+  def test_removed_entry_is_not_saved(self):
+    cache = validation_cache.ValidationCache(self.cache_path, "env")
+    cache.add("google/google.md", "key1")
+    cache.remove("google/google.md")
+    cache.save()
+
+    loaded_cache = validation_cache.ValidationCache(self.cache_path, "env")
+
+    self.assertFalse(loaded_cache.contains("google/google.md", "key1"))
+
+  def test_corrupt_cache_file_is_ignored(self):
+    with open(self.cache_path, "w") as f:
+      f.write("{not json")
+
+    cache = validation_cache.ValidationCache(self.cache_path, "env")
+
+    self.assertFalse(cache.contains("google/google.md", "key1"))
+
+
+if __name__ == "__main__":
+  tf.test.main()
@@ -0,0 +1,106 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Sharding of documentation files and mergeable results of validation runs.
+
+Files are assigned to shards by a hash of their path relative to the
+`assets/docs` directory. The assignment of a file does not change when other
+files are added or removed, and each shard gets about the same number of files.
+"""
+
+import collections
+import hashlib
+import json
+from typing import Dict, Sequence
+
+import attr
+
+
+def get_shard_index(file_path: str, num_shards: int) -> int:
+  """Returns the shard of a file path relative to the `assets/docs` directory.
+
+  Args:
+    file_path: Relative path of the file, e.g. "google/models/bert/1.md".
+    num_shards: Total number of shards.
+  """
+  digest = hashlib.sha1(file_path.encode("utf-8")).digest()
+  return int.from_bytes(digest[:8], "big") % num_shards
+
+
+@attr.s(auto_attribs=True)
+class ValidationResult:
+  """Outcome of validating all files or one shard of them.
+
+  Attributes:
+    validated: Number of successfully validated files.
+    file_to_error: Mapping from the relative path of each invalid file to its
+      error message.
+    statistics: Mapping from publisher to a mapping from document type to the
+      number of validated documents.
+    shard_index: Index of the validated shard.
+    num_shards: Total number of shards.
+  """
+  validated: int = 0
+  file_to_error: Dict[str, str] = attr.ib(factory=dict)
+  statistics: Dict[str, Dict[str, int]] = attr.ib(factory=dict)
+  shard_index: int = 0
+  num_shards: int = 1
+
+  def save(self, path: str) -> None:
+    """Writes the result to a local JSON file."""
+    with open(path, "w") as f:
+      json.dump(attr.asdict(self), f, indent=2, sort_keys=True)
+
+  @classmethod
+  def load(cls, path: str) -> "ValidationResult":
+    """Reads a result written by save()."""
+    with open(path) as f:
+      return cls(**json.load(f))
+
+
+def merge_results(results: Sequence[ValidationResult]) -> ValidationResult:
+  """Combines the results of all shards of a run into one result.
+
+  Args:
+    results: One result per shard in any order.
+
+  Returns:
+    A result for all files.
+
+  Raises:
+    ValueError: if the results are not exactly one per shard of the same run.
+  """
+  if not results:
+    raise ValueError("No results to merge.")
+  num_shards = results[0].num_shards
+  if any(result.num_shards != num_shards for result in results):
+    raise ValueError("Results of runs with different numbers of shards: "
+                     f"{sorted({result.num_shards for result in results})}.")
+  shard_indices = sorted(result.shard_index for result in results)
+  if shard_indices != list(range(num_shards)):
+    raise ValueError(f"Expected one result for each of {num_shards} shards but "
+                     f"got results for shards {shard_indices}.")
+  merged = ValidationResult(num_shards=1)
+  type_counts_by_publisher = collections.defaultdict(collections.Counter)
+  for result in sorted(results, key=lambda result: result.shard_index):
+    merged.validated += result.validated
+    merged.file_to_error.update(result.file_to_error)
+    for publisher, type_counts in result.statistics.items():
+      type_counts_by_publisher[publisher].update(type_counts)
+  merged.file_to_error = dict(sorted(merged.file_to_error.items()))
+  merged.statistics = {
+      publisher: dict(type_counts)
+      for publisher, type_counts in sorted(type_counts_by_publisher.items())
+  }
+  return merged
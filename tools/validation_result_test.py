@@ -0,0 +1,102 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tfhub_dev.tools.validation_result."""
+
+import collections
+import os
+
+from absl.testing import parameterized
+import tensorflow as tf
+import validation_result
+
+
+class ValidationResultTest(parameterized.TestCase, tf.test.TestCase):
+
+  def test_shard_index_is_stable(self):
+    self.assertEqual(
+        validation_result.get_shard_index("google/models/bert/1.md", 4), 3)
+    self.assertEqual(validation_result.get_shard_index("google/google.md", 4), 0)
+
+  def test_shards_are_balanced(self):
+    counts = collections.Counter(
+        validation_result.get_shard_index(f"google/models/model-{i}/1.md", 4)
+        for i in range(4000))
+
+    self.assertCountEqual(counts, range(4))
+    for count in counts.values():
+      self.assertBetween(count, 900, 1100)
+
+  def test_save_and_load(self):
+    path = os.path.join(self.create_tempdir().full_path, "result.json")
+    result = validation_result.ValidationResult(
+        validated=2,
+        file_to_error={"google/models/bert/1.md": "Error."},
+        statistics={"google": {"Module": 3}},
+        shard_index=1,
+        num_shards=2)
+
+    result.save(path)
+
+    self.assertEqual(validation_result.ValidationResult.load(path), result)
+
+  def test_merge_results(self):
+    merged = validation_result.merge_results([
+        validation_result.ValidationResult(
+            validated=1,
+            file_to_error={"google/models/b/1.md": "Error b."},
+            statistics={"google": {"Module": 2}},
+            shard_index=1,
+            num_shards=2),
+        validation_result.ValidationResult(
+            validated=2,
+            file_to_error={"google/models/a/1.md": "Error a."},
+            statistics={
+                "google": {"Module": 1, "Publisher": 1},
+                "vtab": {"Module": 1}
+            },
+            shard_index=0,
+            num_shards=2)
+    ])
+
+    self.assertEqual(
+        merged,
+        validation_result.ValidationResult(
+            validated=3,
+            file_to_error={
+                "google/models/a/1.md": "Error a.",
+                "google/models/b/1.md": "Error b."
+            },
+            statistics={
+                "google": {"Module": 3, "Publisher": 1},
+                "vtab": {"Module": 1}
+            }))
+
+  @parameterized.parameters(
+      ([], "No results"), ([(0, 2)], "shards \\[0\\]"),
+      ([(0, 2), (0, 2)], "shards \\[0, 0\\]"),
+      ([(0, 2), (1, 3)], "different numbers of shards"))
+  def test_merge_incomplete_results_fails(self, shards, expected_error):
+    results = [
+        validation_result.ValidationResult(
+            shard_index=shard_index, num_shards=num_shards)
+        for shard_index, num_shards in shards
+    ]
+
+    with self.assertRaisesRegex(ValueError, expected_error):
+      validation_result.merge_results(results)
+
+
+if __name__ == "__main__":
+  tf.test.main()
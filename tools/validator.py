@@ -27,39 +27,73 @@ This does not download and smoke test the model.
 3) To validate files from outside the project root path, use the --root_dir
 flag:
 $ python tools/validator.py --root_dir=path_to_project_root
+
+TensorFlow is only imported once a model is smoke tested so that validating
+metadata does not pay for loading it.
 """
 
 import abc
 import argparse
+import collections
+from concurrent import futures
+import contextlib
 import fnmatch
+import functools
+import heapq
 import itertools
 import os
 import re
 import subprocess
 import sys
 import tarfile
-import time
 import textwrap
-from typing import AbstractSet, Iterator, Mapping, MutableSequence, Optional, Sequence, Type, TypeVar
+import threading
+import time
+from typing import IO, AbstractSet, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
 import urllib.request
 
 from absl import app
 from absl import logging
+import asset_cache as asset_cache_lib
 import attr
-import tensorflow as tf
 import filesystem_utils
+import link_graph as link_graph_lib
+import path_index as path_index_lib
+import phase_timing as phase_timing_lib
+import profiling
+import rate_limiter as rate_limiter_lib
+import result_sinks as result_sinks_lib
+import tracing
+import validation_cache as validation_cache_lib
+import validation_result as validation_result_lib
 import yaml_parser as yaml_parser_lib
 
-from google.protobuf import message
-from google.protobuf import text_format
-# pylint: disable=g-direct-tensorflow-import
-from tensorflow.core.protobuf import saved_model_pb2
-# pylint: enable=g-direct-tensorflow-import
-
 FLAGS = None
 
 _CI_ENV_KEY = "GITHUB_ACTION"
 _SLEEP_SECONDS = 5
+# Number of characters that are read at once from documentation files, which
+# usually covers their handle, description and metadata.
+_READ_CHUNK_SIZE = 4096
+# Smoke tests in CI download at most one asset per host every _SLEEP_SECONDS
+# on average to prevent exhausting storage read quota.
+_SMOKE_TEST_REQUEST_BURST_PER_HOST = 4
+_HOST_RATE_LIMITER = rate_limiter_lib.HostRateLimiter(
+    rate=1 / _SLEEP_SECONDS, capacity=_SMOKE_TEST_REQUEST_BURST_PER_HOST)
+
+# Git revision against which added or modified asset-path tags are detected.
+DEFAULT_BASE_REF = "origin/master"
+# Added line of a `git diff` that sets the asset-path tag.
+_ADDED_ASSET_PATH_LINE_PREFIX = "+<!-- asset-path:"
+# Maximum number of paths passed to a single `git diff` invocation.
+_GIT_DIFF_MAX_PATHS = 1000
+# Number of files that a worker process validates per task.
+_WORKER_CHUNK_SIZE = 32
+# Number of tasks per job that are submitted ahead of the consumed results,
+# which bounds the memory of pending files and results.
+_PENDING_TASKS_PER_JOB = 4
+# Number of validated files between two progress messages.
+_PROGRESS_LOG_INTERVAL = 1000
 
 # Relative path from tfhub.dev/ to the docs/ directory.
 DOCS_PATH = "assets/docs"
@@ -70,6 +104,13 @@ _MODELS_DIR = "models"
 _TFJS_DIR = "tfjs"
 _LITE_DIR = "lite"
 _CORAL_DIR = "coral"
+# Maps the directory of TF.js, Lite and Coral documentation to the prefix of
+# the model name in their tfhub.dev URLs.
+_URL_PREFIX_BY_TYPE_DIR = {
+    _TFJS_DIR: "tfjs-model/",
+    _LITE_DIR: "lite-model/",
+    _CORAL_DIR: "coral-model/"
+}
 
 _PUBLISHER_ID_PATTERN = r"[a-z\d-]+"  # Publisher name like "google".
 _MODEL_NAME_PATTERN = r"[\w.-]+(/[\w.-]+)*"  # Model name like "BERT/uncased".
@@ -126,12 +167,17 @@ COLLECTION_HANDLE_PATTERN = (
 # https://tfhub.dev/google/bert
 # https://tfhub.dev/google/bert/4
 # https://tfhub.dev/google/lite-model/yamnet/tflite/1
+# The name is matched lazily so that a trailing version segment is captured
+# by `vers`, while the lookahead still extends the URL as far as a greedy
+# name pattern would.
+_TFHUB_URL_PREFIX = "https://tfhub.dev/"
 _TFHUB_MODEL_URL_PATTERN = re.compile(
-    "https://tfhub.dev/"
+    re.escape(_TFHUB_URL_PREFIX) +
     f"(?P<publisher>{_PUBLISHER_ID_PATTERN})/"  # Publisher name.
     "(?P<prefix>(tfjs|lite|coral)-model/)?"  # Model-type specific prefix.
-    f"(?P<name>{_MODEL_NAME_PATTERN})"  # Model name including version if set.
-)
+    r"(?P<name>[\w.-]+(?:/[\w.-]+)*?)"  # Model name without version.
+    f"(?:/(?P<vers>{_MODEL_VERSION_PATTERN}))?"  # Optional version.
+    r"(?![\w.-]|/[\w.-])")
 # Regex pattern for the line of the documentation describing model metadata.
 # Example: "<!-- fine-tunable: true -->"
 # Note: Both key and value consumes free space characters, but later on these
@@ -140,8 +186,11 @@ METADATA_LINE_PATTERN = r"^<!--(?P<key>(\w|\s|-)+):(?P<value>.+)-->$"
 
 # Regex pattern for files in the SavedModel directory.
 # Example: "variables/variables.data-00000-of-00001"
+# A file name cannot contain "/", so each character of a path can only be
+# matched in one way. That keeps matching linear in the length of the path even
+# for invalid paths, which a repeated group like `(NAME)+` would not.
 _FILE_NAME_PATTERN = r"[\w-][-!',_\w.=:% ]*"
-PATH_PATTERN = re.compile(f"({_FILE_NAME_PATTERN})+(/{_FILE_NAME_PATTERN})*")
+PATH_PATTERN = re.compile(f"{_FILE_NAME_PATTERN}(?:/{_FILE_NAME_PATTERN})*")
 
 # Dict keys that map to the specified metadata values of the Markdown files.
 ARCHITECTURE_KEY = "network-architecture"
@@ -166,6 +215,11 @@ SAVED_MODEL_FORMATS = ("hub", "saved_model", "saved_model_2")
 TARFILE_SUFFIX = ".tar.gz"
 TFLITE_SUFFIX = ".tflite"
 
+# Same values as tf.saved_model.SAVED_MODEL_FILENAME_PB(TXT), which are not
+# accessed directly to avoid importing TensorFlow.
+SAVED_MODEL_FILENAME_PB = "saved_model.pb"
+SAVED_MODEL_FILENAME_PBTXT = "saved_model.pbtxt"
+
 
 # Allowed SavedModel files:
 # https://github.com/tensorflow/tensorflow/blob/master/tensorflow/python/saved_model/README.md  # pylint: disable=line-too-long
@@ -175,39 +229,175 @@ ALLOWED_SAVED_MODEL_PATHS = frozenset([
     "fingerprint.pb"
 ])
 
+# Matches any of ALLOWED_SAVED_MODEL_PATHS like fnmatch.fnmatch in one pass.
+_ALLOWED_SAVED_MODEL_PATH_PATTERN = re.compile("|".join(
+    fnmatch.translate(pattern)
+    for pattern in sorted(ALLOWED_SAVED_MODEL_PATHS)))
+
 ParsingPolicyType = TypeVar("ParsingPolicyType", bound="ParsingPolicy")
+_T = TypeVar("_T")
+_U = TypeVar("_U")
 
 
 class MarkdownDocumentationError(Exception):
   """Problem with markdown syntax parsing."""
 
 
-def _is_asset_path_modified(file_path: str) -> bool:
+# Maps (base_ref, absolute file path) to whether the file adds or modifies an
+# asset-path tag compared to base_ref.
+_asset_path_modified_by_file: Dict[Tuple[str, str], bool] = dict()
+# Maps (base_ref, absolute directory path) to the absolute paths of all files
+# below the directory that add or modify an asset-path tag compared to
+# base_ref, which only grows with the number of modified files.
+_modified_asset_paths_by_dir: Dict[Tuple[str, str], AbstractSet[str]] = dict()
+
+
+def _run_git(args: Sequence[str]) -> Optional[str]:
+  """Returns the stdout of a git command or None if git failed."""
+  with tracing.span("git", "subprocess", num_args=len(args)):
+    process = subprocess.run(["git", *args],
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             check=False)
+  if process.returncode != 0:
+    logging.warning("Git failed with exit code %d: %s", process.returncode,
+                    process.stderr.decode("utf-8", "replace").strip())
+    return None
+  return process.stdout.decode("utf-8", "replace")
+
+
+def _get_files_with_modified_asset_path(
+    base_ref: str, file_paths: Sequence[str]) -> AbstractSet[str]:
+  """Returns the absolute paths of files that add or modify an asset-path.
+
+  All files are compared to `base_ref` with a single `git diff` call per
+  _GIT_DIFF_MAX_PATHS files. If git fails, e.g. because `base_ref` does not
+  exist, no asset-path is considered modified.
+
+  Args:
+    base_ref: Git revision to compare the files to.
+    file_paths: Absolute paths of the files to check.
+  """
+  top_level_dir = _run_git(["rev-parse", "--show-toplevel"])
+  if top_level_dir is None:
+    return frozenset()
+  top_level_dir = top_level_dir.strip()
+
+  modified_files = set()
+  for start in range(0, len(file_paths), _GIT_DIFF_MAX_PATHS):
+    diff = _run_git([
+        "-c", "core.quotePath=false", "diff", "--no-color", "--no-ext-diff",
+        "--no-renames", "--unified=0", "--src-prefix=a/", "--dst-prefix=b/",
+        base_ref, "--", *file_paths[start:start + _GIT_DIFF_MAX_PATHS]
+    ])
+    current_file = None
+    in_file_header = False
+    for line in (diff or "").splitlines():
+      if line.startswith("diff --git "):
+        current_file = None
+        in_file_header = True
+      elif in_file_header and line.startswith("+++ "):
+        path = line[len("+++ "):]
+        if path.startswith("b/"):
+          current_file = os.path.join(top_level_dir, path[len("b/"):])
+      elif line.startswith("@@"):
+        in_file_header = False
+      elif (not in_file_header and current_file is not None and
+            line.startswith(_ADDED_ASSET_PATH_LINE_PREFIX)):
+        modified_files.add(current_file)
+  return modified_files
+
+
+@tracing.traced("git")
+def prefetch_asset_path_modifications(file_paths: Sequence[str],
+                                      base_ref: str = DEFAULT_BASE_REF) -> None:
+  """Detects modified asset-path tags of many files with batched git calls.
+
+  _is_asset_path_modified looks up the cached results instead of running git
+  once per file.
+
+  Args:
+    file_paths: Paths of the files to check.
+    base_ref: Git revision to compare the files to.
+  """
+  absolute_paths = [
+      absolute_path for absolute_path in map(os.path.realpath, file_paths)
+      if (base_ref, absolute_path) not in _asset_path_modified_by_file
+  ]
+  if not absolute_paths:
+    return
+  modified_files = _get_files_with_modified_asset_path(base_ref,
+                                                       absolute_paths)
+  for absolute_path in absolute_paths:
+    _asset_path_modified_by_file[(base_ref, absolute_path)] = (
+        absolute_path in modified_files)
+
+
+@tracing.traced("git")
+def prefetch_asset_path_modifications_in_dir(
+    directory: str, base_ref: str = DEFAULT_BASE_REF) -> None:
+  """Detects modified asset-path tags of all files below a directory.
+
+  Unlike prefetch_asset_path_modifications, this needs neither the list of
+  files nor memory per unmodified file.
+
+  Args:
+    directory: Path of the directory, e.g. the `assets/docs` directory.
+    base_ref: Git revision to compare the files to.
+  """
+  key = (base_ref, os.path.realpath(directory))
+  if key not in _modified_asset_paths_by_dir:
+    _modified_asset_paths_by_dir[key] = frozenset(
+        _get_files_with_modified_asset_path(base_ref, [key[1]]))
+
+
+@tracing.traced("git")
+def _is_asset_path_modified(file_path: str,
+                            base_ref: str = DEFAULT_BASE_REF) -> bool:
   """Returns True if the asset-path tag has been added or modified."""
-  git_diff = subprocess.Popen(["git", "diff", "origin/master", file_path],
-                              stdout=subprocess.PIPE)
-  grep_asset_path = subprocess.Popen(["grep", "+<!-- asset-path:"],
-                                     stdin=git_diff.stdout,
-                                     stdout=subprocess.PIPE,
-                                     stderr=subprocess.PIPE)
-  git_diff.stdout.close()
-  grep_asset_path.communicate()
-  return_code = grep_asset_path.returncode
-  # grep exits with code 1 if it cannot find "+<!-- asset-path" in `git diff`.
-  # Raise an error if the exit code is not 0 or 1.
-  if return_code == 0:
-    return True
-  elif return_code == 1:
-    return False
-  else:
-    raise MarkdownDocumentationError(
-        f"Internal: grep command returned unexpected exit code {return_code}")
+  absolute_path = os.path.realpath(file_path)
+  key = (base_ref, absolute_path)
+  if key not in _asset_path_modified_by_file:
+    for (dir_base_ref, directory), modified_files in (
+        _modified_asset_paths_by_dir.items()):
+      if dir_base_ref == base_ref and absolute_path.startswith(
+          os.path.join(directory, "")):
+        return absolute_path in modified_files
+    prefetch_asset_path_modifications([file_path], base_ref)
+  return _asset_path_modified_by_file[key]
+
+
+def _import_saved_model_pb2():
+  """Returns the saved_model_pb2 module, which imports all of TensorFlow."""
+  # pylint: disable=g-direct-tensorflow-import,g-import-not-at-top
+  from tensorflow.core.protobuf import saved_model_pb2
+  # pylint: enable=g-direct-tensorflow-import,g-import-not-at-top
+  return saved_model_pb2
 
 
 def _should_sleep() -> bool:
   return os.environ.get(_CI_ENV_KEY, None) is not None
 
 
+@functools.lru_cache(maxsize=None)
+def get_smoke_test_version() -> str:
+  """Returns the version of the smoke test for verdicts of an AssetCache.
+
+  The source code of this module, which contains all rules of the smoke test,
+  stands in for the version.
+  """
+  with open(__file__) as f:
+    return validation_cache_lib.compute_key([f.read()])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_asset_cache(cache_dir: str,
+                     max_size_bytes: int) -> asset_cache_lib.AssetCache:
+  """Returns the AssetCache for `cache_dir`, which is shared per process."""
+  return asset_cache_lib.AssetCache(
+      cache_dir, max_size_bytes, verdict_version=get_smoke_test_version())
+
+
 def _check_that_saved_model_pb_parses(tar: tarfile.TarFile,
                                       tar_member: tarfile.TarInfo) -> None:
   """Tries to load a saved_model.pb from the tarfile into a SavedModel proto.
@@ -221,6 +411,8 @@ def _check_that_saved_model_pb_parses(tar: tarfile.TarFile,
       - if saved_model.pb is no regular file in the tarfile.
       - if saved_model.pb cannot be loaded into a SavedModel proto.
   """
+  from google.protobuf import message  # pylint: disable=g-import-not-at-top
+  saved_model_pb2 = _import_saved_model_pb2()
   data = tar.extractfile(tar_member)
   if data is None:
     raise MarkdownDocumentationError("saved_model.pb is no regular file.")
@@ -243,6 +435,8 @@ def _check_that_saved_model_pbtxt_parses(tar: tarfile.TarFile,
       - if saved_model.pbtxt is no regular file in the tarfile.
       - if saved_model.pbtxt cannot be loaded into a SavedModel proto.
   """
+  from google.protobuf import text_format  # pylint: disable=g-import-not-at-top
+  saved_model_pb2 = _import_saved_model_pb2()
   data = tar.extractfile(tar_member)
   if data is None:
     raise MarkdownDocumentationError("saved_model.pbtxt is no regular file.")
@@ -253,6 +447,57 @@ def _check_that_saved_model_pbtxt_parses(tar: tarfile.TarFile,
         "Could not parse saved_model.pbtxt.") from e
 
 
+def _check_saved_model_archive(archive: IO[bytes], remote_archive: str) -> None:
+  """Checks that a tar.gz archive contains valid SavedModel files.
+
+  Args:
+    archive: Binary stream of the archive, which is read sequentially.
+    remote_archive: URL of the archive, which is used in error messages.
+
+  Raises:
+    MarkdownDocumentationError:
+      - if the archive is no valid tarfile.
+      - if a file name within the tarfile is invalid since it e.g. starts with
+        a dot.
+      - if no saved_model.pb(txt) file is contained in the archive.
+      - if the contained saved_model.pb(txt) file cannot be loaded into a
+        SavedModel proto.
+  """
+  valid_saved_model_proto_found = False
+  try:
+    with tarfile.open(fileobj=archive, mode="r|gz") as tar:
+      for tar_member in tar:
+        if not tar_member.isfile():
+          continue
+        normalized_path = os.path.normpath(tar_member.name)  # Strip './'.
+        normalized_name = os.path.basename(normalized_path)
+        with tracing.span(
+            normalized_path, "tar_member", size_bytes=tar_member.size):
+          _validate_file_name(normalized_path)
+          if normalized_name == SAVED_MODEL_FILENAME_PB:
+            _check_that_saved_model_pb_parses(tar, tar_member)
+            valid_saved_model_proto_found = True
+          elif normalized_name == SAVED_MODEL_FILENAME_PBTXT:
+            _check_that_saved_model_pbtxt_parses(tar, tar_member)
+            valid_saved_model_proto_found = True
+  except tarfile.ReadError as e:
+    raise MarkdownDocumentationError(f"Could not read tarfile: {e}") from e
+  if not valid_saved_model_proto_found:
+    raise MarkdownDocumentationError(
+        f"The model from {remote_archive} does not contain a valid "
+        "saved_model.pb or saved_model.pbtxt file. Please make sure that "
+        "the asset-path metadata points to a valid TF2 SavedModel or a TF1 "
+        "Hub module as described on "
+        "https://www.tensorflow.org/hub/exporting_tf2_saved_model.")
+
+
+def _get_handle_keyword(first_line: str) -> Optional[str]:
+  """Returns the keyword of a handle e.g. "Module" for "# Module a/b/1"."""
+  if not first_line.startswith("# "):
+    return None
+  return first_line[2:].partition(" ")[0]
+
+
 def _validate_file_name(file_path: str) -> None:
   """Checks that the file name is allowed.
 
@@ -267,9 +512,7 @@ def _validate_file_name(file_path: str) -> None:
   """
   if not PATH_PATTERN.fullmatch(file_path):
     raise MarkdownDocumentationError(f"Invalid filepath in asset: {file_path}")
-  if not any(
-      fnmatch.fnmatch(file_path, pattern)
-      for pattern in ALLOWED_SAVED_MODEL_PATHS):
+  if not _ALLOWED_SAVED_MODEL_PATH_PATTERN.match(file_path):
     raise MarkdownDocumentationError(
         f"File cannot be used by SavedModel: {file_path}")
 
@@ -289,11 +532,28 @@ class ValidationConfig:
       Defaults to False.
     do_smoke_test: A boolean indicating whether the referenced asset should be
       downloaded. Defaults to False.
+    base_ref: The git revision against which added or modified "asset-path"
+      tags are detected. Defaults to "origin/master".
+    asset_cache_dir: Local directory in which assets downloaded for smoke tests
+      are cached together with the test results. Defaults to None, which
+      disables the cache.
+    asset_cache_max_size_bytes: Total size of the cached assets after which the
+      least recently used assets are deleted.
   """
   skip_file_path_check: bool = False
   skip_asset_check: bool = False
   skip_content_check: bool = False
   do_smoke_test: bool = False
+  base_ref: str = DEFAULT_BASE_REF
+  asset_cache_dir: Optional[str] = None
+  asset_cache_max_size_bytes: int = asset_cache_lib.DEFAULT_MAX_SIZE_BYTES
+
+  def get_asset_cache(self) -> Optional[asset_cache_lib.AssetCache]:
+    """Returns the cache for downloaded assets if it is enabled."""
+    if not self.asset_cache_dir:
+      return None
+    return _get_asset_cache(self.asset_cache_dir,
+                            self.asset_cache_max_size_bytes)
 
 
 class ParsingPolicy(metaclass=abc.ABCMeta):
@@ -342,10 +602,12 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
       yaml_parser_by_tag_name: Mapping[str, yaml_parser_lib.AbstractYamlParser]
   ) -> ParsingPolicyType:
     """Returns an appropriate ParsingPolicy instance for the Markdown string."""
-    for pattern, policy in POLICY_BY_PATTERN.items():
-      match = re.fullmatch(pattern, first_line)
-      if not match:
-        continue
+    # Each handle pattern starts with its own keyword, so the first line can
+    # only match the pattern that is looked up by its keyword.
+    pattern, policy = _POLICY_BY_HANDLE_KEYWORD.get(
+        _get_handle_keyword(first_line), (None, None))
+    match = pattern.fullmatch(first_line) if pattern else None
+    if match:
       groups = match.groupdict()
       return policy(yaml_parser_by_tag_name, groups.get("publisher"),
                     groups.get("name"), groups.get("vers"))
@@ -373,6 +635,14 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
   def publisher(self) -> str:
     return self._publisher
 
+  @property
+  def model_name(self) -> str:
+    return self._model_name
+
+  @property
+  def model_version(self) -> str:
+    return self._model_version
+
   @property
   def id(self) -> str:
     return f"{self.publisher}/{self._model_name}/{self._model_version}"
@@ -395,8 +665,12 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
     # TODO(b/198250794): Migrate to having only exactly one allowed path.
     raise NotImplementedError
 
-  def assert_correct_file_path(self, file_path: str,
-                               documentation_dir: str) -> None:
+  def assert_correct_file_path(
+      self,
+      file_path: str,
+      documentation_dir: str,
+      path_index: Optional[path_index_lib.DocumentationPathIndex] = None
+  ) -> None:
     """Checks that the file is stored at an allowed location.
 
     Model documentation should be stored at
@@ -407,13 +681,16 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
     Args:
       file_path: Relative path to the file from the `assets/docs` directory.
       documentation_dir: Absolute path to the `assets/docs` dir.
+      path_index: Optional; Index of all files in `documentation_dir`, which is
+        used instead of globbing the filesystem if set.
 
     Raises:
       MarkdownDocumentationError:
         - if the file is not stored at an allowed location.
     """
     maybe_wildcard_paths = self.get_allowed_file_paths(documentation_dir)
-    absolute_paths = map(tf.io.gfile.glob, maybe_wildcard_paths)
+    glob = path_index.glob if path_index else filesystem_utils.glob
+    absolute_paths = map(glob, maybe_wildcard_paths)
     flat_absolute_paths = list(itertools.chain.from_iterable(absolute_paths))
     actual_path = os.path.join(documentation_dir, file_path)
     if actual_path not in flat_absolute_paths:
@@ -444,7 +721,39 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
     logging.info("Skipping validating 'asset-path' tag since the tag is not "
                  "supported.")
 
-  def _check_valid_remote_asset(self, asset_path: str) -> None:
+  @property
+  def supports_smoke_test(self) -> bool:
+    """Whether smoke_test_asset downloads and checks the asset."""
+    return False
+
+  def smoke_test_asset(
+      self,
+      asset_path: str,
+      rate_limiter: Optional[rate_limiter_lib.HostRateLimiter] = None,
+      asset_cache: Optional[asset_cache_lib.AssetCache] = None) -> None:
+    """Downloads and checks the asset if the policy supports smoke tests.
+
+    Args:
+      asset_path: URL of the asset.
+      rate_limiter: Optional; Limiter of the requests per host, which is
+        acquired before the asset is downloaded.
+      asset_cache: Optional; Cache of downloaded assets and smoke test
+        verdicts.
+
+    Raises:
+      MarkdownDocumentationError: if the asset is invalid.
+    """
+    if not self.supports_smoke_test:
+      return
+    if rate_limiter is not None:
+      with tracing.span("rate_limit", "download", url=asset_path):
+        rate_limiter.acquire(asset_path)
+    self._check_valid_remote_asset(asset_path, asset_cache)
+
+  def _check_valid_remote_asset(
+      self,
+      asset_path: str,
+      asset_cache: Optional[asset_cache_lib.AssetCache] = None) -> None:
     """Checks whether the remote asset is valid."""
 
   def _assert_metadata_contains_required_fields(
@@ -528,8 +837,20 @@ class ParsingPolicy(metaclass=abc.ABCMeta):
     self._assert_correct_module_types(metadata)
     self._assert_correct_tag_values(metadata)
 
-  def assert_correct_content(self, documentation_dir: str,
-                             lines: Sequence[str]) -> None:
+  @property
+  def requires_body(self) -> bool:
+    """Whether assert_correct_content needs the lines after the metadata.
+
+    If False, DocumentationParser stops reading a file after its metadata.
+    Policies that override assert_correct_content have to return True.
+    """
+    return False
+
+  def assert_correct_content(
+      self,
+      documentation_dir: str,
+      lines: Sequence[str],
+      model_resolver: Optional["ModelDocumentationResolver"] = None) -> None:
     """Ensures that the content to be displayed is correct."""
 
 
@@ -581,7 +902,7 @@ class ModelParsingPolicy(ParsingPolicy):
         - if github.com/robots.txt forbids downloading the asset.
         - if the asset can be downloaded but not be resolved to a SavedModel.
     """
-    if not _is_asset_path_modified(file_path):
+    if not _is_asset_path_modified(file_path, validation_config.base_ref):
       logging.info("Skipping asset path validation since the tag is not added "
                    "or modified.")
       return
@@ -606,7 +927,11 @@ class ModelParsingPolicy(ParsingPolicy):
           "by its robots.txt.")
 
     if validation_config.do_smoke_test:
-      self._check_valid_remote_asset(asset_path)
+      # Limit the request rate to prevent exhausting storage read quota.
+      self.smoke_test_asset(
+          asset_path,
+          rate_limiter=_HOST_RATE_LIMITER if _should_sleep() else None,
+          asset_cache=validation_config.get_asset_cache())
 
 
 class CollectionParsingPolicy(ParsingPolicy):
@@ -631,6 +956,10 @@ class CollectionParsingPolicy(ParsingPolicy):
   def id(self) -> str:
     return f"{self.publisher}/{self._model_name}"
 
+  @property
+  def requires_body(self) -> bool:
+    return True
+
   def get_allowed_file_paths(self, documentation_dir: str) -> Sequence[str]:
     """Returns the absolute paths for PUBLISHER/collections/NAME/1.md."""
     return [
@@ -638,8 +967,11 @@ class CollectionParsingPolicy(ParsingPolicy):
                      self._model_name, _COLLECTIONS_FILE_NAME),
     ]
 
-  def assert_correct_content(self, documentation_dir: str,
-                             lines: Sequence[str]) -> None:
+  def assert_correct_content(
+      self,
+      documentation_dir: str,
+      lines: Sequence[str],
+      model_resolver: Optional["ModelDocumentationResolver"] = None) -> None:
     """Checks that referenced model pages have existing documentation files.
 
     A collection should contain at least one link of the form
@@ -649,26 +981,33 @@ class CollectionParsingPolicy(ParsingPolicy):
     Args:
       documentation_dir: Absolute path to the `assets/docs` directory.
       lines: Sequence of strings representing the file content.
+      model_resolver: Optional; Resolver of all documentation files in
+        `documentation_dir`, which is used instead of globbing the filesystem
+        for each URL if set.
 
     Raises:
       MarkdownDocumentationError:
         - if no model URL is contained in the collection.
         - if a model URL is contained whose model does not have a documentation.
     """
-    super().assert_correct_content(documentation_dir, lines)
+    super().assert_correct_content(documentation_dir, lines, model_resolver)
 
     found_one_model = False
-    for line in lines:
-      for policy in _get_policies_for_line_with_model_urls(line):
-        found_one_model = True
-        maybe_wildcard_paths = policy.get_allowed_file_paths(documentation_dir)
-        absolute_paths = map(tf.io.gfile.glob, maybe_wildcard_paths)
-        for absolute_path in itertools.chain.from_iterable(absolute_paths):
-          if tf.io.gfile.exists(absolute_path):
-            break
-        else:
-          raise MarkdownDocumentationError("No documentation file found in "
-                                           f"{maybe_wildcard_paths}.")
+    for url_prefix, publisher, name, version in _get_distinct_model_urls(lines):
+      found_one_model = True
+      if model_resolver is not None and model_resolver.get_paths(
+          url_prefix, publisher, name, version):
+        continue
+      policy = _get_policy_for_model_url(url_prefix, publisher, name, version)
+      maybe_wildcard_paths = policy.get_allowed_file_paths(documentation_dir)
+      if model_resolver is None:
+        absolute_paths = map(filesystem_utils.glob, maybe_wildcard_paths)
+        if any(
+            filesystem_utils.exists(absolute_path) for absolute_path in
+            itertools.chain.from_iterable(absolute_paths)):
+          continue
+      raise MarkdownDocumentationError("No documentation file found in "
+                                       f"{maybe_wildcard_paths}.")
 
     if not found_one_model:
       raise MarkdownDocumentationError(
@@ -730,6 +1069,10 @@ class SavedModelParsingPolicy(ModelParsingPolicy):
   def type_name(self) -> str:
     return "Module"
 
+  @property
+  def supports_smoke_test(self) -> bool:
+    return True
+
   def get_allowed_file_paths(self, documentation_dir: str) -> Sequence[str]:
     """Returns the absolute paths for PUBLISHER/(models/)NAME/VERSION.md."""
     return [
@@ -739,11 +1082,18 @@ class SavedModelParsingPolicy(ModelParsingPolicy):
                      self._model_name, f"{self._model_version}.md")
     ]
 
-  def _check_valid_remote_asset(self, remote_archive: str) -> None:
+  @tracing.traced("asset")
+  def _check_valid_remote_asset(
+      self,
+      remote_archive: str,
+      asset_cache: Optional[asset_cache_lib.AssetCache] = None) -> None:
     """Checks whether the remote archive contains valid SavedModel files.
 
     Args:
       remote_archive: URL pointing to the remote archive.
+      asset_cache: Optional cache of downloaded archives. If set, an archive is
+        only downloaded if it changed and only checked if its content was not
+        checked before.
 
     Raises:
       MarkdownDocumentationError:
@@ -754,34 +1104,29 @@ class SavedModelParsingPolicy(ModelParsingPolicy):
         - if the contained saved_model.pb(txt) file cannot be loaded into a
           SavedModel proto.
     """
-    valid_saved_model_proto_found = False
-    # Wait before each check to prevent exhausting storage read quota.
-    if _should_sleep():
-      time.sleep(_SLEEP_SECONDS)
-    with urllib.request.urlopen(remote_archive) as url_contents:
+    if asset_cache is None:
+      # The archive is checked while it is downloaded.
+      with tracing.span("download", "download", url=remote_archive):
+        with urllib.request.urlopen(remote_archive) as url_contents:
+          _check_saved_model_archive(url_contents, remote_archive)
+      return
+
+    with tracing.span("download", "download", url=remote_archive):
+      asset = asset_cache.fetch(remote_archive)
+    verdict = asset_cache.get_verdict(asset.digest)
+    if verdict is None:
       try:
-        with tarfile.open(fileobj=url_contents, mode="r|gz") as tar:
-          for tar_member in tar:
-            if not tar_member.isfile():
-              continue
-            normalized_path = os.path.normpath(tar_member.name)  # Strip './'.
-            normalized_name = os.path.basename(normalized_path)
-            _validate_file_name(normalized_path)
-            if normalized_name == tf.saved_model.SAVED_MODEL_FILENAME_PB:
-              _check_that_saved_model_pb_parses(tar, tar_member)
-              valid_saved_model_proto_found = True
-            elif normalized_name == tf.saved_model.SAVED_MODEL_FILENAME_PBTXT:
-              _check_that_saved_model_pbtxt_parses(tar, tar_member)
-              valid_saved_model_proto_found = True
-      except tarfile.ReadError as e:
-        raise MarkdownDocumentationError(f"Could not read tarfile: {e}") from e
-      if not valid_saved_model_proto_found:
-        raise MarkdownDocumentationError(
-            f"The model from {remote_archive} does not contain a valid "
-            "saved_model.pb or saved_model.pbtxt file. Please make sure that "
-            "the asset-path metadata points to a valid TF2 SavedModel or a TF1 "
-            "Hub module as described on "
-            "https://www.tensorflow.org/hub/exporting_tf2_saved_model.")
+        with open(asset.path, "rb") as f:
+          _check_saved_model_archive(f, remote_archive)
+      except MarkdownDocumentationError as e:
+        asset_cache.set_verdict(asset.digest, str(e))
+        raise
+      asset_cache.set_verdict(asset.digest)
+    elif verdict:
+      raise MarkdownDocumentationError(verdict)
+    else:
+      logging.info("Skipping smoke test of %s since its content passed before.",
+                   remote_archive)
 
   def assert_correct_metadata(self,
                               metadata: Mapping[str, AbstractSet[str]]) -> None:
@@ -905,20 +1250,252 @@ class PublisherParsingPolicy(ParsingPolicy):
     ]
 
 
+class PublisherRegistry:
+  """Per-run registry of publishers shared by all DocumentationParsers.
+
+  There are much fewer publishers than documents so the existence of each
+  PUBLISHER/PUBLISHER.md file is only checked once per run. The registry also
+  counts the validated documents of each publisher by their type.
+  """
+
+  def __init__(
+      self,
+      documentation_dir: str,
+      path_index: Optional[path_index_lib.DocumentationPathIndex] = None
+  ) -> None:
+    self._documentation_dir = documentation_dir
+    self._path_index = path_index
+    self._page_exists_by_publisher: Dict[str, bool] = dict()
+    self._type_counts_by_publisher: Dict[str, collections.Counter] = (
+        collections.defaultdict(collections.Counter))
+
+  def get_publisher_page_path(self, publisher: str) -> str:
+    """Returns the expected path of the publisher documentation page."""
+    publisher_policy = PublisherParsingPolicy({}, publisher)
+    return publisher_policy.get_allowed_file_paths(self._documentation_dir)[0]
+
+  def has_publisher_page(self, publisher: str) -> bool:
+    """Returns True if the publisher documentation page exists."""
+    if publisher not in self._page_exists_by_publisher:
+      path = self.get_publisher_page_path(publisher)
+      exists = self._path_index.exists if self._path_index else (
+          filesystem_utils.exists)
+      self._page_exists_by_publisher[publisher] = exists(path)
+    return self._page_exists_by_publisher[publisher]
+
+  def record_document(self, publisher: str, type_name: str) -> None:
+    """Counts a document of the publisher with the policy type name."""
+    self._type_counts_by_publisher[publisher][type_name] += 1
+
+  @property
+  def statistics(self) -> Mapping[str, Mapping[str, int]]:
+    """Mapping from publisher to a mapping from document type to its count."""
+    return {
+        publisher: dict(type_counts)
+        for publisher, type_counts in sorted(
+            self._type_counts_by_publisher.items())
+    }
+
+  def log_statistics(self) -> None:
+    """Logs the number of documents of each publisher and type."""
+    _log_publisher_statistics(self.statistics)
+
+
+def _log_publisher_statistics(
+    statistics: Mapping[str, Mapping[str, int]]) -> None:
+  for publisher, type_counts in statistics.items():
+    logging.info("Publisher %s: %d documents %s.", publisher,
+                 sum(type_counts.values()), sorted(type_counts.items()))
+
+
+class ModelDocumentationResolver:
+  """Maps each model to the versions and paths of its documentation files.
+
+  Models are keyed like their tfhub.dev URLs by the (URL prefix, publisher,
+  model name) triple, e.g. ("lite-model/", "google", "yamnet/classification").
+  The URL prefix is "" for SavedModels. A file is found for exactly the models
+  whose ParsingPolicy.get_allowed_file_paths would glob it, so checking a model
+  URL is a dictionary lookup instead of globbing the filesystem.
+  """
+
+  def __init__(self, documentation_dir: str,
+               file_paths: Iterable[str] = ()) -> None:
+    """Initializes the resolver.
+
+    Args:
+      documentation_dir: Path to the `assets/docs` directory.
+      file_paths: Paths of all files below `documentation_dir`, starting with
+        `documentation_dir`, e.g. a path_index_lib.DocumentationPathIndex.
+    """
+    self._documentation_dir = documentation_dir
+    self._paths_by_version_by_model: Dict[Tuple[str, str, str], Dict[
+        str, List[str]]] = collections.defaultdict(
+            lambda: collections.defaultdict(list))
+    for file_path in file_paths:
+      self.add(file_path)
+
+  @classmethod
+  def from_dir(cls, documentation_dir: str) -> "ModelDocumentationResolver":
+    """Builds a resolver by walking all files below `documentation_dir`."""
+    return cls(documentation_dir,
+               filesystem_utils.recursive_list_dir(documentation_dir))
+
+  def add(self, file_path: str) -> None:
+    """Adds a file starting with the documentation directory.
+
+    A file at PUBLISHER/(models/)NAME/(tfjs/|lite/|coral/)VERSION.md is added
+    to every model whose documentation could be stored there. For example,
+    google/models/yamnet/lite/1.md is stored for the SavedModel "yamnet/lite",
+    the SavedModel "models/yamnet/lite" and the Lite models "yamnet" and
+    "models/yamnet".
+
+    Args:
+      file_path: Path of a file below the documentation directory.
+    """
+    parts = os.path.relpath(file_path, self._documentation_dir).split(os.sep)
+    if len(parts) < 3 or not parts[-1].endswith(".md"):
+      return
+    publisher, name_parts, version = parts[0], parts[1:-1], parts[-1][:-3]
+    candidates = [("", name_parts)]
+    if len(name_parts) > 1 and name_parts[-1] in _URL_PREFIX_BY_TYPE_DIR:
+      candidates.append(
+          (_URL_PREFIX_BY_TYPE_DIR[name_parts[-1]], name_parts[:-1]))
+    for url_prefix, name_parts in candidates:
+      names = ["/".join(name_parts)]
+      if name_parts[0] == _MODELS_DIR and len(name_parts) > 1:
+        names.append("/".join(name_parts[1:]))
+      for name in names:
+        paths = self._paths_by_version_by_model[(url_prefix, publisher,
+                                                 name)][version]
+        if file_path not in paths:
+          paths.append(file_path)
+          paths.sort()
+
+  def get_versions(self, url_prefix: str, publisher: str,
+                   name: str) -> List[str]:
+    """Returns the versions of a model with documentation sorted numerically.
+
+    Args:
+      url_prefix: "tfjs-model/", "lite-model/", "coral-model/" or "" for
+        SavedModels.
+      publisher: Publisher of the model e.g. "google".
+      name: Name of the model without version e.g. "bert".
+    """
+    paths_by_version = self._paths_by_version_by_model.get(
+        (url_prefix, publisher, name), {})
+    return sorted(
+        paths_by_version,
+        key=lambda version: (not version.isdigit(),
+                             int(version) if version.isdigit() else 0, version))
+
+  def get_paths(self,
+                url_prefix: str,
+                publisher: str,
+                name: str,
+                version: str = "*") -> List[str]:
+    """Returns the documentation files of a model version.
+
+    Args:
+      url_prefix: "tfjs-model/", "lite-model/", "coral-model/" or "" for
+        SavedModels.
+      publisher: Publisher of the model e.g. "google".
+      name: Name of the model without version e.g. "bert".
+      version: Version of the model or "*" for the files of all versions.
+
+    Returns:
+      The paths in the order of the versions.
+    """
+    paths_by_version = self._paths_by_version_by_model.get(
+        (url_prefix, publisher, name), {})
+    if version != "*":
+      return list(paths_by_version.get(version, []))
+    return [
+        path for version in self.get_versions(url_prefix, publisher, name)
+        for path in paths_by_version[version]
+    ]
+
+  def resolve_url(self, url: str) -> List[str]:
+    """Returns the documentation files of the first tfhub.dev model URL.
+
+    Args:
+      url: URL like https://tfhub.dev/google/bert/1 or, for all versions,
+        https://tfhub.dev/google/bert.
+
+    Returns:
+      The paths of the documentation files, which is empty if `url` is not a
+      tfhub.dev model URL.
+    """
+    for model_url in _get_model_urls_in_line(url):
+      return self.get_paths(*model_url)
+    return []
+
+
+class _LazyLines:
+  """Lines of a text file that are only read once they are accessed.
+
+  Lines are split at "\n" like `content.split("\n")` so that e.g. a trailing
+  newline yields a last empty line and "\r" is kept.
+  """
+
+  def __init__(self, text_file: IO[str]) -> None:
+    self._file = text_file
+    self._lines: List[str] = []
+    self._incomplete_line = ""
+    self._is_file_read = False
+
+  def _read_until(self, index: int) -> None:
+    """Reads the file until the line at `index` or the end of the file."""
+    while len(self._lines) <= index and not self._is_file_read:
+      chunk = self._file.read(_READ_CHUNK_SIZE)
+      if not chunk:
+        self._lines.append(self._incomplete_line)
+        self._is_file_read = True
+        break
+      lines = (self._incomplete_line + chunk).split("\n")
+      self._incomplete_line = lines.pop()
+      self._lines.extend(lines)
+
+  def __getitem__(self, index: int) -> str:
+    """Returns the line at a non-negative `index` or raises an IndexError."""
+    self._read_until(index)
+    return self._lines[index]
+
+  def has_line(self, index: int) -> bool:
+    self._read_until(index)
+    return index < len(self._lines)
+
+  def get_lines_from(self, index: int) -> List[str]:
+    """Reads the rest of the file and returns all lines starting at `index`."""
+    self._read_until(sys.maxsize)
+    return self._lines[index:]
+
+
 class DocumentationParser:
   """Class used for parsing model documentation strings."""
 
   def __init__(
-      self, root_dir: str, documentation_dir: str,
-      yaml_parser_by_tag_name: Mapping[str, yaml_parser_lib.AbstractYamlParser]
+      self,
+      root_dir: str,
+      documentation_dir: str,
+      yaml_parser_by_tag_name: Mapping[str, yaml_parser_lib.AbstractYamlParser],
+      path_index: Optional[path_index_lib.DocumentationPathIndex] = None,
+      publisher_registry: Optional[PublisherRegistry] = None,
+      model_resolver: Optional[ModelDocumentationResolver] = None,
+      phase_timer: phase_timing_lib.PhaseTimer = (
+          phase_timing_lib.DISABLED_PHASE_TIMER)
   ) -> None:
     self._root_dir = root_dir
     self._documentation_dir = documentation_dir
     self._yaml_parser_by_tag_name = yaml_parser_by_tag_name
+    self._path_index = path_index
+    self._model_resolver = model_resolver
+    self._publisher_registry = publisher_registry or PublisherRegistry(
+        documentation_dir, path_index)
+    self._phase_timer = phase_timer
     self._parsed_metadata = dict()
     self._parsed_description = ""
     self._file_path = ""
-    self._lines = []
+    self._lines: Optional[_LazyLines] = None
     self._current_index = 0
     self.policy = None
 
@@ -935,12 +1512,10 @@ class DocumentationParser:
 
   def _assert_publisher_page_exists(self) -> None:
     """Asserts that publisher page exists for the publisher of this model."""
-    # Use a publisher policy to get the expected documentation page path.
-    publisher_policy = PublisherParsingPolicy(self._yaml_parser_by_tag_name,
-                                              self.policy.publisher)
-    expected_publisher_doc_file_path = publisher_policy.get_allowed_file_paths(
-        self._documentation_dir)[0]
-    if not tf.io.gfile.exists(expected_publisher_doc_file_path):
+    publisher = self.policy.publisher
+    if not self._publisher_registry.has_publisher_page(publisher):
+      expected_publisher_doc_file_path = (
+          self._publisher_registry.get_publisher_page_path(publisher))
       self._raise_error(
           "Publisher documentation does not exist. "
           f"It should be added to {expected_publisher_doc_file_path}.")
@@ -964,8 +1539,8 @@ class DocumentationParser:
 
   def _consume_metadata(self) -> None:
     """Consumes all metadata."""
-    while self._current_index < len(
-        self._lines) and (not self._lines[self._current_index].startswith("#")):
+    while self._lines.has_line(self._current_index) and (
+        not self._lines[self._current_index].startswith("#")):
       if not self._lines[self._current_index]:
         # Empty line is ok.
         self._current_index += 1
@@ -997,39 +1572,209 @@ class DocumentationParser:
           "https://www.tensorflow.org/hub/writing_model_documentation for "
           "information about markdown format.")
 
-  def validate(self, validation_config: ValidationConfig,
-               file_path: str) -> None:
-    """Validate one documentation markdown file."""
-    self._file_path = file_path
-    raw_content = filesystem_utils.get_content(self._file_path)
-    self._lines = raw_content.split("\n")
+  def _consume_handle(self, text_file: IO[str]) -> None:
+    """Starts reading a file and sets the policy matching its first line."""
+    self._parsed_metadata = dict()
+    self._parsed_description = ""
+    self._current_index = 0
+    self.policy = None
+    # Only the handle, description and metadata are read unless the policy
+    # checks the content below the metadata.
+    self._lines = _LazyLines(text_file)
     first_line = self._lines[0].replace("&zwnj;", "")
     self.policy = ParsingPolicy.from_string(first_line,
                                             self._yaml_parser_by_tag_name)
 
-    try:
-      self._assert_publisher_page_exists()
-      if not validation_config.skip_file_path_check:
-        self.policy.assert_correct_file_path(self._file_path,
-                                             self._documentation_dir)
-      # Populate _parsed_description with the description
+  def parse(self, file_path: str) -> None:
+    """Parses the handle, description and metadata without validating them.
+
+    Args:
+      file_path: Path to a documentation markdown file.
+
+    Raises:
+      MarkdownDocumentationError: if the handle, description or metadata cannot
+        be parsed.
+    """
+    self._file_path = file_path
+    with filesystem_utils.open_file(self._file_path) as f:
+      self._consume_handle(f)
       self._consume_description()
-      # Populate _parsed_metadata with the metadata tag mapping
       self._consume_metadata()
-      self.policy.assert_correct_metadata(self._parsed_metadata)
-      if not validation_config.skip_content_check:
-        self.policy.assert_correct_content(self._documentation_dir,
-                                           self._lines[self._current_index:])
-      if not validation_config.skip_asset_check:
-        self.policy.validate_asset_path(validation_config,
-                                        self._parsed_metadata, self._file_path)
-    except MarkdownDocumentationError as e:
-      self._raise_error(str(e))
-
-
-def validate_documentation_dir(validation_config: ValidationConfig,
-                               root_dir: str,
-                               relative_docs_path: str = DOCS_PATH) -> None:
+
+  def validate(self, validation_config: ValidationConfig,
+               file_path: str) -> None:
+    """Validate one documentation markdown file."""
+    self._file_path = file_path
+    timer = self._phase_timer
+    with filesystem_utils.open_file(self._file_path) as f:
+      with timer.phase("handle"):
+        self._consume_handle(f)
+
+      try:
+        with timer.phase("publisher_page"):
+          self._assert_publisher_page_exists()
+        if not validation_config.skip_file_path_check:
+          with timer.phase("file_path"):
+            self.policy.assert_correct_file_path(
+                os.path.relpath(self._file_path, self._documentation_dir),
+                self._documentation_dir, self._path_index)
+        with timer.phase("parse_metadata"):
+          # Populate _parsed_description with the description
+          self._consume_description()
+          # Populate _parsed_metadata with the metadata tag mapping
+          self._consume_metadata()
+        with timer.phase("tags"):
+          self.policy.assert_correct_metadata(self._parsed_metadata)
+        if (not validation_config.skip_content_check and
+            self.policy.requires_body):
+          with timer.phase("content"):
+            self.policy.assert_correct_content(
+                self._documentation_dir,
+                self._lines.get_lines_from(self._current_index),
+                self._model_resolver)
+        if not validation_config.skip_asset_check:
+          with timer.phase("asset"):
+            self.policy.validate_asset_path(validation_config,
+                                            self._parsed_metadata,
+                                            self._file_path)
+      except MarkdownDocumentationError as e:
+        self._raise_error(str(e))
+
+
+def _get_linked_file_patterns(absolute_path: str) -> Optional[List[str]]:
+  """Returns the patterns of the model pages linked from a collection.
+
+  Args:
+    absolute_path: Path to a documentation file.
+
+  Returns:
+    The allowed paths of all linked model pages relative to the `assets/docs`
+    directory, which can contain a "*" for URLs without version, or None if the
+    file is not a readable collection.
+  """
+  try:
+    with filesystem_utils.open_file(absolute_path) as f:
+      lines = _LazyLines(f)
+      if _get_handle_keyword(lines[0].replace("&zwnj;", "")) != "Collection":
+        return None
+      lines = lines.get_lines_from(1)
+  except (OSError, UnicodeDecodeError):
+    return None
+  return sorted({
+      pattern for model_url in _get_distinct_model_urls(lines)
+      for pattern in _get_policy_for_model_url(
+          *model_url).get_allowed_file_paths("")
+  })
+
+
+def _update_link_graph(link_graph: link_graph_lib.LinkGraph,
+                       documentation_dir: str,
+                       file_paths: Iterable[str]) -> None:
+  """Replaces the links of files relative to `documentation_dir` in the graph.
+
+  Files that are deleted or no collections are removed from the graph.
+  """
+  for file_path in file_paths:
+    patterns = None
+    if file_path.endswith(".md"):
+      patterns = _get_linked_file_patterns(
+          os.path.join(documentation_dir, file_path))
+    if patterns is None:
+      link_graph.remove_source(file_path)
+    else:
+      link_graph.set_links(file_path, patterns)
+
+
+def _build_link_graph(documentation_dir: str,
+                      file_paths: Iterable[str]) -> link_graph_lib.LinkGraph:
+  """Returns the links from collections to model pages of all given files."""
+  link_graph = link_graph_lib.LinkGraph()
+  _update_link_graph(link_graph, documentation_dir, file_paths)
+  logging.info("Found %d links from %d collections.", len(link_graph),
+               len(link_graph.sources))
+  return link_graph
+
+
+def _add_linking_collections(documentation_dir: str,
+                             files_to_validate: Sequence[str],
+                             link_graph_file: str) -> List[str]:
+  """Adds the collections that link to changed or deleted files.
+
+  The graph is loaded from `link_graph_file` or built from all files if it does
+  not exist yet. It is then updated with the given files and saved again.
+
+  Args:
+    documentation_dir: Absolute path to the `assets/docs` directory.
+    files_to_validate: Changed files relative to `documentation_dir`. Files
+      that do not exist are treated as deleted.
+    link_graph_file: Local path to the link graph.
+
+  Returns:
+    The existing files of `files_to_validate` followed by all collections that
+    link to any of `files_to_validate`.
+  """
+  if os.path.exists(link_graph_file):
+    link_graph = link_graph_lib.LinkGraph.load(link_graph_file)
+  else:
+    logging.info("Building link graph %s from all files.", link_graph_file)
+    link_graph = _build_link_graph(documentation_dir, [
+        os.path.relpath(file_path, documentation_dir) for file_path in
+        filesystem_utils.recursive_list_dir(documentation_dir)
+    ])
+  existing_files = []
+  for file_path in files_to_validate:
+    if filesystem_utils.exists(os.path.join(documentation_dir, file_path)):
+      existing_files.append(file_path)
+    else:
+      logging.info("Not validating deleted file %s.", file_path)
+  linking_collections = [
+      file_path for file_path in sorted(
+          link_graph.get_linking_sources(files_to_validate) -
+          set(files_to_validate))
+      if filesystem_utils.exists(os.path.join(documentation_dir, file_path))
+  ]
+  if linking_collections:
+    logging.info("Also validating collections %s that link to changed files.",
+                 linking_collections)
+  _update_link_graph(link_graph, documentation_dir, files_to_validate)
+  link_graph.save(link_graph_file)
+  return existing_files + linking_collections
+
+
+def _walk_markdown_files(documentation_dir: str) -> Iterator[str]:
+  """Yields the paths of the Markdown files below `documentation_dir`.
+
+  Other files are pruned during the walk since they cannot be documentation.
+  They are counted in a single log line once the walk is complete.
+  """
+  num_skipped_files = 0
+  for file_path in filesystem_utils.recursive_list_dir(documentation_dir):
+    if file_path.endswith(".md"):
+      yield file_path
+    else:
+      num_skipped_files += 1
+      logging.debug("Skipping %s since it is no Markdown file.", file_path)
+  if num_skipped_files:
+    logging.warning("Skipped %d files since they are no Markdown files.",
+                    num_skipped_files)
+
+
+@tracing.traced("run")
+def validate_documentation_dir(
+    validation_config: ValidationConfig,
+    root_dir: str,
+    relative_docs_path: str = DOCS_PATH,
+    jobs: int = 1,
+    cache_file: Optional[str] = None,
+    link_graph_file: Optional[str] = None,
+    num_shards: int = 1,
+    shard_index: int = 0,
+    result_file: Optional[str] = None,
+    result_sinks: Sequence[result_sinks_lib.ResultSink] = (),
+    log_phase_timings: bool = False,
+    phase_timings_file: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    profile_slowest_files: int = 0) -> None:
   """Validate Markdown files in `root_dir/relative_docs_path`.
 
   Args:
@@ -1039,27 +1784,371 @@ def validate_documentation_dir(validation_config: ValidationConfig,
       and YAML config files.
     relative_docs_path: Relative path under `root_dir` containing the Markdown
       files. Defaults to "assets/docs".
+    jobs: Number of processes that validate files in parallel or number of
+      threads if models are smoke tested. Defaults to 1.
+    cache_file: Optional; Local path to a cache of successfully validated
+      files, which are skipped if they did not change.
+    link_graph_file: Optional; Local path to which the links from collections
+      to model pages are written for later runs of
+      validate_documentation_files.
+    num_shards: Number of shards into which the files are split. Defaults to
+      1.
+    shard_index: Index of the shard to validate, see
+      validate_documentation_files. Defaults to 0.
+    result_file: Optional; Local path to which the result is written.
+    result_sinks: Optional; Sinks to which the result of each file is written
+      as soon as it is known.
+    log_phase_timings: Whether to log the time spent in each phase of the
+      validation. Defaults to False.
+    phase_timings_file: Optional; Local path to which the time spent in each
+      phase is written as JSON.
+    profile_dir: Optional; Local directory to which the cProfile statistics
+      of the slowest files are written.
+    profile_slowest_files: Number of slowest files whose validation is
+      profiled. Defaults to 0.
 
   Raises:
     MarkdownDocumentationError: if invalid Markdown files have been found.
   """
   documentation_dir = os.path.join(root_dir, relative_docs_path)
   logging.info("Validating all files in %s.", documentation_dir)
-  relative_paths = [
-      os.path.relpath(file_path, documentation_dir)
-      for file_path in filesystem_utils.recursive_list_dir(documentation_dir)
-  ]
+  # Checks of file paths, publisher pages and collections need the paths of
+  # all files before the first file is validated. The index holds them compactly
+  # per directory and the files are then streamed from it, so that no other
+  # list of all files is built.
+  path_index = path_index_lib.DocumentationPathIndex(
+      documentation_dir, _walk_markdown_files(documentation_dir))
+  logging.info("Found %d Markdown files.", len(path_index))
+  if link_graph_file:
+    _build_link_graph(documentation_dir,
+                      path_index.iter_relative_paths()).save(link_graph_file)
   validate_documentation_files(
       validation_config,
       root_dir,
-      relative_paths,
-      relative_docs_path=relative_docs_path)
+      path_index.iter_relative_paths(),
+      relative_docs_path=relative_docs_path,
+      path_index=path_index,
+      jobs=jobs,
+      cache_file=cache_file,
+      num_shards=num_shards,
+      shard_index=shard_index,
+      result_file=result_file,
+      result_sinks=result_sinks,
+      log_phase_timings=log_phase_timings,
+      phase_timings_file=phase_timings_file,
+      profile_dir=profile_dir,
+      profile_slowest_files=profile_slowest_files)
+
+
+class _FileValidator:
+  """Validates files with state that is shared by all files of a run."""
+
+  def __init__(
+      self, validation_config: ValidationConfig, root_dir: str,
+      documentation_dir: str,
+      path_index: Optional[path_index_lib.DocumentationPathIndex],
+      time_phases: bool = False,
+      profile_dir: Optional[str] = None,
+      profile_slowest_files: int = 0) -> None:
+    self._validation_config = validation_config
+    self._root_dir = root_dir
+    self._documentation_dir = documentation_dir
+    self._path_index = path_index
+    self._time_phases = time_phases
+    self._file_profiler = None
+    if profile_slowest_files:
+      self._file_profiler = profiling.SlowestFilesProfiler(
+          profile_dir, profile_slowest_files)
+    # Passing this map prevents re-initializing the needed parsers for each
+    # document, which would be IO heavy due to reading configs from YAML files.
+    self._yaml_parser_by_tag_name = {
+        tag_name:
+        yaml_parser_lib.AbstractYamlParser.from_tag_name(root_dir, tag_name)
+        for tag_name in yaml_parser_lib.TAG_TO_YAML_MAP
+    }
+    # Publisher pages are shared by many documents and only checked once.
+    self._publisher_registry = PublisherRegistry(documentation_dir, path_index)
+    # Resolves the model URLs of all collections without globbing.
+    self._model_resolver = (
+        ModelDocumentationResolver(documentation_dir, path_index)
+        if path_index is not None else None)
+    # Phases are also timed to record them as spans while tracing.
+    self._use_phase_timer = time_phases or tracing.is_enabled()
+    # Each thread reuses its DocumentationParser and PhaseTimer for all of its
+    # files, since parsers are stateful.
+    self._thread_local = threading.local()
+
+  def _get_parser(
+      self
+  ) -> Tuple["DocumentationParser", phase_timing_lib.PhaseTimer]:
+    """Returns the DocumentationParser and PhaseTimer of this thread."""
+    parser_and_timer = getattr(self._thread_local, "parser_and_timer", None)
+    if parser_and_timer is None:
+      phase_timer = (
+          phase_timing_lib.PhaseTimer() if self._use_phase_timer else
+          phase_timing_lib.DISABLED_PHASE_TIMER)
+      parser_and_timer = (DocumentationParser(self._root_dir,
+                                              self._documentation_dir,
+                                              self._yaml_parser_by_tag_name,
+                                              self._path_index,
+                                              self._publisher_registry,
+                                              self._model_resolver,
+                                              phase_timer), phase_timer)
+      self._thread_local.parser_and_timer = parser_and_timer
+    return parser_and_timer
+
+  def warm_up(self) -> None:
+    """Loads all YAML configs, which would otherwise be loaded on first use."""
+    self._validation_config.get_asset_cache()
+    for yaml_parser in self._yaml_parser_by_tag_name.values():
+      try:
+        yaml_parser.assert_tag_values_are_correct(set())
+      except Exception:  # pylint: disable=broad-except
+        # The error is raised again when validating a document with the tag.
+        pass
+
+  def validate(self, file_path: str) -> result_sinks_lib.FileResult:
+    """Validates a file relative to the `assets/docs` directory."""
+    logging.info("Validating %s.", file_path)
+    documentation_parser, phase_timer = self._get_parser()
+    phase_timer.reset()
+    result = result_sinks_lib.FileResult(file_path)
+    absolute_path = os.path.join(self._documentation_dir, file_path)
+
+    def validate_file() -> Optional[str]:
+      try:
+        documentation_parser.validate(self._validation_config, absolute_path)
+      except MarkdownDocumentationError as e:
+        return str(e)
+      return None
+
+    start_time = time.perf_counter()
+    with tracing.span(file_path, "file"):
+      if self._file_profiler is None:
+        result.error = validate_file()
+      else:
+        result.error, result.profiled_seconds = self._file_profiler.profile(
+            file_path, validate_file)
+    result.duration_seconds = time.perf_counter() - start_time
+    if self._time_phases:
+      result.phase_seconds = phase_timer.seconds_by_phase
+    if documentation_parser.policy is not None:
+      result.publisher = documentation_parser.policy.publisher
+      result.type_name = documentation_parser.policy.type_name
+    return result
+
+
+# The _FileValidator of a worker process of validate_documentation_files.
+_worker_file_validator: Optional[_FileValidator] = None
+
+
+def _init_worker(
+    asset_path_modified_by_file: Mapping[Tuple[str, str], bool],
+    modified_asset_paths_by_dir: Mapping[Tuple[str, str], AbstractSet[str]],
+    trace: bool, *file_validator_args) -> None:
+  global _worker_file_validator
+  # Share the git results of the parent, which are not inherited when worker
+  # processes are spawned instead of forked.
+  _asset_path_modified_by_file.update(asset_path_modified_by_file)
+  _modified_asset_paths_by_dir.update(modified_asset_paths_by_dir)
+  # A forked worker inherits the events of the parent, which must not be
+  # returned a second time.
+  tracing.stop()
+  if trace:
+    tracing.start(f"validator worker {os.getpid()}")
+  _worker_file_validator = _FileValidator(*file_validator_args)
+  _worker_file_validator.warm_up()
+
+
+def _validate_in_worker(file_path: str) -> result_sinks_lib.FileResult:
+  result = _worker_file_validator.validate(file_path)
+  if tracing.is_enabled():
+    # Includes the events of warming up with the first file of the worker.
+    result.trace_events = tracing.drain_events()
+  return result
+
+
+def _validate_chunk_in_worker(
+    file_paths: Sequence[str]) -> List[result_sinks_lib.FileResult]:
+  return [_validate_in_worker(file_path) for file_path in file_paths]
+
+
+def _iter_chunks(items: Iterable[_T], chunk_size: int) -> Iterator[List[_T]]:
+  """Yields lists of `chunk_size` consecutive items and a shorter last list."""
+  iterator = iter(items)
+  while True:
+    chunk = list(itertools.islice(iterator, chunk_size))
+    if not chunk:
+      return
+    yield chunk
+
+
+def _map_bounded(executor: futures.Executor, function: Callable[[_T], _U],
+                 items: Iterable[_T], max_pending: int) -> Iterator[_U]:
+  """Yields the results of `function` for all items in the order of `items`.
 
+  Unlike Executor.map, which submits all items at once, at most `max_pending`
+  items are submitted ahead of the consumed results, so that the items can be
+  generated lazily and their results do not pile up.
 
-def validate_documentation_files(validation_config: ValidationConfig,
-                                 root_dir: str,
-                                 files_to_validate: MutableSequence[str],
-                                 relative_docs_path: str = DOCS_PATH) -> None:
+  Args:
+    executor: Executor that runs `function`.
+    function: Function that is called with each item.
+    items: Items, which are only consumed as results are yielded.
+    max_pending: Maximum number of submitted items whose result was not yielded
+      yet.
+  """
+  pending = collections.deque()
+  for item in items:
+    if len(pending) >= max_pending:
+      yield pending.popleft().result()
+    pending.append(executor.submit(function, item))
+  while pending:
+    yield pending.popleft().result()
+
+
+def _validate_files(
+    validation_config: ValidationConfig, root_dir: str, documentation_dir: str,
+    files_to_validate: Iterable[str],
+    path_index: Optional[path_index_lib.DocumentationPathIndex], jobs: int,
+    time_phases: bool, profile_dir: Optional[str],
+    profile_slowest_files: int) -> Iterator[result_sinks_lib.FileResult]:
+  """Yields the validation results in the order of `files_to_validate`.
+
+  The files are consumed lazily, at most a few tasks per job ahead of the
+  yielded results.
+  """
+  file_validator_args = (validation_config, root_dir, documentation_dir,
+                         path_index, time_phases, profile_dir,
+                         profile_slowest_files)
+  files_to_validate = iter(files_to_validate)
+  # A pool is not worth starting for a single file.
+  first_files = list(itertools.islice(files_to_validate, 2))
+  files_to_validate = itertools.chain(first_files, files_to_validate)
+  if jobs <= 1 or len(first_files) <= 1:
+    file_validator = _FileValidator(*file_validator_args)
+    for file_path in files_to_validate:
+      yield file_validator.validate(file_path)
+    return
+
+  if validation_config.do_smoke_test:
+    # Smoke tests mostly wait for downloads, so threads suffice. They share
+    # one _FileValidator and thereby the rate limiter and asset cache.
+    logging.info("Smoke testing files in %d threads.", jobs)
+    file_validator = _FileValidator(*file_validator_args)
+    file_validator.warm_up()
+    with futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+      yield from _map_bounded(executor, file_validator.validate,
+                              files_to_validate, _PENDING_TASKS_PER_JOB * jobs)
+    return
+
+  logging.info("Validating files in %d processes.", jobs)
+  with futures.ProcessPoolExecutor(
+      max_workers=jobs,
+      initializer=_init_worker,
+      initargs=(_asset_path_modified_by_file, _modified_asset_paths_by_dir,
+                tracing.is_enabled(), *file_validator_args)) as executor:
+    # Results are yielded in order, which keeps the report stable. Files are
+    # sent in chunks to amortize the communication with the workers.
+    for results in _map_bounded(
+        executor, _validate_chunk_in_worker,
+        _iter_chunks(files_to_validate, _WORKER_CHUNK_SIZE),
+        _PENDING_TASKS_PER_JOB * jobs):
+      yield from results
+
+
+def _get_validation_environment_key(
+    validation_config: ValidationConfig, root_dir: str, documentation_dir: str,
+    path_index: path_index_lib.DocumentationPathIndex) -> str:
+  """Returns a key of everything but the file that influences its validation.
+
+  Args:
+    validation_config: The config of the validation run.
+    root_dir: Absolute path to the top-level dir that contains the YAML tag
+      definition files.
+    documentation_dir: Absolute path to the `assets/docs` directory.
+    path_index: Index of all files in `documentation_dir`, which influences
+      file path, publisher and collection checks.
+  """
+  parts = [repr(validation_config)]
+  # The source code stands in for the validator version. Besides the parser,
+  # the path index and the filesystem utils decide which files are read and
+  # how, e.g. how many header lines.
+  for module_file in [
+      __file__, yaml_parser_lib.__file__, path_index_lib.__file__,
+      filesystem_utils.__file__
+  ]:
+    with open(module_file) as f:
+      parts.append(f.read())
+  for relative_tag_file in sorted(yaml_parser_lib.TAG_TO_YAML_MAP.values()):
+    tag_file = os.path.join(root_dir, relative_tag_file)
+    parts.append(relative_tag_file)
+    if filesystem_utils.exists(tag_file):
+      parts.append(filesystem_utils.get_content(tag_file))
+  parts.extend(
+      sorted(os.path.relpath(path, documentation_dir) for path in path_index))
+  return validation_cache_lib.compute_key(parts)
+
+
+def _get_file_cache_key(validation_config: ValidationConfig,
+                        documentation_dir: str,
+                        file_path: str) -> Optional[str]:
+  """Returns the key of a file for the validation cache if it is readable.
+
+  The key covers the full content of the file, so it is read in full even if
+  its validation only needs the header lines.
+  """
+  absolute_path = os.path.join(documentation_dir, file_path)
+  try:
+    content = filesystem_utils.get_content(absolute_path)
+  except (OSError, UnicodeDecodeError):
+    return None
+  asset_path_modified = (not validation_config.skip_asset_check and
+                         _is_asset_path_modified(absolute_path,
+                                                 validation_config.base_ref))
+  return validation_cache_lib.compute_key(
+      [file_path, content, str(asset_path_modified)])
+
+
+def _skip_cached_files(
+    validation_config: ValidationConfig, documentation_dir: str,
+    validation_cache: validation_cache_lib.ValidationCache,
+    files: Iterable[str], file_cache_keys: Dict[str, Optional[str]],
+    result_sinks: Sequence[result_sinks_lib.ResultSink]) -> Iterator[str]:
+  """Yields the files that changed since their last successful validation.
+
+  The cache keys of the yielded files are stored in `file_cache_keys` until
+  their result is known. Skipped files are written to the sinks as cached.
+  """
+  for file_path in files:
+    file_cache_key = _get_file_cache_key(validation_config, documentation_dir,
+                                         file_path)
+    if validation_cache.contains(file_path, file_cache_key):
+      for result_sink in result_sinks:
+        result_sink.write(result_sinks_lib.FileResult(file_path, cached=True))
+    else:
+      file_cache_keys[file_path] = file_cache_key
+      yield file_path
+
+
+@tracing.traced("run")
+def validate_documentation_files(
+    validation_config: ValidationConfig,
+    root_dir: str,
+    files_to_validate: Iterable[str],
+    relative_docs_path: str = DOCS_PATH,
+    path_index: Optional[path_index_lib.DocumentationPathIndex] = None,
+    jobs: int = 1,
+    cache_file: Optional[str] = None,
+    link_graph_file: Optional[str] = None,
+    num_shards: int = 1,
+    shard_index: int = 0,
+    result_file: Optional[str] = None,
+    result_sinks: Sequence[result_sinks_lib.ResultSink] = (),
+    log_phase_timings: bool = False,
+    phase_timings_file: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    profile_slowest_files: int = 0) -> None:
   """Validate specified Markdown documentation files.
 
   Args:
@@ -1067,47 +2156,206 @@ def validate_documentation_files(validation_config: ValidationConfig,
       be validated and the remote path be downloaded.
     root_dir: Absolute path to the top-level dir that contains Markdown files
       and YAML config files.
-    files_to_validate: List of file paths in `root_dir` that should be
-      validated.
+    files_to_validate: File paths in `root_dir` that should be validated. They
+      are consumed lazily unless `link_graph_file` is set, so that a generator
+      of many files does not need to be held in memory.
     relative_docs_path: Relative path under `root_dir` containing the Markdown
       files. Defaults to "assets/docs".
+    path_index: Optional; Index of all files in the documentation directory.
+      If not set, file paths are checked by globbing the filesystem, which is
+      cheaper when only a few files are validated.
+    jobs: Number of processes that validate files in parallel or number of
+      threads if models are smoke tested. Defaults to 1, which validates all
+      files sequentially in the current process.
+    cache_file: Optional; Local path to a validation cache. Files that were
+      validated successfully with the same content, tag definition files, set
+      of documentation files and validator version are skipped. Every file is
+      read in full to compute its key. The cache is not used when models are
+      smoke tested.
+    link_graph_file: Optional; Local path to the links from collections to
+      model pages. If set, the collections linking to any of
+      `files_to_validate` are validated as well and files that do not exist
+      are treated as deleted instead of failing. The graph is built on first
+      use and updated with `files_to_validate`.
+    num_shards: Number of shards into which the files are split by a stable
+      hash of their path. Defaults to 1. Checks involving other files, e.g.
+      of publisher pages and collection links, still see all files.
+    shard_index: Index of the shard whose files are validated, from 0 to
+      `num_shards` - 1. Defaults to 0.
+    result_file: Optional; Local path to which the result is written, even if
+      invalid files are found. The results of all shards can be combined with
+      merge_result_files.
+    result_sinks: Optional; Sinks to which the result of each file is written
+      as soon as it is known. If set, the errors are not collected for the
+      raised error unless `result_file` is set as well, which keeps the memory
+      use independent of the number of invalid files.
+    log_phase_timings: Whether to log a table of the time spent in each phase
+      of the validation, e.g. checking tags or downloading assets, per
+      document type. Defaults to False, which does not measure the phases.
+    phase_timings_file: Optional; Local path to which the time spent in each
+      phase per document type is written as JSON.
+    profile_dir: Optional; Local directory to which the cProfile statistics
+      of the slowest files are written. Defaults to the current directory.
+    profile_slowest_files: Number of slowest files whose validation is
+      profiled. Defaults to 0, which does not profile any file. The process
+      must not be profiled otherwise.
 
   Raises:
     MarkdownDocumentationError: if invalid Markdown files have been found.
+    ValueError: if `shard_index` is not a valid index.
   """
+  if not 0 <= shard_index < num_shards:
+    raise ValueError(f"Shard index {shard_index} is not in [0, {num_shards}).")
   documentation_dir = os.path.join(root_dir, relative_docs_path)
-  # Passing this map prevents re-initializing the needed parsers for each
-  # document, which would be IO heavy due to reading configs from YAML files.
-  yaml_parser_by_tag_name = {
-      tag_name:
-      yaml_parser_lib.AbstractYamlParser.from_tag_name(root_dir, tag_name)
-      for tag_name in yaml_parser_lib.TAG_TO_YAML_MAP
-  }
-  logging.info("Going to validate files %s in documentation directory %s.",
-               files_to_validate, documentation_dir)
+  if link_graph_file:
+    files_to_validate = _add_linking_collections(documentation_dir,
+                                                 list(files_to_validate),
+                                                 link_graph_file)
+  if num_shards > 1:
+    files_to_validate = (
+        file_path for file_path in files_to_validate
+        if validation_result_lib.get_shard_index(file_path, num_shards) ==
+        shard_index)
+    logging.info("Validating the files of shard %d of %d.", shard_index,
+                 num_shards)
+  logging.info("Going to validate files in documentation directory %s.",
+               documentation_dir)
+  if not validation_config.skip_asset_check:
+    # One git call for the whole directory instead of one per model document.
+    prefetch_asset_path_modifications_in_dir(documentation_dir,
+                                             validation_config.base_ref)
   validated = 0
+  invalid = 0
   file_to_error = dict()
-
-  for file_path in files_to_validate:
-    logging.info("Validating %s.", file_path)
-    documentation_parser = DocumentationParser(root_dir, documentation_dir,
-                                               yaml_parser_by_tag_name)
-    try:
-      absolute_path = os.path.join(documentation_dir, file_path)
-      documentation_parser.validate(validation_config, absolute_path)
+  # Sinks report each error, so the errors are only kept for the result file
+  # or for the raised error if there are no sinks.
+  keep_errors = not result_sinks or bool(result_file)
+  validation_cache = None
+  file_cache_keys = dict()
+  if cache_file and validation_config.do_smoke_test:
+    logging.info("Not using the validation cache since models are smoke "
+                 "tested.")
+  elif cache_file:
+    if path_index is None:
+      path_index = path_index_lib.DocumentationPathIndex.from_dir(
+          documentation_dir)
+    validation_cache = validation_cache_lib.ValidationCache(
+        cache_file,
+        _get_validation_environment_key(validation_config, root_dir,
+                                        documentation_dir, path_index))
+    files_to_validate = _skip_cached_files(validation_config,
+                                           documentation_dir,
+                                           validation_cache, files_to_validate,
+                                           file_cache_keys, result_sinks)
+  # Only used for statistics since each _FileValidator checks publisher pages.
+  publisher_registry = PublisherRegistry(documentation_dir)
+  phase_timings = None
+  if log_phase_timings or phase_timings_file:
+    phase_timings = phase_timing_lib.PhaseTimings()
+  profile_dir = profile_dir or os.getcwd()
+  # Min-heap of the (duration, file_path) of the slowest files. They are ranked
+  # by the same durations as in the SlowestFilesProfilers, which are shorter
+  # than `duration_seconds`, so that their profiles were kept.
+  slowest_files = []
+
+  for result in _validate_files(validation_config, root_dir, documentation_dir,
+                                files_to_validate, path_index, jobs,
+                                phase_timings is not None, profile_dir,
+                                profile_slowest_files):
+    if result.profiled_seconds is not None:
+      if len(slowest_files) < profile_slowest_files:
+        heapq.heappush(slowest_files,
+                       (result.profiled_seconds, result.file_path))
+      else:
+        heapq.heappushpop(slowest_files,
+                          (result.profiled_seconds, result.file_path))
+    if phase_timings is not None:
+      phase_timings.add(result.type_name, result.phase_seconds)
+    if result.trace_events:
+      tracing.add_events(result.trace_events)
+    if result.publisher is not None:
+      publisher_registry.record_document(result.publisher, result.type_name)
+    if result.error is None:
       validated += 1
-    except MarkdownDocumentationError as e:
-      file_to_error[file_path] = str(e)
+    else:
+      invalid += 1
+      if keep_errors:
+        file_to_error[result.file_path] = result.error
+    for result_sink in result_sinks:
+      result_sink.write(result)
+    if validation_cache is not None:
+      file_cache_key = file_cache_keys.pop(result.file_path, None)
+      if result.error is None and file_cache_key is not None:
+        validation_cache.add(result.file_path, file_cache_key)
+      else:
+        validation_cache.remove(result.file_path)
+    if (validated + invalid) % _PROGRESS_LOG_INTERVAL == 0:
+      logging.info("Validated %d files so far, %d of them invalid.",
+                   validated + invalid, invalid)
+  asset_cache = validation_config.get_asset_cache()
+  if asset_cache is not None:
+    asset_cache.save()
+  if validation_cache is not None:
+    logging.info("Skipped %d files that are unchanged since their last "
+                 "successful validation.", validation_cache.hits)
+    validated += validation_cache.hits
+    validation_cache.save()
+  publisher_registry.log_statistics()
+  if log_phase_timings:
+    logging.info("Time spent per validation phase:\n%s",
+                 phase_timings.format_table())
+  if phase_timings_file:
+    phase_timings.save(phase_timings_file)
+  if profile_slowest_files and slowest_files:
+    profiling.prune_files(profile_dir,
+                          {file_path for _, file_path in slowest_files})
   if not validation_config.do_smoke_test:
     logging.info(
         "No models were smoke tested. To download and smoke test a specific "
         "model, specify files directly in the command line, for example: "
         "'python tools/validator.py vtab/models/wae-ukl/1.md'")
-  if file_to_error:
+  validation_result = validation_result_lib.ValidationResult(
+      validated=validated,
+      file_to_error=file_to_error,
+      statistics=dict(publisher_registry.statistics),
+      shard_index=shard_index,
+      num_shards=num_shards)
+  if result_file:
+    validation_result.save(result_file)
+  if invalid and not keep_errors:
     raise MarkdownDocumentationError(
-        f"Found the following errors: {file_to_error}")
+        f"Found {invalid} invalid files, whose errors were written to the "
+        "result sinks.")
+  _report_validation_result(validation_result)
+
+
+def _report_validation_result(
+    validation_result: validation_result_lib.ValidationResult) -> None:
+  """Raises an error if the result contains invalid files."""
+  if validation_result.file_to_error:
+    raise MarkdownDocumentationError(
+        f"Found the following errors: {validation_result.file_to_error}")
   logging.info("Found %d matching files - all validated successfully.",
-               validated)
+               validation_result.validated)
+
+
+def merge_result_files(result_files: Sequence[str]) -> None:
+  """Reports the results of all shards of a run like an unsharded run.
+
+  Args:
+    result_files: Local paths to the result files written by all shards.
+
+  Raises:
+    MarkdownDocumentationError: if any shard found invalid Markdown files.
+    ValueError: if there is not exactly one result file per shard.
+  """
+  validation_result = validation_result_lib.merge_results([
+      validation_result_lib.ValidationResult.load(result_file)
+      for result_file in result_files
+  ])
+  logging.info("Merged the results of %d shards.", len(result_files))
+  _log_publisher_statistics(validation_result.statistics)
+  _report_validation_result(validation_result)
 
 
 POLICY_BY_URL_PREFIX = {
@@ -1126,6 +2374,61 @@ POLICY_BY_PATTERN = {
     COLLECTION_HANDLE_PATTERN: CollectionParsingPolicy
 }
 
+# Maps the keyword of each handle pattern like "Module" to the compiled pattern
+# and its policy.
+_POLICY_BY_HANDLE_KEYWORD = {
+    _get_handle_keyword(pattern): (re.compile(pattern), policy)
+    for pattern, policy in POLICY_BY_PATTERN.items()
+}
+
+
+def _get_model_urls_in_line(line: str) -> Iterator[Tuple[str, str, str, str]]:
+  """Yields the parts of all tfhub.dev model URLs in the given string.
+
+  Args:
+    line: String that could contain a tfhub.dev model URL.
+
+  Yields:
+    (URL prefix, publisher, name, version) tuples where the URL prefix is
+    "tfjs-model/", "lite-model/", "coral-model/" or "" and the version is '*'
+    if the URL does not specify one.
+  """
+  # Most lines do not contain a URL, which is cheaper to find out without the
+  # regex.
+  if _TFHUB_URL_PREFIX not in line:
+    return
+  for url_match in _TFHUB_MODEL_URL_PATTERN.finditer(line):
+    publisher, prefix, name, version = url_match.group("publisher", "prefix",
+                                                        "name", "vers")
+    yield prefix or "", publisher, name, version or "*"
+
+
+def _get_distinct_model_urls(
+    lines: Iterable[str]) -> Iterator[Tuple[str, str, str, str]]:
+  """Yields each model URL of the lines once in the order of occurrence.
+
+  Collections often link to the same model several times, e.g. in a table and
+  in a code sample, but each model only needs to be resolved once.
+
+  Args:
+    lines: Strings that could contain tfhub.dev model URLs.
+
+  Yields:
+    The same tuples as _get_model_urls_in_line.
+  """
+  seen_model_urls = set()
+  for line in lines:
+    for model_url in _get_model_urls_in_line(line):
+      if model_url not in seen_model_urls:
+        seen_model_urls.add(model_url)
+        yield model_url
+
+
+def _get_policy_for_model_url(url_prefix: str, publisher: str, name: str,
+                              version: str) -> ModelParsingPolicy:
+  policy_class = POLICY_BY_URL_PREFIX.get(url_prefix, SavedModelParsingPolicy)
+  return policy_class({}, publisher, name, version)
+
 
 def _get_policies_for_line_with_model_urls(
     line: str) -> Iterator[ModelParsingPolicy]:
@@ -1145,34 +2448,93 @@ def _get_policies_for_line_with_model_urls(
     A ModelParsingPolicy which can be used to find the documentation files for
     the model corresponding to the URL.
   """
-  for url_match in _TFHUB_MODEL_URL_PATTERN.finditer(line):
-    groupdict = url_match.groupdict()
-    publisher = groupdict.get("publisher")
-    prefix = groupdict.get("prefix")
-    name = groupdict.get("name")
-
-    trailing_version = re.search(rf"(?<=/){_MODEL_VERSION_PATTERN}$", name)
-    if trailing_version is None:
-      version = "*"
-    else:
-      # Move the trailing version from the model name to version.
-      version = trailing_version.group(0)
-      name = re.sub(f"/{version}$", "", name)
+  for model_url in _get_model_urls_in_line(line):
+    yield _get_policy_for_model_url(*model_url)
 
-    policy_class = POLICY_BY_URL_PREFIX.get(prefix, SavedModelParsingPolicy)
-    yield policy_class({}, publisher, name, version)
+
+def _open_result_sinks(
+    exit_stack: contextlib.ExitStack) -> List[result_sinks_lib.ResultSink]:
+  """Opens the result sinks requested by the flags.
+
+  Args:
+    exit_stack: Closes the sinks and their files when the run is over.
+
+  Returns:
+    The opened sinks, which are empty if no flag requests any.
+  """
+  result_sinks = []
+  if FLAGS.json_lines_file:
+    stream = exit_stack.enter_context(open(FLAGS.json_lines_file, "w"))
+    result_sinks.append(result_sinks_lib.JsonLinesSink(stream))
+  if FLAGS.sarif_file:
+    stream = exit_stack.enter_context(open(FLAGS.sarif_file, "w"))
+    result_sinks.append(result_sinks_lib.SarifSink(stream, DOCS_PATH))
+  if FLAGS.github_annotations:
+    result_sinks.append(
+        result_sinks_lib.GitHubAnnotationSink(sys.stdout, DOCS_PATH))
+  for result_sink in result_sinks:
+    exit_stack.enter_context(result_sink)
+  return result_sinks
 
 
 def main(_):
   root_dir = FLAGS.root_dir or os.getcwd()
 
-  if FLAGS.file:
-    validate_documentation_files(
-        ValidationConfig(skip_asset_check=False, do_smoke_test=True), root_dir,
-        FLAGS.file)
-  else:
-    validate_documentation_dir(
-        ValidationConfig(skip_asset_check=False, do_smoke_test=False), root_dir)
+  if FLAGS.profile and FLAGS.profile_slowest_files:
+    raise app.UsageError("Only one of --profile and --profile_slowest_files "
+                         "can be set since only one profiler can be active.")
+  if FLAGS.merge_result_files:
+    merge_result_files(FLAGS.merge_result_files)
+    return
+  with contextlib.ExitStack() as exit_stack:
+    exit_stack.enter_context(
+        profiling.RunProfiler(
+            FLAGS.profile_dir or os.getcwd(),
+            "validator",
+            profile=FLAGS.profile,
+            trace_memory=FLAGS.trace_memory))
+    exit_stack.enter_context(tracing.RunTracer(FLAGS.trace_file, "validator"))
+    result_sinks = _open_result_sinks(exit_stack)
+    if FLAGS.file:
+      validate_documentation_files(
+          ValidationConfig(
+              skip_asset_check=False,
+              do_smoke_test=True,
+              base_ref=FLAGS.base_ref,
+              asset_cache_dir=FLAGS.asset_cache_dir,
+              asset_cache_max_size_bytes=FLAGS.asset_cache_max_size_mb *
+              1024**2),
+          root_dir,
+          FLAGS.file,
+          jobs=FLAGS.smoke_test_jobs,
+          cache_file=FLAGS.cache_file,
+          link_graph_file=FLAGS.link_graph_file,
+          num_shards=FLAGS.num_shards,
+          shard_index=FLAGS.shard_index,
+          result_file=FLAGS.result_file,
+          result_sinks=result_sinks,
+          log_phase_timings=FLAGS.log_phase_timings,
+          phase_timings_file=FLAGS.timing_json,
+          profile_dir=FLAGS.profile_dir,
+          profile_slowest_files=FLAGS.profile_slowest_files)
+    else:
+      validate_documentation_dir(
+          ValidationConfig(
+              skip_asset_check=False,
+              do_smoke_test=False,
+              base_ref=FLAGS.base_ref),
+          root_dir,
+          jobs=FLAGS.jobs,
+          cache_file=FLAGS.cache_file,
+          link_graph_file=FLAGS.link_graph_file,
+          num_shards=FLAGS.num_shards,
+          shard_index=FLAGS.shard_index,
+          result_file=FLAGS.result_file,
+          result_sinks=result_sinks,
+          log_phase_timings=FLAGS.log_phase_timings,
+          phase_timings_file=FLAGS.timing_json,
+          profile_dir=FLAGS.profile_dir,
+          profile_slowest_files=FLAGS.profile_slowest_files)
 
 
 if __name__ == "__main__":
@@ -1191,5 +2553,138 @@ if __name__ == "__main__":
       default=None,
       help=("Root directory that contains documentation files under "
             "./assets/docs. Defaults to current directory."))
+  parser.add_argument(
+      "--jobs",
+      type=int,
+      default=1,
+      help=("Number of processes that validate all files in parallel. "
+            "Defaults to 1."))
+  parser.add_argument(
+      "--smoke_test_jobs",
+      type=int,
+      default=8,
+      help=("Number of threads that smoke test the files passed on the "
+            "command line in parallel. Downloads are rate limited per host "
+            "in CI. Defaults to 8."))
+  parser.add_argument(
+      "--base_ref",
+      type=str,
+      default=DEFAULT_BASE_REF,
+      help=("Git revision against which added or modified asset-path tags are "
+            f"detected. Defaults to {DEFAULT_BASE_REF}."))
+  parser.add_argument(
+      "--cache_file",
+      type=str,
+      default=None,
+      help=("Local path to a cache of successfully validated files. Unchanged "
+            "files are skipped on later runs unless models are smoke tested. "
+            "Every file is read in full to detect changes, which costs more "
+            "than an uncached run if most files changed."))
+  parser.add_argument(
+      "--num_shards",
+      type=int,
+      default=1,
+      help=("Number of shards into which the files are split by a stable "
+            "hash of their path, e.g. to validate them on several machines. "
+            "Defaults to 1."))
+  parser.add_argument(
+      "--shard_index",
+      type=int,
+      default=0,
+      help="Index of the shard to validate from 0 to --num_shards - 1.")
+  parser.add_argument(
+      "--result_file",
+      type=str,
+      default=None,
+      help=("Local path to which the result of the run is written as JSON, "
+            "even if invalid files are found."))
+  parser.add_argument(
+      "--merge_result_files",
+      type=str,
+      default=None,
+      help=("Instead of validating files, reports the combined results of "
+            "the result files of all shards and fails if any file is "
+            "invalid."),
+      nargs="+")
+  parser.add_argument(
+      "--json_lines_file",
+      type=str,
+      default=None,
+      help=("Local path to which the status, error and duration of each file "
+            "are written as JSON Lines while the files are validated."))
+  parser.add_argument(
+      "--sarif_file",
+      type=str,
+      default=None,
+      help=("Local path to which the errors are written as SARIF log, e.g. "
+            "for upload to code scanning."))
+  parser.add_argument(
+      "--log_phase_timings",
+      action="store_true",
+      help=("Logs a table of the time spent in each phase of the validation "
+            "per document type at the end of the run."))
+  parser.add_argument(
+      "--timing_json",
+      type=str,
+      default=None,
+      help=("Local path to which the time spent in each phase of the "
+            "validation per document type is written as JSON."))
+  parser.add_argument(
+      "--profile",
+      action="store_true",
+      help=("Profiles the run with cProfile and writes validator.pstats to "
+            "--profile_dir. With --jobs, only the main process is profiled."))
+  parser.add_argument(
+      "--trace_memory",
+      action="store_true",
+      help=("Traces memory allocations with tracemalloc and writes the top "
+            "allocations and a snapshot to --profile_dir."))
+  parser.add_argument(
+      "--profile_slowest_files",
+      type=int,
+      default=0,
+      help=("Profiles each file and writes the cProfile statistics of this "
+            "many slowest files to --profile_dir/slowest_files. Cannot be "
+            "combined with --profile."))
+  parser.add_argument(
+      "--profile_dir",
+      type=str,
+      default=None,
+      help=("Local directory to which profiles are written. Defaults to the "
+            "current directory."))
+  parser.add_argument(
+      "--trace_file",
+      type=str,
+      default=None,
+      help=("Local path to which a timeline of the run is written as Chrome "
+            "trace events, e.g. for https://ui.perfetto.dev. It shows the "
+            "files, validation phases, git calls, downloads and archive "
+            "members per process and thread."))
+  parser.add_argument(
+      "--github_annotations",
+      action="store_true",
+      help=("Prints the error of each invalid file as GitHub Actions workflow "
+            "command, which annotates the file in pull requests."))
+  parser.add_argument(
+      "--link_graph_file",
+      type=str,
+      default=None,
+      help=("Local path to the links from collections to model pages. "
+            "Validating all files writes it. Validating specific files also "
+            "validates the collections linking to them and treats files that "
+            "do not exist as deleted."))
+  parser.add_argument(
+      "--asset_cache_dir",
+      type=str,
+      default=None,
+      help=("Local directory in which assets downloaded for smoke tests are "
+            "cached. Unchanged assets are revalidated with a conditional "
+            "request instead of being downloaded and checked again."))
+  parser.add_argument(
+      "--asset_cache_max_size_mb",
+      type=int,
+      default=asset_cache_lib.DEFAULT_MAX_SIZE_BYTES // 1024**2,
+      help=("Total size of the cached assets in MiB after which the least "
+            "recently used assets are deleted."))
   FLAGS, unparsed = parser.parse_known_args()
   app.run(main=main, argv=[sys.argv[0]] + unparsed)
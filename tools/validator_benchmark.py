@@ -0,0 +1,493 @@
+# Copyright 2026 The TensorFlow Hub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the hot paths of the Markdown documentation validator.
+
+To run all benchmarks, run from the project root path:
+$ python tools/validator_benchmark.py
+
+To run selected benchmarks, pass their names:
+$ python tools/validator_benchmark.py startup [other_benchmarks]
+
+Use the --root_dir flag to benchmark against a project outside of the current
+directory, e.g. a synthetic one generated by tools/synthetic_corpus_main.py.
+
+Benchmarks that return metrics, like the end-to-end validate_dir, can be
+compared to a baseline:
+$ python tools/validator_benchmark.py validate_dir --root_dir=/tmp/corpus \
+    --output_file=/tmp/baseline.json
+$ python tools/validator_benchmark.py validate_dir --root_dir=/tmp/corpus \
+    --baseline_file=/tmp/baseline.json --max_regression=0.1
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from absl import app
+from absl import logging
+import filesystem_utils
+import validator
+
+FLAGS = None
+
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Metrics are numbers by name, where names ending with this suffix are better
+# if higher and all others are better if lower.
+Metrics = Dict[str, float]
+_HIGHER_IS_BETTER_SUFFIX = "_per_second"
+
+# validator.PATH_PATTERN before it was made linear, kept for comparison.
+_BACKTRACKING_PATH_PATTERN = re.compile(
+    r"([\w-][-!',_\w.=:% ]*)+(/[\w-][-!',_\w.=:% ]*)*")
+# validator._TFHUB_MODEL_URL_PATTERN before it captured the version, kept for
+# comparison.
+_GREEDY_MODEL_URL_PATTERN = re.compile(
+    "https://tfhub.dev/"
+    r"(?P<publisher>[a-z\d-]+)/"
+    "(?P<prefix>(tfjs|lite|coral)-model/)?"
+    r"(?P<name>[\w.-]+(/[\w.-]+)*)")
+
+
+def _time_subprocess(code: str, repetitions: int) -> Sequence[float]:
+  """Returns the wall-clock seconds of running `code` in fresh interpreters."""
+  durations = []
+  for _ in range(repetitions):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code],
+                   check=True,
+                   cwd=_TOOLS_DIR,
+                   stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+    durations.append(time.perf_counter() - start)
+  return durations
+
+
+def _time_call(function: Callable[[], None],
+               repetitions: int) -> Sequence[float]:
+  """Returns the wall-clock seconds of calling `function`."""
+  durations = []
+  for _ in range(repetitions):
+    start = time.perf_counter()
+    function()
+    durations.append(time.perf_counter() - start)
+  return durations
+
+
+def _log_durations(name: str, durations: Sequence[float]) -> None:
+  logging.info("%-40s median %.6fs, min %.6fs over %d runs.", name,
+               statistics.median(durations), min(durations), len(durations))
+
+
+def _validate_invalid_file_name(file_path: str) -> None:
+  try:
+    validator._validate_file_name(file_path)  # pylint: disable=protected-access
+  except validator.MarkdownDocumentationError:
+    return
+  raise AssertionError(f"Expected {file_path} to be invalid.")
+
+
+def benchmark_path_validation(root_dir: str, repetitions: int) -> None:
+  """Measures validating adversarial file names of archive members.
+
+  A long valid name followed by a forbidden character makes the previous,
+  backtracking PATH_PATTERN try every way of splitting the name, which doubles
+  the time per additional character. The current validator has to stay linear
+  in the length of the name.
+
+  Args:
+    root_dir: Unused, the benchmark uses generated file names.
+    repetitions: How often each file name is validated.
+  """
+  del root_dir
+  for length in [12, 16, 20]:
+    file_path = "a" * length + "$"
+    _log_durations(
+        f"backtracking, {len(file_path)} chars",
+        _time_call(lambda p=file_path: _BACKTRACKING_PATH_PATTERN.fullmatch(p),
+                   repetitions))
+  for length in [20, 1000, 100000]:
+    for file_path in ["a" * length + "$", "a/" * length + "$"]:
+      _log_durations(
+          f"validator, {len(file_path)} chars",
+          _time_call(lambda p=file_path: _validate_invalid_file_name(p),
+                     repetitions))
+
+
+def _read_first_lines(documentation_dir: str) -> List[str]:
+  first_lines = []
+  for file_path in filesystem_utils.recursive_list_dir(documentation_dir):
+    if file_path.endswith(".md"):
+      with open(file_path, encoding="utf-8") as f:
+        # Mirrors how DocumentationParser reads the first line.
+        first_line = f.readline().rstrip("\n").replace("&zwnj;", "")
+        first_lines.append(first_line)
+  return first_lines
+
+
+def _classify_by_trying_all_patterns(first_lines: Sequence[str]) -> None:
+  """Classifies handles like ParsingPolicy.from_string used to."""
+  for first_line in first_lines:
+    for pattern, policy in validator.POLICY_BY_PATTERN.items():
+      match = re.fullmatch(pattern, first_line)
+      if match:
+        groups = match.groupdict()
+        policy({}, groups.get("publisher"), groups.get("name"),
+               groups.get("vers"))
+        break
+
+
+def _classify_by_keyword(first_lines: Sequence[str]) -> None:
+  for first_line in first_lines:
+    validator.ParsingPolicy.from_string(first_line, {})
+
+
+def benchmark_header_dispatch(root_dir: str, repetitions: int) -> None:
+  """Measures classifying the first lines of all documentation files.
+
+  Trying every handle pattern in turn is compared to looking up the pattern by
+  the keyword of the handle, which matches one regex per file.
+
+  Args:
+    root_dir: Root directory that contains documentation files under
+      ./assets/docs.
+    repetitions: How often all first lines are classified.
+  """
+  all_first_lines = _read_first_lines(
+      os.path.join(root_dir, validator.DOCS_PATH))
+  # Modules match the first pattern that used to be tried, other types paid
+  # for up to seven matches.
+  other_first_lines = [
+      line for line in all_first_lines if not line.startswith("# Module ")
+  ]
+  for name, first_lines in [("all", all_first_lines),
+                            ("non-Module", other_first_lines)]:
+    logging.info("Classifying the first lines of %d %s files.",
+                 len(first_lines), name)
+    _log_durations(
+        "trying all patterns",
+        _time_call(lambda l=first_lines: _classify_by_trying_all_patterns(l),
+                   repetitions))
+    _log_durations(
+        "ParsingPolicy.from_string",
+        _time_call(lambda l=first_lines: _classify_by_keyword(l), repetitions))
+
+
+def _read_collection_bodies(documentation_dir: str) -> List[List[str]]:
+  bodies = []
+  for file_path in filesystem_utils.recursive_list_dir(documentation_dir):
+    if file_path.endswith(".md"):
+      with open(file_path, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+      if lines[0].startswith("# Collection "):
+        bodies.append(lines[1:])
+  return bodies
+
+
+def _get_model_urls_with_second_match(
+    line: str) -> Iterator[Tuple[str, str, str, str]]:
+  """Scans a line like validator._get_model_urls_in_line used to."""
+  for url_match in _GREEDY_MODEL_URL_PATTERN.finditer(line):
+    groupdict = url_match.groupdict()
+    name = groupdict.get("name")
+    trailing_version = re.search(r"(?<=/)\d+$", name)
+    if trailing_version is None:
+      version = "*"
+    else:
+      version = trailing_version.group(0)
+      name = re.sub(f"/{version}$", "", name)
+    yield (groupdict.get("prefix") or "", groupdict.get("publisher"), name,
+           version)
+
+
+def _resolve_every_link(
+    bodies: Sequence[Sequence[str]],
+    resolver: Optional[validator.ModelDocumentationResolver]) -> None:
+  for lines in bodies:
+    for line in lines:
+      for model_url in _get_model_urls_with_second_match(line):
+        if resolver is not None:
+          resolver.get_paths(*model_url)
+
+
+def _resolve_distinct_links(
+    bodies: Sequence[Sequence[str]],
+    resolver: Optional[validator.ModelDocumentationResolver]) -> None:
+  for lines in bodies:
+    for model_url in validator._get_distinct_model_urls(lines):
+      if resolver is not None:
+        resolver.get_paths(*model_url)
+
+
+def benchmark_collection_links(root_dir: str, repetitions: int) -> None:
+  """Measures finding and resolving the model links of all collections.
+
+  Matching every line and moving the trailing version to its own group with a
+  second match is compared to skipping lines without "https://tfhub.dev/",
+  capturing the version in the same match and resolving each distinct model
+  URL once per collection.
+
+  Args:
+    root_dir: Root directory that contains documentation files under
+      ./assets/docs.
+    repetitions: How often the links of all collections are found.
+  """
+  documentation_dir = os.path.join(root_dir, validator.DOCS_PATH)
+  bodies = _read_collection_bodies(documentation_dir)
+  all_links = sum(
+      len(list(_get_model_urls_with_second_match(line)))
+      for lines in bodies
+      for line in lines)
+  distinct_links = sum(
+      len(list(validator._get_distinct_model_urls(lines))) for lines in bodies)
+  logging.info("Found %d lines with %d links, of which %d are distinct per "
+               "collection, in %d collections.",
+               sum(len(lines) for lines in bodies), all_links, distinct_links,
+               len(bodies))
+  resolver = validator.ModelDocumentationResolver.from_dir(documentation_dir)
+  for name, scan, scan_resolver in [
+      ("scanning every line", _resolve_every_link, None),
+      ("scanning with prefilter", _resolve_distinct_links, None),
+      ("resolving every link", _resolve_every_link, resolver),
+      ("resolving distinct links", _resolve_distinct_links, resolver)
+  ]:
+    _log_durations(
+        name,
+        _time_call(lambda f=scan, r=scan_resolver: f(bodies, r), repetitions))
+
+
+def benchmark_startup(root_dir: str, repetitions: int) -> None:
+  """Measures how long it takes until the validator can start validating.
+
+  The import of the validator module is compared to the import of TensorFlow,
+  which used to be loaded eagerly by the validator.
+
+  Args:
+    root_dir: Unused, the startup time does not depend on the corpus.
+    repetitions: How often each interpreter start is measured.
+  """
+  del root_dir
+  loads_tensorflow = subprocess.run(
+      [
+          sys.executable, "-c",
+          "import sys, validator; print('tensorflow' in sys.modules)"
+      ],
+      check=True,
+      cwd=_TOOLS_DIR,
+      capture_output=True,
+      text=True).stdout.strip()
+  logging.info("Importing the validator loads TensorFlow: %s.",
+               loads_tensorflow)
+  for name, code in [("python", "pass"), ("import validator",
+                                           "import validator"),
+                     ("import tensorflow", "import tensorflow")]:
+    _log_durations(name, _time_subprocess(code, repetitions))
+
+
+def _run_validator(root_dir: str, timing_file: str) -> Tuple[float, float]:
+  """Validates all files of `root_dir` with the validator command.
+
+  Args:
+    root_dir: Root directory that contains documentation files under
+      ./assets/docs.
+    timing_file: Local path to which the phase timings are written.
+
+  Returns:
+    The wall-clock seconds and the peak resident set size in MiB of the
+    validator process.
+
+  Raises:
+    RuntimeError: if the validation fails.
+  """
+  start = time.perf_counter()
+  command = [
+      sys.executable,
+      os.path.join(_TOOLS_DIR, "validator.py"), f"--root_dir={root_dir}",
+      f"--timing_json={timing_file}"
+  ]
+  process = subprocess.Popen(
+      command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  # Unlike resource.getrusage, wait4 reports the usage of this child only.
+  _, status, rusage = os.wait4(process.pid, 0)
+  seconds = time.perf_counter() - start
+  process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+  if process.returncode:
+    raise RuntimeError(f"Validating {root_dir} failed with exit code "
+                       f"{process.returncode}.")
+  # ru_maxrss is in KiB on Linux.
+  return seconds, rusage.ru_maxrss / 1024
+
+
+def benchmark_validate_dir(root_dir: str, repetitions: int) -> Metrics:
+  """Measures validating all files like the validator command without flags.
+
+  Each repetition runs the validator in a fresh process, which includes the
+  startup, the walk of the documentation directory and the logging.
+
+  Args:
+    root_dir: Root directory that contains documentation files under
+      ./assets/docs, e.g. one generated by synthetic_corpus_main.py.
+    repetitions: How often all files are validated.
+
+  Returns:
+    The median files per second and seconds per phase over all files and the
+    maximum peak RSS.
+  """
+  durations = []
+  peak_rss_mb = 0.0
+  seconds_by_phase_runs = []
+  with tempfile.TemporaryDirectory() as temp_dir:
+    timing_file = os.path.join(temp_dir, "timings.json")
+    for _ in range(repetitions):
+      seconds, run_peak_rss_mb = _run_validator(root_dir, timing_file)
+      durations.append(seconds)
+      peak_rss_mb = max(peak_rss_mb, run_peak_rss_mb)
+      with open(timing_file) as f:
+        phase_timings = json.load(f)
+      seconds_by_phase_runs.append(phase_timings["seconds_by_phase"])
+  # Every validated file goes through the handle phase once.
+  num_files = sum(s["count"]
+                  for s in phase_timings["statistics"]
+                  if s["phase"] == "handle")
+  _log_durations(f"validating {num_files} files", durations)
+  metrics = {
+      "files_per_second": num_files / statistics.median(durations),
+      "peak_rss_mb": peak_rss_mb,
+  }
+  for phase in seconds_by_phase_runs[0]:
+    metrics[f"{phase}_seconds"] = statistics.median(
+        seconds_by_phase[phase] for seconds_by_phase in seconds_by_phase_runs)
+  for name, value in metrics.items():
+    logging.info("%-40s %.3f", name, value)
+  return metrics
+
+
+BENCHMARK_BY_NAME: Mapping[str, Callable[[str, int], Optional[Metrics]]] = {
+    "collection_links": benchmark_collection_links,
+    "header_dispatch": benchmark_header_dispatch,
+    "path_validation": benchmark_path_validation,
+    "startup": benchmark_startup,
+    "validate_dir": benchmark_validate_dir,
+}
+
+
+class RegressionError(Exception):
+  """Raised when a metric is worse than the baseline by more than allowed."""
+
+
+def compare_to_baseline(metrics_by_benchmark: Mapping[str, Metrics],
+                        baseline_by_benchmark: Mapping[str, Metrics],
+                        max_regression: Optional[float] = None) -> None:
+  """Logs the change of each metric that is also in the baseline.
+
+  Args:
+    metrics_by_benchmark: Metrics of this run by benchmark name.
+    baseline_by_benchmark: Metrics of an earlier run by benchmark name.
+    max_regression: Optional; Largest allowed relative regression of any
+      metric, e.g. 0.1 for metrics that are 10% worse than the baseline.
+
+  Raises:
+    RegressionError: if a metric regressed by more than `max_regression`.
+  """
+  regressions = []
+  for benchmark, metrics in sorted(metrics_by_benchmark.items()):
+    baseline = baseline_by_benchmark.get(benchmark, {})
+    for name, value in sorted(metrics.items()):
+      if not baseline.get(name):
+        continue
+      change = value / baseline[name] - 1
+      if name.endswith(_HIGHER_IS_BETTER_SUFFIX):
+        regression = -change
+      else:
+        regression = change
+      logging.info("%s %-34s %10.3f vs. baseline %10.3f (%+.1f%%)", benchmark,
+                   name, value, baseline[name], 100 * change)
+      if max_regression is not None and regression > max_regression:
+        regressions.append(f"{benchmark} {name}")
+  if regressions:
+    raise RegressionError(
+        f"Regressed by more than {100 * max_regression:.0f}% compared to the "
+        f"baseline: {regressions}.")
+
+
+def main(_):
+  root_dir = FLAGS.root_dir or os.getcwd()
+  unknown_benchmarks = set(FLAGS.benchmark).difference(BENCHMARK_BY_NAME)
+  if unknown_benchmarks:
+    raise app.UsageError(f"Unknown benchmarks: {sorted(unknown_benchmarks)}. "
+                         f"Choose from {sorted(BENCHMARK_BY_NAME)}.")
+  metrics_by_benchmark = dict()
+  for name in FLAGS.benchmark or BENCHMARK_BY_NAME:
+    logging.info("Running benchmark '%s'.", name)
+    metrics = BENCHMARK_BY_NAME[name](root_dir, FLAGS.repetitions)
+    if metrics is not None:
+      metrics_by_benchmark[name] = metrics
+  if FLAGS.output_file:
+    with open(FLAGS.output_file, "w") as f:
+      json.dump(metrics_by_benchmark, f, indent=2, sort_keys=True)
+  if FLAGS.baseline_file:
+    with open(FLAGS.baseline_file) as f:
+      baseline_by_benchmark = json.load(f)
+    compare_to_baseline(metrics_by_benchmark, baseline_by_benchmark,
+                        FLAGS.max_regression)
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      "benchmark",
+      type=str,
+      default=None,
+      help=("Names of the benchmarks to run. Defaults to all benchmarks: "
+            f"{sorted(BENCHMARK_BY_NAME)}."),
+      nargs="*")
+  parser.add_argument(
+      "--root_dir",
+      type=str,
+      default=None,
+      help=("Root directory that contains documentation files under "
+            "./assets/docs. Defaults to current directory."))
+  parser.add_argument(
+      "--repetitions",
+      type=int,
+      default=5,
+      help="How often each measurement is repeated.")
+  parser.add_argument(
+      "--output_file",
+      type=str,
+      default=None,
+      help=("Local path to which the metrics of the benchmarks are written as "
+            "JSON, e.g. to serve as baseline of later runs."))
+  parser.add_argument(
+      "--baseline_file",
+      type=str,
+      default=None,
+      help=("Local path to the metrics of an earlier run written by "
+            "--output_file, to which the metrics of this run are compared."))
+  parser.add_argument(
+      "--max_regression",
+      type=float,
+      default=None,
+      help=("Fails if any metric is worse than in --baseline_file by more "
+            "than this fraction, e.g. 0.1 for 10%%."))
+  FLAGS, unparsed = parser.parse_known_args()
+  app.run(main=main, argv=[sys.argv[0]] + unparsed)
@@ -15,7 +15,12 @@
 """Tests for tensorflow_hub.tfhub_dev.tools.validator."""
 
 import contextlib
+import hashlib
+import io
+import json
 import os
+import subprocess
+import sys
 import textwrap
 import time
 from typing import Optional
@@ -24,7 +29,11 @@ import urllib.request
 
 from absl.testing import parameterized
 import tensorflow as tf
+import asset_cache
 import filesystem_utils
+import result_sinks
+import tracing
+import validation_result
 import validator
 import yaml_parser
 
@@ -375,6 +384,35 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
         f.write("This file is not necessary.")
     filesystem_utils.compress_local_directory_to_archive(temp_dir, path)
 
+  def test_import_does_not_load_tensorflow(self):
+    tools_dir = os.path.dirname(os.path.abspath(validator.__file__))
+    output = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys, validator; print('tensorflow' in sys.modules)"
+        ],
+        check=True,
+        cwd=tools_dir,
+        capture_output=True,
+        text=True).stdout
+    self.assertEqual(output.strip(), "False")
+
+  def test_validate_documentation_dir_on_in_memory_filesystem(self):
+    files = {
+        f"mem://root/tags/{file_name}": content
+        for file_name, content in TAG_FILE_NAME_TO_CONTENT_MAP.items()
+    }
+    files["mem://root/assets/docs/google/google.md"] = (
+        PUBLISHER_HANDLE_TEMPLATE % _GOOGLE_PUBLISHER)
+    files["mem://root/assets/docs/google/models/text-embedding-model/1.md"] = (
+        self.minimal_markdown)
+    filesystem_utils.register_filesystem(
+        "mem", filesystem_utils.InMemoryFileSystem(files))
+    self.addCleanup(filesystem_utils.unregister_filesystem, "mem")
+
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config, root_dir="mem://root")
+
   @parameterized.parameters(
       ("# Module google/ALBERT/1", validator.SavedModelParsingPolicy),
       ("# Placeholder google/ALBERT/1", validator.PlaceholderParsingPolicy),
@@ -396,6 +434,15 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
       validator.ParsingPolicy.from_string("# Newmodel google/ALBERT/1",
                                           self.parser_by_tag)
 
+  @parameterized.parameters("# Module google/ALBERT", "# Publisher google/1",
+                            "#Module google/ALBERT/1", "# Module  google/a/1",
+                            "Module google/ALBERT/1", "#", "")
+  def test_fail_getting_policy_from_invalid_handle(self, document_string):
+    with self.assertRaisesRegex(
+        validator.MarkdownDocumentationError,
+        f".*Instead the first line is '{document_string}'"):
+      validator.ParsingPolicy.from_string(document_string, self.parser_by_tag)
+
   @parameterized.parameters(
       (validator.SavedModelParsingPolicy,
        ["ROOT/google/bert/1.md", "ROOT/google/models/bert/1.md"]),
@@ -443,6 +490,18 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
     self.assertEqual(actual_policy._model_version,
                      expected_policy._model_version)
 
+  def test_distinct_model_urls_are_yielded_once(self):
+    lines = [
+        "| [BERT](https://tfhub.dev/google/bert/1) | "
+        "https://tfhub.dev/google/bert/1 |",
+        "hub.load('https://tfhub.dev/google/lite-model/bert/2')",
+        "No link to tfhub.dev here.", "https://tfhub.dev/google/bert/1"
+    ]
+
+    self.assertEqual(
+        list(validator._get_distinct_model_urls(lines)),
+        [("", "google", "bert", "1"), ("lite-model/", "google", "bert", "2")])
+
   def test_markdown_parsed_saved_model(self):
     empty_second_line = textwrap.dedent(f"""\
        # Module {_MODEL_HANDLE}
@@ -593,6 +652,110 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
       validator.validate_documentation_dir(
           validation_config=self.validation_config, root_dir=self.tmp_root_dir)
 
+  @parameterized.parameters(
+      ("https://tfhub.dev/google/bert",
+       ["google/bert/1.md", "google/models/bert/2.md",
+        "google/models/bert/10.md"]),
+      ("https://tfhub.dev/google/bert/2", ["google/models/bert/2.md"]),
+      ("https://tfhub.dev/google/bert/3", []),
+      ("https://tfhub.dev/google/lite-model/bert/1",
+       ["google/models/bert/lite/1.md"]),
+      ("https://tfhub.dev/google/bert/lite", ["google/models/bert/lite/1.md"]),
+      ("https://tfhub.dev/google/models/bert/10", ["google/models/bert/10.md"]),
+      ("https://tfhub.dev/google/tfjs-model/bert", []),
+      ("https://tfhub.dev/google", []))
+  def test_model_documentation_resolver(self, url, expected_paths):
+    resolver = validator.ModelDocumentationResolver("ROOT", [
+        "ROOT/google/google.md", "ROOT/google/bert/1.md",
+        "ROOT/google/models/bert/2.md", "ROOT/google/models/bert/10.md",
+        "ROOT/google/models/bert/lite/1.md",
+        "ROOT/google/collections/bert/1.md"
+    ])
+
+    self.assertEqual(
+        resolver.resolve_url(url),
+        [os.path.join("ROOT", path) for path in expected_paths])
+
+  def test_model_documentation_resolver_finds_globbed_files(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(
+        os.path.join(self.tmp_docs_dir, _RELATIVE_LITE_PATH), "")
+    resolver = validator.ModelDocumentationResolver.from_dir(self.tmp_docs_dir)
+
+    for url in [
+        "https://tfhub.dev/google/text-embedding-model",
+        "https://tfhub.dev/google/lite-model/text-embedding-model/1",
+        "https://tfhub.dev/google/text-embedding-model/lite"
+    ]:
+      policy = next(validator._get_policies_for_line_with_model_urls(url))
+      globbed_paths = [
+          path for pattern in policy.get_allowed_file_paths(self.tmp_docs_dir)
+          for path in filesystem_utils.glob(pattern)
+      ]
+      self.assertCountEqual(resolver.resolve_url(url), globbed_paths)
+    self.assertEqual(
+        resolver.get_versions("", _GOOGLE_PUBLISHER, "text-embedding-model"),
+        ["1"])
+
+  def test_collection_links_are_resolved_without_globbing(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(
+        _ABSOLUTE_COLLECTION_PATH,
+        COLLECTION_CONTENT_TEMPLATE.format(
+            content="https://tfhub.dev/google/text-embedding-model"))
+
+    with mock.patch.object(
+        filesystem_utils, "glob", wraps=filesystem_utils.glob) as mock_glob:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config, root_dir=self.tmp_root_dir)
+      mock_glob.assert_not_called()
+
+  def test_link_graph_revalidates_collection_linking_to_deleted_model(self):
+    model_path = "root/assets/docs/google/models/bert/1.md"
+    self.set_content(model_path, self.minimal_markdown.replace(
+        "text-embedding-model", "bert"))
+    self.set_content(_ABSOLUTE_COLLECTION_PATH, MINIMAL_COLLECTION)
+    link_graph_file = os.path.join(self.tmp_dir, "links.json")
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        link_graph_file=link_graph_file)
+    os.remove(self.get_full_path(model_path))
+
+    with self.assertRaisesRegex(
+        validator.MarkdownDocumentationError,
+        ".*'google/collections/text-embedding-collection/1.md': "
+        ".No documentation file found in.*google/models/bert/1.md"):
+      validator.validate_documentation_files(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/bert/1.md"],
+          link_graph_file=link_graph_file)
+
+  def test_link_graph_is_built_on_first_use(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(
+        _ABSOLUTE_COLLECTION_PATH,
+        COLLECTION_CONTENT_TEMPLATE.format(
+            content="https://tfhub.dev/google/text-embedding-model"))
+    link_graph_file = os.path.join(self.tmp_dir, "links.json")
+
+    with mock.patch.object(
+        validator.DocumentationParser, "validate",
+        autospec=True) as mock_validate:
+      validator.validate_documentation_files(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"],
+          link_graph_file=link_graph_file)
+
+    self.assertEqual(
+        [call.args[2] for call in mock_validate.call_args_list], [
+            self.get_full_path(self.markdown_file_path),
+            self.get_full_path(_ABSOLUTE_COLLECTION_PATH)
+        ])
+    self.assertTrue(os.path.exists(link_graph_file))
+
   def test_minimal_publisher_markdown_parsed(self):
     self.set_up_publisher_page("some-publisher")
 
@@ -608,6 +771,402 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
       validator.validate_documentation_dir(
           validation_config=self.validation_config, root_dir=self.tmp_root_dir)
 
+  def test_validate_documentation_dir_in_parallel_reports_same_errors(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    for publisher in ["deepmind", "vtab"]:
+      self.set_content(
+          os.path.join(self.tmp_docs_dir, publisher, "models", "model", "1.md"),
+          self.minimal_markdown.replace("google", publisher))
+    errors_by_jobs = {}
+
+    for jobs in [1, 2]:
+      with self.assertRaises(validator.MarkdownDocumentationError) as context:
+        validator.validate_documentation_dir(
+            validation_config=self.validation_config,
+            root_dir=self.tmp_root_dir,
+            jobs=jobs)
+      errors_by_jobs[jobs] = str(context.exception)
+
+    self.assertEqual(errors_by_jobs[1], errors_by_jobs[2])
+    self.assertIn("'deepmind/models/model/1.md'", errors_by_jobs[2])
+    self.assertIn("'vtab/models/model/1.md'", errors_by_jobs[2])
+
+  def test_validation_cache_skips_unchanged_files(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    cache_file = os.path.join(self.tmp_dir, "cache.json")
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        cache_file=cache_file)
+
+    with mock.patch.object(
+        validator.DocumentationParser, "validate",
+        autospec=True) as mock_validate:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          cache_file=cache_file)
+      mock_validate.assert_not_called()
+
+  def test_validation_cache_revalidates_changed_files(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    cache_file = os.path.join(self.tmp_dir, "cache.json")
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        cache_file=cache_file)
+    self.set_content(self.markdown_file_path,
+                     self.minimal_markdown.replace("saved_model_2", "n/a"))
+
+    with self.assertRaisesRegex(validator.MarkdownDocumentationError,
+                                "The 'format' metadata should be one of"):
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          cache_file=cache_file)
+
+  @parameterized.parameters(
+      ("root/tags/language.yaml", LANGUAGE_YAML + "\n  - id: de"),
+      ("root/assets/docs/google/models/other-model/1.md", ""))
+  def test_validation_cache_is_invalidated_by_environment(
+      self, changed_file, changed_content):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    cache_file = os.path.join(self.tmp_dir, "cache.json")
+    validator.validate_documentation_files(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        files_to_validate=["google/models/text-embedding-model/1.md"],
+        cache_file=cache_file)
+    self.set_content(changed_file, changed_content)
+
+    with mock.patch.object(
+        validator.DocumentationParser, "validate",
+        autospec=True) as mock_validate:
+      validator.validate_documentation_files(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"],
+          cache_file=cache_file)
+      mock_validate.assert_called_once()
+
+  @parameterized.parameters(validator.path_index_lib,
+                            validator.filesystem_utils)
+  def test_validation_cache_is_invalidated_by_module_source(self, module):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    cache_file = os.path.join(self.tmp_dir, "cache.json")
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        cache_file=cache_file)
+    changed_module_file = os.path.join(self.tmp_dir, "changed_module.py")
+    with open(module.__file__) as f:
+      self.set_content(changed_module_file, f.read() + "\n# Changed.\n")
+
+    with mock.patch.object(module, "__file__", changed_module_file):
+      with mock.patch.object(
+          validator.DocumentationParser, "validate",
+          autospec=True) as mock_validate:
+        validator.validate_documentation_dir(
+            validation_config=self.validation_config,
+            root_dir=self.tmp_root_dir,
+            cache_file=cache_file)
+        mock_validate.assert_called()
+
+  def test_sharded_results_merge_to_unsharded_result(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    for name in ["bert", "albert", "electra"]:
+      self.set_content(
+          f"root/assets/docs/google/models/{name}/1.md",
+          self.minimal_markdown.replace("text-embedding-model", name))
+    self.set_content(
+        "root/assets/docs/google/models/invalid/1.md",
+        self.minimal_markdown.replace("text-embedding-model",
+                                      "invalid").replace("saved_model_2", "n/a"))
+    self.set_content(_ABSOLUTE_COLLECTION_PATH, MINIMAL_COLLECTION)
+    self.set_up_publisher_page("vtab")
+    num_shards = 3
+    result_files = []
+    for shard_index in range(num_shards):
+      result_file = os.path.join(self.tmp_dir, f"result-{shard_index}.json")
+      result_files.append(result_file)
+      try:
+        validator.validate_documentation_dir(
+            validation_config=self.validation_config,
+            root_dir=self.tmp_root_dir,
+            num_shards=num_shards,
+            shard_index=shard_index,
+            result_file=result_file)
+      except validator.MarkdownDocumentationError:
+        pass
+    unsharded_result_file = os.path.join(self.tmp_dir, "result.json")
+    with self.assertRaises(validator.MarkdownDocumentationError) as context:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          result_file=unsharded_result_file)
+    unsharded_error = str(context.exception)
+
+    with self.assertRaises(validator.MarkdownDocumentationError) as context:
+      validator.merge_result_files(result_files)
+
+    self.assertEqual(str(context.exception), unsharded_error)
+    self.assertIn("'google/models/invalid/1.md'", unsharded_error)
+    self.assertNotIn("collections", unsharded_error)
+    shard_results = [
+        validation_result.ValidationResult.load(result_file)
+        for result_file in result_files
+    ]
+    self.assertEqual(
+        sum(result.validated for result in shard_results),
+        validation_result.ValidationResult.load(
+            unsharded_result_file).validated)
+    self.assertLen(
+        [result for result in shard_results if result.validated], num_shards)
+
+  def test_results_are_streamed_to_sinks(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(
+        "root/assets/docs/google/models/invalid/1.md",
+        self.minimal_markdown.replace("text-embedding-model",
+                                      "invalid").replace("saved_model_2", "n/a"))
+    self.set_up_publisher_page("vtab")
+    result_sink = mock.create_autospec(
+        result_sinks.ResultSink, instance=True)
+
+    with self.assertRaisesRegex(validator.MarkdownDocumentationError,
+                                "Found 1 invalid files, whose errors were"):
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          result_sinks=[result_sink])
+
+    results = {
+        call.args[0].file_path: call.args[0]
+        for call in result_sink.write.call_args_list
+    }
+    self.assertCountEqual(results, [
+        "google/models/text-embedding-model/1.md",
+        "google/models/invalid/1.md", "google/google.md", "vtab/vtab.md"
+    ])
+    self.assertEqual(results["google/models/invalid/1.md"].status, "invalid")
+    self.assertIn("saved_model_2",
+                  results["google/models/invalid/1.md"].error)
+    self.assertEqual(
+        results["google/models/text-embedding-model/1.md"].status, "valid")
+    self.assertGreater(
+        results["google/models/text-embedding-model/1.md"].duration_seconds, 0)
+
+  def test_validate_documentation_dir_skips_non_markdown_files(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content("root/assets/docs/google/README.txt", "No documentation.")
+    result_sink = mock.create_autospec(result_sinks.ResultSink, instance=True)
+
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        result_sinks=[result_sink])
+
+    self.assertCountEqual(
+        [call.args[0].file_path for call in result_sink.write.call_args_list],
+        ["google/models/text-embedding-model/1.md", "google/google.md"])
+
+  def test_skipped_non_markdown_files_are_logged_once(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    for name in ["README.txt", "LICENSE", "notes.txt"]:
+      self.set_content(f"root/assets/docs/google/{name}", "No documentation.")
+
+    with mock.patch.object(validator.logging, "warning") as mock_warning:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir)
+
+    self.assertEqual([
+        call.args
+        for call in mock_warning.call_args_list
+        if "Markdown" in call.args[0]
+    ], [("Skipped %d files since they are no Markdown files.", 3)])
+
+  @parameterized.parameters(1, 2)
+  def test_files_are_consumed_lazily(self, jobs):
+    file_paths = []
+    for name in ["a", "b", "c"]:
+      file_path = f"google/models/{name}/1.md"
+      self.set_content(
+          f"root/assets/docs/{file_path}",
+          self.minimal_markdown.replace("text-embedding-model", name))
+      file_paths.append(file_path)
+    result_sink = mock.create_autospec(result_sinks.ResultSink, instance=True)
+
+    validator.validate_documentation_files(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        files_to_validate=(file_path for file_path in file_paths),
+        jobs=jobs,
+        result_sinks=[result_sink])
+
+    self.assertEqual(
+        [call.args[0].file_path for call in result_sink.write.call_args_list],
+        file_paths)
+
+  def test_phase_timings_are_written(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content("root/assets/docs/google/models/bert/1.md",
+                     self.minimal_markdown.replace("text-embedding-model",
+                                                   "bert"))
+    self.set_content(_ABSOLUTE_COLLECTION_PATH, MINIMAL_COLLECTION)
+    phase_timings_file = os.path.join(self.tmp_dir, "timings.json")
+
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        phase_timings_file=phase_timings_file)
+
+    with open(phase_timings_file) as f:
+      phase_timings = json.load(f)
+    self.assertCountEqual(phase_timings["seconds_by_phase"], [
+        "handle", "publisher_page", "file_path", "parse_metadata", "tags",
+        "content", "asset"
+    ])
+    counts = {(s["phase"], s["type_name"]): s["count"]
+              for s in phase_timings["statistics"]}
+    self.assertEqual(counts[("tags", "Module")], 2)
+    self.assertEqual(counts[("content", "Collection")], 1)
+    self.assertNotIn(("content", "Module"), counts)
+
+  def test_slowest_files_are_profiled(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(_ABSOLUTE_COLLECTION_PATH, MINIMAL_COLLECTION)
+    self.set_content("root/assets/docs/google/models/bert/1.md",
+                     self.minimal_markdown.replace("text-embedding-model",
+                                                   "bert"))
+    profile_dir = os.path.join(self.tmp_dir, "profiles")
+
+    validator.validate_documentation_dir(
+        validation_config=self.validation_config,
+        root_dir=self.tmp_root_dir,
+        jobs=2,
+        profile_dir=profile_dir,
+        profile_slowest_files=2)
+
+    profile_files = os.listdir(os.path.join(profile_dir, "slowest_files"))
+    self.assertLen(profile_files, 2)
+    for profile_file in profile_files:
+      self.assertEndsWith(profile_file, ".md.pstats")
+
+  @parameterized.parameters(1, 2)
+  def test_profiles_of_slowest_files_match_logged_files(self, jobs):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    for name in ["bert", "albert", "electra", "roberta", "t5", "xlnet"]:
+      self.set_content(
+          f"root/assets/docs/google/models/{name}/1.md",
+          self.minimal_markdown.replace("text-embedding-model", name))
+    profile_dir = os.path.join(self.tmp_dir, "profiles")
+    add_profile = validator.profiling.SlowestFilesProfiler._add
+
+    def add_profile_slowly(*args):
+      add_profile(*args)
+      # Writing a profile must not make a file count as slower.
+      time.sleep(0.05)
+
+    with mock.patch.object(validator.profiling.SlowestFilesProfiler, "_add",
+                           add_profile_slowly):
+      with mock.patch.object(
+          validator.profiling, "prune_files",
+          wraps=validator.profiling.prune_files) as mock_prune_files:
+        validator.validate_documentation_dir(
+            validation_config=self.validation_config,
+            root_dir=self.tmp_root_dir,
+            jobs=jobs,
+            profile_dir=profile_dir,
+            profile_slowest_files=2)
+
+    [(_, slowest_files)] = [c.args for c in mock_prune_files.call_args_list]
+    self.assertLen(slowest_files, 2)
+    self.assertCountEqual(
+        os.listdir(os.path.join(profile_dir, "slowest_files")), [
+            os.path.basename(
+                validator.profiling.get_file_profile_path(
+                    profile_dir, file_path)) for file_path in slowest_files
+        ])
+
+  def test_trace_shows_files_of_worker_processes(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(_ABSOLUTE_COLLECTION_PATH, MINIMAL_COLLECTION)
+    self.set_content("root/assets/docs/google/models/bert/1.md",
+                     self.minimal_markdown.replace("text-embedding-model",
+                                                   "bert"))
+    trace_file = os.path.join(self.tmp_dir, "trace.json")
+
+    with tracing.RunTracer(trace_file, "validator"):
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          jobs=2)
+
+    with open(trace_file) as f:
+      events = json.load(f)["traceEvents"]
+    spans_by_category = {}
+    for event in events:
+      if event["ph"] == "X":
+        spans_by_category.setdefault(event["cat"], []).append(event)
+    self.assertCountEqual(
+        [(span["name"], span["pid"]) for span in spans_by_category["run"]],
+        [("validate_documentation_dir", os.getpid()),
+         ("validate_documentation_files", os.getpid())])
+    self.assertCountEqual(
+        [span["name"] for span in spans_by_category["file"]], [
+            "google/google.md",
+            "google/collections/text-embedding-collection/1.md",
+            "google/models/text-embedding-model/1.md", "google/models/bert/1.md"
+        ])
+    for span in spans_by_category["file"]:
+      self.assertNotEqual(span["pid"], os.getpid())
+    self.assertContainsSubset(
+        ["handle", "parse_metadata", "tags"],
+        [span["name"] for span in spans_by_category["phase"]])
+
+  def test_invalid_shard_index_fails(self):
+    with self.assertRaisesRegex(ValueError, "Shard index 2 is not in"):
+      validator.validate_documentation_files(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=[],
+          num_shards=2,
+          shard_index=2)
+
+  def test_publisher_page_is_checked_once_per_publisher(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    self.set_content(
+        os.path.join(self.tmp_docs_dir, _RELATIVE_LITE_PATH),
+        LITE_OPTIONAL_TAG_TEMPLATE.format(
+            tag_key="colab", tag_value="https://colab.research.google.com/"))
+
+    with mock.patch.object(
+        filesystem_utils, "exists", wraps=filesystem_utils.exists) as mock_exists:
+      validator.validate_documentation_files(
+          validation_config=self.validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=[
+              "google/models/text-embedding-model/1.md", _RELATIVE_LITE_PATH,
+              "google/google.md"
+          ])
+      mock_exists.assert_called_once_with(
+          os.path.join(self.tmp_docs_dir, "google/google.md"))
+
+  def test_publisher_registry_statistics(self):
+    registry = validator.PublisherRegistry(self.tmp_docs_dir)
+    for publisher, type_name in [("google", "Module"), ("google", "Module"),
+                                 ("google", "Lite"),
+                                 ("deepmind", "Publisher")]:
+      registry.record_document(publisher, type_name)
+
+    self.assertEqual(registry.statistics, {
+        "deepmind": {"Publisher": 1},
+        "google": {"Module": 2, "Lite": 1}
+    })
+    self.assertTrue(registry.has_publisher_page("google"))
+    self.assertFalse(registry.has_publisher_page("deepmind"))
+
   def test_fails_if_publisher_page_does_not_exist(self):
     model_content = textwrap.dedent("""\
       # Module deepmind/model/1
@@ -619,13 +1178,22 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
 
       ## Overview""")
     self.set_content(
-        os.path.join(self.tmp_docs_dir, "deepmind/model/1"), model_content)
+        os.path.join(self.tmp_docs_dir, "deepmind/model/1.md"), model_content)
 
     with self.assertRaisesRegex(validator.MarkdownDocumentationError,
                                 ".*Publisher documentation does not.*"):
       validator.validate_documentation_dir(
           validation_config=self.validation_config, root_dir=self.tmp_root_dir)
 
+  def test_validate_documentation_dir_checks_paths_without_glob(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+
+    with mock.patch.object(
+        filesystem_utils, "glob", autospec=True) as mock_glob:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config, root_dir=self.tmp_root_dir)
+      mock_glob.assert_not_called()
+
   @parameterized.parameters(
       ("Module", "google/model/1",
        r"\[.*google/model/1.md', '.*google/models/model/1.md'\]"),
@@ -776,6 +1344,46 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
     validator.validate_documentation_dir(
         validation_config=self.validation_config, root_dir=self.tmp_root_dir)
 
+  def test_parse_resets_state_of_previous_file(self):
+    self.set_content(self.markdown_file_path, self.maximal_markdown)
+    documentation_parser = validator.DocumentationParser(
+        self.tmp_root_dir, self.tmp_docs_dir, self.parser_by_tag)
+    documentation_parser.parse(self.get_full_path(self.markdown_file_path))
+
+    documentation_parser.parse(
+        os.path.join(self.tmp_docs_dir, "google", "google.md"))
+
+    self.assertIsInstance(documentation_parser.policy,
+                          validator.PublisherParsingPolicy)
+    self.assertEqual(documentation_parser.parsed_description,
+                     "The publisher name.")
+    self.assertEmpty(documentation_parser.parsed_metadata)
+
+  def test_model_body_is_not_read(self):
+    self.set_content(self.markdown_file_path,
+                     self.minimal_markdown + "Long overview.\n" * 10000)
+
+    with mock.patch.object(
+        validator._LazyLines, "get_lines_from",
+        autospec=True) as mock_get_lines_from:
+      validator.validate_documentation_dir(
+          validation_config=self.validation_config, root_dir=self.tmp_root_dir)
+      mock_get_lines_from.assert_not_called()
+
+  @parameterized.parameters("", "a", "a\n", "a\nb", "\n\nb\r\nc\rd\n",
+                            "long line\n" * 5)
+  def test_lazy_lines_are_split_like_content(self, content):
+    with mock.patch.object(validator, "_READ_CHUNK_SIZE", 3):
+      lines = validator._LazyLines(io.StringIO(content, newline=""))
+      expected_lines = content.split("\n")
+
+      self.assertEqual(lines[0], expected_lines[0])
+      self.assertTrue(lines.has_line(len(expected_lines) - 1))
+      self.assertFalse(lines.has_line(len(expected_lines)))
+      with self.assertRaises(IndexError):
+        lines[len(expected_lines)]  # pylint: disable=pointless-statement
+      self.assertEqual(lines.get_lines_from(1), expected_lines[1:])
+
   def test_markdown_with_unexpected_lines(self):
     content = textwrap.dedent(f"""\
       # Module {_MODEL_HANDLE}
@@ -898,6 +1506,98 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
           root_dir=self.tmp_root_dir,
           files_to_validate=["google/models/text-embedding-model/1.md"])
 
+  def test_asset_cache_skips_smoke_test_of_unchanged_asset(self):
+    self.set_content(self.markdown_file_path,
+                     MINIMAL_SAVED_MODEL_TEMPLATE % f"file://{self.model_path}")
+    validation_config = validator.ValidationConfig(
+        do_smoke_test=True,
+        asset_cache_dir=os.path.join(self.tmp_dir, "asset_cache"))
+    with mock.patch.object(
+        validator, "_check_saved_model_archive",
+        autospec=True) as mock_check:
+      validator.validate_documentation_files(
+          validation_config=validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"])
+      validator.validate_documentation_files(
+          validation_config=validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"])
+
+      mock_check.assert_called_once()
+
+  def test_asset_cache_saves_verdicts_of_smoke_test_version(self):
+    self.set_content(self.markdown_file_path,
+                     MINIMAL_SAVED_MODEL_TEMPLATE % f"file://{self.model_path}")
+    asset_cache_dir = os.path.join(self.tmp_dir, "asset_cache")
+
+    validator.validate_documentation_files(
+        validation_config=validator.ValidationConfig(
+            do_smoke_test=True, asset_cache_dir=asset_cache_dir),
+        root_dir=self.tmp_root_dir,
+        files_to_validate=["google/models/text-embedding-model/1.md"])
+
+    with open(self.model_path, "rb") as f:
+      digest = hashlib.sha256(f.read()).hexdigest()
+    self.assertEqual(
+        asset_cache.AssetCache(
+            asset_cache_dir,
+            verdict_version=validator.get_smoke_test_version()).get_verdict(
+                digest), "")
+    self.assertIsNone(
+        asset_cache.AssetCache(
+            asset_cache_dir, verdict_version="other").get_verdict(digest))
+
+  @mock.patch.object(urllib.request, "urlopen", new=MockUrlOpen)
+  def test_trace_shows_download_and_archive_members(self):
+    self.set_content(self.markdown_file_path, self.minimal_markdown)
+    trace_file = os.path.join(self.tmp_dir, "trace.json")
+
+    with tracing.RunTracer(trace_file, "validator"):
+      validator.validate_documentation_files(
+          validation_config=validator.ValidationConfig(do_smoke_test=True),
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"])
+
+    with open(trace_file) as f:
+      events = json.load(f)["traceEvents"]
+    span_names_by_category = {}
+    for event in events:
+      if event["ph"] == "X":
+        span_names_by_category.setdefault(event["cat"], []).append(
+            event["name"])
+    self.assertEqual(span_names_by_category["asset"],
+                     ["SavedModelParsingPolicy._check_valid_remote_asset"])
+    self.assertEqual(span_names_by_category["download"], ["download"])
+    self.assertIn("saved_model.pb", span_names_by_category["tar_member"])
+
+  def test_asset_cache_reports_cached_smoke_test_error(self):
+    not_a_model_path = os.path.join(self.tmp_dir, "not_a_model.tar.gz")
+    temp_file = self.create_tempfile("keras_metadata.pb", "No SavedModel file.")
+    filesystem_utils.create_archive(not_a_model_path, temp_file.full_path)
+    self.set_content(self.markdown_file_path,
+                     MINIMAL_SAVED_MODEL_TEMPLATE % f"file://{not_a_model_path}")
+    validation_config = validator.ValidationConfig(
+        do_smoke_test=True,
+        asset_cache_dir=os.path.join(self.tmp_dir, "asset_cache"))
+    with self.assertRaisesRegex(validator.MarkdownDocumentationError,
+                                ".*not contain a valid saved_model.pb.*"):
+      validator.validate_documentation_files(
+          validation_config=validation_config,
+          root_dir=self.tmp_root_dir,
+          files_to_validate=["google/models/text-embedding-model/1.md"])
+
+    with mock.patch.object(
+        validator, "_check_saved_model_archive",
+        autospec=True) as mock_check:
+      with self.assertRaisesRegex(validator.MarkdownDocumentationError,
+                                  ".*not contain a valid saved_model.pb.*"):
+        validator.validate_documentation_files(
+            validation_config=validation_config,
+            root_dir=self.tmp_root_dir,
+            files_to_validate=["google/models/text-embedding-model/1.md"])
+      mock_check.assert_not_called()
+
   @parameterized.parameters(
       ("Open Colab notebook", "https://colab.research.google.com"),
       ("Open Demo", "https://teachablemachine.withgoogle.com/train/pose"))
@@ -1125,6 +1825,23 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
                 "SavedModel but the test raised a MarkdownDocumentationError: "
                 f"{e}.")
 
+  @parameterized.parameters(
+      # Would take longer than the age of the universe with a backtracking
+      # pattern that is exponential in the length of the name.
+      "assets/" + "a" * 100 + "$",
+      "assets/" + "a/" * 10000 + "/",
+      "/assets/vocab.txt",
+      "assets//vocab.txt")
+  def test_invalid_file_path_fails_quickly(self, file_path):
+    with self.assertRaisesRegex(validator.MarkdownDocumentationError,
+                                "Invalid filepath"):
+      validator._validate_file_name(file_path)
+
+  @parameterized.parameters("saved_model.pb", "assets/vocab/en.txt",
+                            "variables/variables.data-00000-of-00001")
+  def test_allowed_file_path_passes(self, file_path):
+    validator._validate_file_name(file_path)
+
   @parameterized.parameters("other_file.txt", "variables/vocab.txt")
   @mock.patch.object(urllib.request, "urlopen", new=MockUrlOpen)
   def test_saved_model_with_unused_file_fails(self, forbidden_file):
@@ -1140,28 +1857,143 @@ class ValidatorTest(parameterized.TestCase, tf.test.TestCase):
           file_path=self.get_full_path(self.markdown_file_path))
 
   @mock.patch.object(urllib.request, "urlopen", new=MockUrlOpen)
-  def test_does_not_sleep_in_workflow_without_smoke_test(self):
+  def test_does_not_rate_limit_in_workflow_without_smoke_test(self):
     documentation_parser = self._get_parser_for_validating_saved_model_file(
         "saved_model.pb", self.markdown_file_path)
 
-    with mock.patch.object(time, "sleep", autospec=True) as mock_sleep:
+    with mock.patch.object(
+        validator._HOST_RATE_LIMITER, "acquire",
+        autospec=True) as mock_acquire:
       documentation_parser.validate(
           validation_config=validator.ValidationConfig(do_smoke_test=False),
           file_path=self.get_full_path(self.markdown_file_path))
-      mock_sleep.assert_not_called()
+      mock_acquire.assert_not_called()
 
   @mock.patch.object(urllib.request, "urlopen", new=MockUrlOpen)
-  def test_should_sleep_in_workflow_on_smoke_test(self):
+  def test_should_rate_limit_in_workflow_on_smoke_test(self):
     self.should_sleep = mock.patch.object(
         validator, "_should_sleep", return_value=True).start()
     documentation_parser = self._get_parser_for_validating_saved_model_file(
         "saved_model.pb", self.markdown_file_path)
 
-    with mock.patch.object(time, "sleep", autospec=True) as mock_sleep:
+    with mock.patch.object(
+        validator._HOST_RATE_LIMITER, "acquire",
+        autospec=True) as mock_acquire:
       documentation_parser.validate(
           validation_config=validator.ValidationConfig(do_smoke_test=True),
           file_path=self.get_full_path(self.markdown_file_path))
-      mock_sleep.assert_called_once_with(5)
+      mock_acquire.assert_called_once_with(self.model_path)
+
+  @mock.patch.object(urllib.request, "urlopen", new=MockUrlOpen)
+  def test_smoke_tests_in_parallel_report_same_errors(self):
+    not_a_model_path = os.path.join(self.tmp_dir, "not_a_model.tar.gz")
+    temp_file = self.create_tempfile("keras_metadata.pb", "No SavedModel file.")
+    filesystem_utils.create_archive(not_a_model_path, temp_file.full_path)
+    files_to_validate = []
+    for name in ["model-a", "model-b", "model-c"]:
+      file_path = f"google/models/{name}/1.md"
+      self.set_content(
+          f"root/assets/docs/{file_path}",
+          MINIMAL_SAVED_MODEL_TEMPLATE.replace(
+              "text-embedding-model", name) % not_a_model_path)
+      files_to_validate.append(file_path)
+    errors = []
+
+    for jobs in [1, 3]:
+      with self.assertRaises(validator.MarkdownDocumentationError) as context:
+        validator.validate_documentation_files(
+            validation_config=validator.ValidationConfig(do_smoke_test=True),
+            root_dir=self.tmp_root_dir,
+            files_to_validate=files_to_validate,
+            jobs=jobs)
+      errors.append(str(context.exception))
+
+    self.assertEqual(errors[0], errors[1])
+    for file_path in files_to_validate:
+      self.assertIn(file_path, errors[1])
+
+
+class AssetPathModificationTest(tf.test.TestCase):
+
+  def _git(self, *args):
+    subprocess.run([
+        "git", "-c", "user.name=validator", "-c", "user.email=validator@test",
+        *args
+    ],
+                   check=True,
+                   capture_output=True)
+
+  def setUp(self):
+    super().setUp()
+    self.repo_dir = os.path.realpath(self.create_tempdir().full_path)
+    current_dir = os.getcwd()
+    os.chdir(self.repo_dir)
+    self.addCleanup(os.chdir, current_dir)
+    validator._asset_path_modified_by_file.clear()
+    self.addCleanup(validator._asset_path_modified_by_file.clear)
+    validator._modified_asset_paths_by_dir.clear()
+    self.addCleanup(validator._modified_asset_paths_by_dir.clear)
+
+    self.unchanged_path = os.path.join(self.repo_dir, "unchanged.md")
+    self.changed_path = os.path.join(self.repo_dir, "changed.md")
+    self.description_changed_path = os.path.join(self.repo_dir,
+                                                 "description.md")
+    for path in [
+        self.unchanged_path, self.changed_path, self.description_changed_path
+    ]:
+      with open(path, "w") as f:
+        f.write("# Module google/model/1\nOld.\n<!-- asset-path: old -->\n")
+    self._git("init", "-q")
+    self._git("add", ".")
+    self._git("commit", "-q", "-m", "Initial commit.")
+    self._git("tag", "base")
+    with open(self.changed_path, "w") as f:
+      f.write("# Module google/model/1\nOld.\n<!-- asset-path: new -->\n")
+    with open(self.description_changed_path, "w") as f:
+      f.write("# Module google/model/1\nNew.\n<!-- asset-path: old -->\n")
+
+  def test_prefetch_detects_modified_asset_paths_with_one_diff(self):
+    with mock.patch.object(
+        validator, "_run_git", wraps=validator._run_git) as mock_run_git:
+      validator.prefetch_asset_path_modifications([
+          self.unchanged_path, self.changed_path, self.description_changed_path
+      ], "base")
+      self.assertLen(mock_run_git.call_args_list, 2)  # rev-parse and diff.
+
+      self.assertTrue(validator._is_asset_path_modified(self.changed_path,
+                                                        "base"))
+      self.assertFalse(
+          validator._is_asset_path_modified(self.unchanged_path, "base"))
+      self.assertFalse(
+          validator._is_asset_path_modified(self.description_changed_path,
+                                            "base"))
+      self.assertLen(mock_run_git.call_args_list, 2)
+
+  def test_prefetch_in_dir_detects_modified_asset_paths_with_one_diff(self):
+    with mock.patch.object(
+        validator, "_run_git", wraps=validator._run_git) as mock_run_git:
+      validator.prefetch_asset_path_modifications_in_dir(self.repo_dir, "base")
+      self.assertLen(mock_run_git.call_args_list, 2)  # rev-parse and diff.
+
+      self.assertTrue(validator._is_asset_path_modified(self.changed_path,
+                                                        "base"))
+      self.assertFalse(
+          validator._is_asset_path_modified(self.unchanged_path, "base"))
+      self.assertFalse(
+          validator._is_asset_path_modified(self.description_changed_path,
+                                            "base"))
+      self.assertLen(mock_run_git.call_args_list, 2)
+    self.assertEmpty(validator._asset_path_modified_by_file)
+
+  def test_is_asset_path_modified_without_prefetch(self):
+    self.assertTrue(validator._is_asset_path_modified(self.changed_path,
+                                                      "base"))
+    self.assertFalse(validator._is_asset_path_modified(self.unchanged_path,
+                                                       "base"))
+
+  def test_unknown_base_ref_is_treated_as_unmodified(self):
+    self.assertFalse(
+        validator._is_asset_path_modified(self.changed_path, "unknown_ref"))
 
 
 if __name__ == "__main__":
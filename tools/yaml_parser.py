@@ -21,6 +21,7 @@ from typing import AbstractSet, Any, Mapping, Sequence, Type, TypeVar
 import urllib
 
 import attr
+import filesystem_utils
 import yaml
 
 # Maps a tag name to the YAML file that contains the config for valid values.
@@ -153,9 +154,9 @@ class EnumerableYamlParser(AbstractYamlParser):
         - if the YAML file does not contain a `values` field.
         - if the YAML file contains an item that does not have an `id` field.
     """
-    with open(os.path.join(self._root_dir,
-                           self._relative_tag_file)) as yaml_file:
-      yaml_config = yaml.safe_load(yaml_file.read())
+    yaml_config = yaml.safe_load(
+        filesystem_utils.get_content(
+            os.path.join(self._root_dir, self._relative_tag_file)))
     tag_validator = EnumerableTagValuesValidator.from_yaml(yaml_config)
     self._supported_values = {item.id for item in tag_validator.values}
 
@@ -252,9 +253,9 @@ class UrlYamlParser(AbstractYamlParser):
         - if the YAML content does not contain a `format` field.
         - if the 'format' field is not one of the supported formats.
     """
-    with open(os.path.join(self._root_dir,
-                           self._relative_tag_file)) as yaml_file:
-      yaml_config = yaml.safe_load(yaml_file.read())
+    yaml_config = yaml.safe_load(
+        filesystem_utils.get_content(
+            os.path.join(self._root_dir, self._relative_tag_file)))
     self._url_tag_config = UrlTagConfig.from_yaml(yaml_config)
 
   def _assert_tag_value_is_url(self, tag_value: str) -> None: